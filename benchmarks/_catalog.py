@@ -0,0 +1,83 @@
+"""Shared helpers for the benchmarks: download, load and locally serve the full catalog."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from valorant.http import HTTPClient, Route
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+LIST_ENDPOINTS: tuple[str, ...] = tuple(HTTPClient.LIST_ENDPOINTS)
+
+DEFAULT_CATALOG_PATH = Path(__file__).parent / '.catalog'
+
+
+def _filename(endpoint: str, language: str) -> str:
+    return f'{endpoint.strip("/").replace("/", "_")}.{language}.json'
+
+
+async def download_catalog(directory: Path, languages: list[str]) -> None:
+    """Download every list endpoint once per language from the live API."""
+    directory.mkdir(parents=True, exist_ok=True)
+    http = HTTPClient(enable_cache=False)
+    await http.start()
+    assert http._session is not None
+    try:
+        for language in languages:
+            for endpoint in LIST_ENDPOINTS:
+                url = Route.BASE + endpoint
+                async with http._session.get(url, params={'language': language}) as response:
+                    response.raise_for_status()
+                    (directory / _filename(endpoint, language)).write_bytes(await response.read())
+    finally:
+        await http.close()
+
+
+def load_catalog(directory: Path = DEFAULT_CATALOG_PATH) -> dict[tuple[str, str], bytes]:
+    """Load a downloaded catalog as ``{(endpoint, language): raw body}``."""
+    catalog: dict[tuple[str, str], bytes] = {}
+    for endpoint in LIST_ENDPOINTS:
+        for path in sorted(directory.glob(_filename(endpoint, '*'))):
+            language = path.name.removesuffix('.json').rsplit('.', 1)[1]
+            catalog[endpoint, language] = path.read_bytes()
+    if not catalog:
+        raise SystemExit(f'no catalog found in {directory}, run with --download first')
+    return catalog
+
+
+@contextlib.asynccontextmanager
+async def serve_catalog(catalog: dict[tuple[str, str], bytes]) -> AsyncGenerator[str]:
+    """Serve the catalog from a local server and point :class:`Route` at it."""
+
+    async def handle(request: web.Request) -> web.Response:
+        endpoint = request.path.removeprefix('/v1')
+        body = catalog.get((endpoint, request.query.get('language', 'en-US')))
+        if body is None:
+            return web.json_response({'status': 404, 'error': 'not found'}, status=404)
+        return web.Response(body=body, content_type='application/json')
+
+    app = web.Application()
+    app.router.add_get('/v1/{tail:.*}', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+
+    server = site._server
+    assert isinstance(server, asyncio.Server)
+    host, port = server.sockets[0].getsockname()[:2]
+
+    original = Route.BASE
+    Route.BASE = f'http://{host}:{port}/v1'
+    try:
+        yield Route.BASE
+    finally:
+        Route.BASE = original
+        await runner.cleanup()
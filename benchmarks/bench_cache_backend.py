@@ -0,0 +1,103 @@
+"""
+Compare the size and hit latency of the cache backends: SQLite, one file per entry and memory.
+
+Every payload of the catalog is requested once to fill the cache, then ``--rounds`` more times as cache
+hits. The hits go through :meth:`HTTPClient.request` as usual, so the latency includes the cache key,
+the backend read, decompression and JSON decoding. The memory backend reports the size of the stored
+bodies, the others their size on disk.
+
+Usage:
+    python -m benchmarks.bench_cache_backend --download --languages en-US ja-JP
+    python -m benchmarks.bench_cache_backend
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from valorant.http import HTTPClient, Route
+
+from ._catalog import DEFAULT_CATALOG_PATH, download_catalog, load_catalog, serve_catalog
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+async def _measure(
+    keys: list[tuple[str, str]], fetch: Callable[[str, str], Awaitable[Any]], rounds: int
+) -> list[float]:
+    # The first pass fills the cache, every following pass is a hit.
+    for endpoint, language in keys:
+        await fetch(endpoint, language)
+
+    timings: list[float] = []
+    for _ in range(rounds):
+        for endpoint, language in keys:
+            start = time.perf_counter()
+            await fetch(endpoint, language)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def bench_valorant(
+    keys: list[tuple[str, str]],
+    directory: Path,
+    rounds: int,
+    backend: Literal['sqlite', 'filesystem', 'memory'],
+) -> tuple[int, list[float]]:
+    http = HTTPClient(cache_path=directory, cache_backend=backend)
+    await http.start()
+
+    async def fetch(endpoint: str, language: str) -> Any:
+        return await http.request(Route('GET', endpoint), params={'language': language})
+
+    try:
+        timings = await _measure(keys, fetch, rounds)
+        assert http._cache is not None
+        size = http._cache.total_size()
+    finally:
+        await http.close()
+
+    if backend != 'memory':
+        size = sum(path.stat().st_size for path in directory.rglob('*') if path.is_file())
+    return size, timings
+
+
+def _report(name: str, result: tuple[int, list[float]]) -> None:
+    size, timings = result
+    timings.sort()
+    p50 = statistics.median(timings) * 1e3
+    p99 = timings[int(len(timings) * 0.99) - 1] * 1e3
+    print(f'{name:<24} size={size / 1024 / 1024:8.2f} MiB  hit p50={p50:8.3f} ms  p99={p99:8.3f} ms')
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG_PATH)
+    parser.add_argument('--download', action='store_true', help='download the catalog from the live API first')
+    parser.add_argument('--languages', nargs='+', default=['en-US'])
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.download:
+        await download_catalog(args.catalog, args.languages)
+
+    catalog = load_catalog(args.catalog)
+    keys = list(catalog)
+    raw_size = sum(len(body) for body in catalog.values())
+    print(f'catalog: {len(keys)} payloads, {raw_size / 1024 / 1024:.2f} MiB raw')
+
+    async with serve_catalog(catalog):
+        for backend in ('sqlite', 'filesystem', 'memory'):
+            with tempfile.TemporaryDirectory() as tmp:
+                _report(backend, await bench_valorant(keys, Path(tmp), args.rounds, backend))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
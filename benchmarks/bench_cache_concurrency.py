@@ -0,0 +1,104 @@
+"""
+Run N processes reading and writing one shared cache database at the same time.
+
+Each worker performs a mix of cache reads and writes against the same file and reports its
+throughput, tail latency and how many operations failed with ``database is locked``. The default
+(high-concurrency) pragmas are compared with SQLite's own defaults.
+
+Usage:
+    python -m benchmarks.bench_cache_concurrency --processes 16 --operations 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from valorant.cache import DEFAULT_PRAGMAS, SQLiteCache
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+PROFILES: dict[str, Mapping[str, int | str]] = {
+    'default': DEFAULT_PRAGMAS,
+    'sqlite-defaults': {
+        'busy_timeout': 5000,
+        'journal_mode': 'delete',
+        'synchronous': 'full',
+        'mmap_size': 0,
+        'cache_size': -2000,
+    },
+}
+
+
+def _worker(
+    path: str, pragmas: Mapping[str, int | str], operations: int, write_ratio: float, keys: int, body_size: int
+) -> tuple[list[float], int]:
+    cache = SQLiteCache(path, pragmas=pragmas)
+    rng = random.Random(os.getpid())
+    body = os.urandom(body_size // 2).hex().encode()
+    timings: list[float] = []
+    errors = 0
+
+    try:
+        for _ in range(operations):
+            key = f'/weapons/skins/{rng.randrange(keys)}'
+            start = time.perf_counter()
+            try:
+                if rng.random() < write_ratio:
+                    cache.set(key, body, route='/weapons/skins/{uuid}', expire_after=3600)
+                else:
+                    cache.get(key)
+            except sqlite3.OperationalError:
+                errors += 1
+            timings.append(time.perf_counter() - start)
+    finally:
+        cache.close()
+    return timings, errors
+
+
+def run(profile: str, args: argparse.Namespace) -> None:
+    pragmas = PROFILES[profile]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / 'valorant-cache.db')
+        # Create the schema (and switch the journal mode) before the workers race for it.
+        SQLiteCache(path, pragmas=pragmas).close()
+
+        worker_args = [(path, pragmas, args.operations, args.write_ratio, args.keys, args.body_size)] * args.processes
+        start = time.perf_counter()
+        with multiprocessing.get_context('spawn').Pool(args.processes) as pool:
+            results = pool.starmap(_worker, worker_args)
+        elapsed = time.perf_counter() - start
+
+    timings = sorted(t for worker_timings, _ in results for t in worker_timings)
+    errors = sum(worker_errors for _, worker_errors in results)
+    p50 = statistics.median(timings) * 1e3
+    p99 = timings[int(len(timings) * 0.99) - 1] * 1e3
+    print(f'{profile:<16} {len(timings) / elapsed:10.0f} ops/s  p50={p50:7.3f} ms  p99={p99:8.3f} ms  locked={errors}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--operations', type=int, default=2000, help='operations per process')
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--keys', type=int, default=500)
+    parser.add_argument('--body-size', type=int, default=32 * 1024, help='bytes per cached body')
+    parser.add_argument('--profile', choices=sorted(PROFILES), nargs='+', default=sorted(PROFILES))
+    args = parser.parse_args()
+
+    print(f'{args.processes} processes x {args.operations} operations, {args.write_ratio:.0%} writes')
+    for profile in args.profile:
+        run(profile, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Compare :func:`valorant.models.columns.to_columns` and ``to_dataframe`` with the usual ways of tabulating models.
+
+The models of every list endpoint are validated once, then turned into columns with:
+
+- ``to_columns``: one pass over the models, typed NumPy arrays and categorical uuids and enums.
+- ``to_dataframe``: the same, wrapped in a :class:`pandas.DataFrame`.
+- ``model_dump``: ``pandas.json_normalize`` over ``model_dump()``, flattening nested models the same way.
+- ``loop``: a getattr per field and model, building a list per column.
+
+The best time of ``--repeat`` runs is reported per endpoint. Scenarios needing pandas are skipped without it.
+
+Usage:
+    python -m benchmarks.bench_columns --download
+    python -m benchmarks.bench_columns --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, get_args
+
+from pydantic import ValidationError
+
+from valorant import utils
+from valorant.models.columns import to_columns, to_dataframe
+
+from ._catalog import DEFAULT_CATALOG_PATH, download_catalog, load_catalog
+from .bench_interning import MODELS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+pd = utils._lazy_import('pandas')
+
+
+def _loop(models: list[Any]) -> dict[str, list[Any]]:
+    names = list(type(models[0]).model_fields) if models else []
+    return {name: [getattr(model, name) for model in models] for name in names}
+
+
+def _model_dump(models: list[Any]) -> Any:
+    return pd.json_normalize([model.model_dump() for model in models])
+
+
+SCENARIOS: dict[str, Callable[[list[Any]], Any]] = {
+    'to_columns': to_columns,
+    'to_dataframe': to_dataframe,
+    'model_dump': _model_dump,
+    'loop': _loop,
+}
+PANDAS_SCENARIOS = ('to_dataframe', 'model_dump')
+
+
+def best(func: Callable[[list[Any]], Any], models: list[Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(models)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG_PATH)
+    parser.add_argument('--download', action='store_true', help='download the catalog from the live API first')
+    parser.add_argument('--languages', nargs='+', default=['en-US'])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.download:
+        await download_catalog(args.catalog, args.languages)
+
+    scenarios = [name for name in SCENARIOS if pd is not None or name not in PANDAS_SCENARIOS]
+    print(f'{"endpoint":<32}{"models":>8}' + ''.join(f'{name:>15} ms' for name in scenarios))
+    totals = dict.fromkeys(scenarios, 0.0)
+    for (endpoint, language), body in sorted(load_catalog(args.catalog).items()):
+        response = MODELS[endpoint]
+        if not get_args(response.model_fields['data'].annotation):
+            continue
+        try:
+            models = response.model_validate(utils._from_json(body)).data
+        except ValidationError:
+            print(f'skipped {endpoint} {language}, the models reject it')
+            continue
+        timings = {name: best(SCENARIOS[name], models, args.repeat) for name in scenarios}
+        print(
+            f'{endpoint + " " + language:<32}{len(models):>8}'
+            + ''.join(f'{timings[name] * 1e3:18.2f}' for name in scenarios)
+        )
+        for name, elapsed in timings.items():
+            totals[name] += elapsed
+
+    print(f'{"total":<40}' + ''.join(f'{totals[name] * 1e3:18.2f}' for name in scenarios))
+    if pd is not None and totals['to_dataframe']:
+        print(f'to_dataframe is {totals["model_dump"] / totals["to_dataframe"]:.1f}x faster than model_dump')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
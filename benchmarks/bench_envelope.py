@@ -0,0 +1,78 @@
+"""
+Measure the cost of the ``{'status': ..., 'data': ...}`` envelope when validating small single-uuid responses.
+
+Compares validating the whole payload with ``Response[Model]``, looked up on every call like the
+``fetch_*`` methods used to, with the shared adapter of ``Model`` going through ``data`` only, and
+with ``Model.model_validate`` as the floor.
+
+Usage:
+    python -m benchmarks.bench_envelope --number 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from valorant.models.base import Response, type_adapter
+from valorant.models.currencies import Currency
+from valorant.models.player_titles import PlayerTitle
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PAYLOADS: dict[type[Any], dict[str, Any]] = {
+    PlayerTitle: {
+        'status': 200,
+        'data': {
+            'uuid': 'd13e579c-435e-44d4-cec2-6eae5a3c5ed4',
+            'displayName': 'Imminent Title',
+            'titleText': 'Imminent',
+            'isHiddenIfNotOwned': False,
+            'assetPath': 'ShooterGame/Content/Personalization/Titles/Title_Imminent_PrimaryAsset',
+        },
+    },
+    Currency: {
+        'status': 200,
+        'data': {
+            'uuid': '85ad13f7-3d1b-5128-9eb2-7cd8ee0b5741',
+            'displayName': 'VALORANT Points',
+            'displayNameSingular': 'VALORANT Point',
+            'displayIcon': 'https://media.valorant-api.com/currencies/85ad13f7/displayicon.png',
+            'largeIcon': 'https://media.valorant-api.com/currencies/85ad13f7/largeicon.png',
+            'rewardPreviewIcon': 'https://media.valorant-api.com/currencies/85ad13f7/rewardpreviewicon.png',
+            'assetPath': 'ShooterGame/Content/Currencies/Currency_AresPoints_DataAsset',
+        },
+    },
+}
+
+
+def _paths(model: type[Any]) -> dict[str, Callable[[dict[str, Any]], Any]]:
+    def enveloped(payload: dict[str, Any]) -> Any:
+        # The parametrized model is looked up on every call.
+        return Response[model].model_validate(payload)  # type: ignore[valid-type]
+
+    return {
+        'Response[Model]': enveloped,
+        'type_adapter(Model)': lambda payload: type_adapter(model).validate_python(payload['data']),
+        'Model.model_validate': lambda payload: model.model_validate(payload['data']),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for model, payload in PAYLOADS.items():
+        print(model.__name__)
+        for name, validate in _paths(model).items():
+            best = min(timeit.repeat(partial(validate, payload), number=args.number, repeat=args.repeat))
+            print(f'  {name:<22} {best / args.number * 1e6:8.2f} us/response')
+
+
+if __name__ == '__main__':
+    main()
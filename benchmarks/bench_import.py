@@ -0,0 +1,80 @@
+"""
+Measure the import time of the package and of the first use of a model.
+
+Every scenario runs in a fresh interpreter ``--runs`` times and the median wall time is reported,
+along with the third-party packages it left imported. ``-X importtime`` breaks down the slowest
+imports of ``import valorant`` with ``--top``.
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --runs 20 --top 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS: dict[str, str] = {
+    'import valorant': 'import valorant',
+    'Client()': 'import valorant; valorant.Client(enable_cache=False)',
+    'Client() with cache': 'import valorant; valorant.Client()',
+    'first validation': (
+        'import valorant; from valorant.models.player_titles import PlayerTitle; '
+        "PlayerTitle.model_validate({'uuid': '0' * 32, 'displayName': None, 'titleText': None, "
+        "'isHiddenIfNotOwned': False, 'assetPath': ''})"
+    ),
+    'build_validators()': 'import valorant; valorant.Client(enable_cache=False).build_validators()',
+}
+
+PACKAGES = ('aiohttp', 'pydantic', 'pydantic_extra_types', 'msgspec', 'sqlite3')
+
+# Prints the seconds spent in the scenario and the watched packages it imported.
+_TEMPLATE = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed, *sorted(name for name in {packages!r} if name in sys.modules))
+"""
+
+
+def run(code: str) -> tuple[float, list[str]]:
+    script = _TEMPLATE.format(code=code, packages=PACKAGES)
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    elapsed, *imported = output.split()
+    return float(elapsed), imported
+
+
+def importtime(top: int) -> list[tuple[int, str]]:
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import valorant'], capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    # import time: self [us] | cumulative | imported package
+    for line in stderr.splitlines()[1:]:
+        self_us, _, name = line.split('|')
+        rows.append((int(self_us.split(':')[1]), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    for name, code in SCENARIOS.items():
+        results = [run(code) for _ in range(args.runs)]
+        median = statistics.median(elapsed for elapsed, _ in results)
+        print(f'{name:<22} {median * 1e3:8.1f} ms  imports: {", ".join(results[0][1]) or "-"}')
+
+    print('\nslowest imports of `import valorant` (self time):')
+    for self_us, module in importtime(args.top):
+        print(f'  {self_us / 1e3:8.1f} ms  {module}')
+
+
+if __name__ == '__main__':
+    main()
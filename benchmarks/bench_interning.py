@@ -0,0 +1,168 @@
+"""
+Measure the memory saved by interning decoded strings and by compact URL storage.
+
+Decodes every list endpoint of a downloaded catalog and keeps the result, once as decoded JSON
+(what the in-memory cache layers hold) and once as models, with and without
+``intern_strings`` and ``compact_urls``.
+
+Usage:
+    python -m benchmarks.bench_interning --download --languages en-US ja-JP
+    python -m benchmarks.bench_interning
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from valorant import utils
+from valorant.models.agents import Agent
+from valorant.models.base import Response, schema_validator
+from valorant.models.buddies import Buddy, Level as BuddyLevel
+from valorant.models.bundles import Bundle
+from valorant.models.ceremonies import Ceremony
+from valorant.models.competitive_tiers import CompetitiveTier
+from valorant.models.content_tiers import ContentTier
+from valorant.models.contracts import Contract
+from valorant.models.currencies import Currency
+from valorant.models.events import Event
+from valorant.models.flex import Flex
+from valorant.models.game_modes import Equippable, GameMode
+from valorant.models.gear import Gear
+from valorant.models.level_borders import LevelBorder
+from valorant.models.maps import Map
+from valorant.models.missions import Mission
+from valorant.models.player_cards import PlayerCard
+from valorant.models.player_titles import PlayerTitle
+from valorant.models.seasons import Competitive, Season
+from valorant.models.sprays import Level as SprayLevel, Spray
+from valorant.models.themes import Theme
+from valorant.models.weapons import Chroma, Level as SkinLevel, Skin, Weapon
+
+from ._catalog import DEFAULT_CATALOG_PATH, download_catalog, load_catalog
+
+MODELS: dict[str, type[Response[Any]]] = {
+    '/agents': Response[list[Agent]],
+    '/buddies': Response[list[Buddy]],
+    '/buddies/levels': Response[list[BuddyLevel]],
+    '/bundles': Response[list[Bundle]],
+    '/ceremonies': Response[list[Ceremony]],
+    '/competitivetiers': Response[list[CompetitiveTier]],
+    '/contenttiers': Response[list[ContentTier]],
+    '/contracts': Response[list[Contract]],
+    '/currencies': Response[list[Currency]],
+    '/events': Response[list[Event]],
+    '/flex': Response[list[Flex]],
+    '/gamemodes': Response[list[GameMode]],
+    '/gamemodes/equippables': Response[list[Equippable]],
+    '/gear': Response[list[Gear]],
+    '/levelborders': Response[list[LevelBorder]],
+    '/maps': Response[list[Map]],
+    '/missions': Response[list[Mission]],
+    '/playercards': Response[list[PlayerCard]],
+    '/playertitles': Response[list[PlayerTitle]],
+    '/seasons': Response[list[Season]],
+    '/seasons/competitive': Response[list[Competitive]],
+    '/sprays': Response[list[Spray]],
+    '/sprays/levels': Response[list[SprayLevel]],
+    '/themes': Response[list[Theme]],
+    '/weapons': Response[list[Weapon]],
+    '/weapons/skins': Response[list[Skin]],
+    '/weapons/skinchromas': Response[list[Chroma]],
+    '/weapons/skinlevels': Response[list[SkinLevel]],
+}
+
+
+def _decode(body: bytes, *, intern: bool) -> Any:
+    data = utils._from_json(body)
+    return utils._intern_strings(data) if intern else data
+
+
+def bench_decoded(catalog: dict[tuple[str, str], bytes], *, intern: bool) -> tuple[int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = [_decode(body, intern=intern) for body in catalog.values()]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return retained, elapsed
+
+
+def _validate(endpoint: str, data: Any, *, compact: bool) -> Response[Any] | None:
+    model = MODELS[endpoint]
+    try:
+        return schema_validator(model, compact=True).validate_python(data) if compact else model.model_validate(data)
+    except ValidationError:
+        return None
+
+
+def bench_models(
+    catalog: dict[tuple[str, str], bytes],
+    *,
+    intern: bool,
+    compact: bool,
+) -> tuple[int, float, list[str]]:
+    skipped: list[str] = []
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = []
+    for (endpoint, _), body in catalog.items():
+        models = _validate(endpoint, _decode(body, intern=intern), compact=compact)
+        if models is None:
+            skipped.append(endpoint)
+        kept.append(models)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return retained, elapsed, skipped
+
+
+def _report(name: str, retained: int, elapsed: float, baseline: int) -> None:
+    saved = 1 - retained / baseline if baseline else 0
+    print(f'{name:<22} heap={retained / 1024 / 1024:8.2f} MiB  saved={saved:6.1%}  time={elapsed * 1e3:8.1f} ms')
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG_PATH)
+    parser.add_argument('--download', action='store_true', help='download the catalog from the live API first')
+    parser.add_argument('--languages', nargs='+', default=['en-US'])
+    args = parser.parse_args()
+
+    if args.download:
+        await download_catalog(args.catalog, args.languages)
+
+    catalog = load_catalog(args.catalog)
+
+    baseline, elapsed = bench_decoded(catalog, intern=False)
+    _report('decoded', baseline, elapsed, baseline)
+    _report('decoded, interned', *bench_decoded(catalog, intern=True), baseline)
+
+    baseline, elapsed, skipped = bench_models(catalog, intern=False, compact=False)
+    if skipped:
+        print(f'{len(skipped)} of {len(catalog)} payloads do not validate and are left out of the model rows')
+    _report('models', baseline, elapsed, baseline)
+    for name, intern, compact in (
+        ('models, interned', True, False),
+        ('models, compact', False, True),
+        ('models, both', True, True),
+    ):
+        retained, elapsed, _ = bench_models(catalog, intern=intern, compact=compact)
+        _report(name, retained, elapsed, baseline)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""
+Measure the memory held by the localized texts of a ``language='all'`` catalog.
+
+Compares :class:`~valorant.models.localization.LocalizedField` with the pydantic model it replaced,
+which stored 18 locale fields plus 18 alias fields per text, and with a projection keeping the
+``--locales`` only. The heap includes the kept texts, the decoded payload is freed afterwards.
+
+Usage:
+    python -m benchmarks.bench_localized_field --download
+    python -m benchmarks.bench_localized_field --locales ja-JP ko-KR th-TH
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import Field, create_model
+
+from valorant import utils
+from valorant.enums import Language
+from valorant.models.base import BaseModel
+from valorant.models.localization import LocalizedField
+
+from ._catalog import DEFAULT_CATALOG_PATH, download_catalog, load_catalog
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LOCALES = frozenset(language.value for language in Language)
+
+_fields: dict[str, Any] = {
+    language.value.replace('-', '_'): (str, Field(alias=language.value)) for language in Language
+}
+_fields.update({language.name: (str, Field(alias=language.value)) for language in Language})
+PydanticLocalizedField = create_model('PydanticLocalizedField', __base__=BaseModel, **_fields)
+
+
+def _localized(data: Any, found: list[dict[str, str]]) -> list[dict[str, str]]:
+    if isinstance(data, dict):
+        if data.keys() == LOCALES:
+            found.append(data)
+        else:
+            for value in data.values():
+                _localized(value, found)
+    elif isinstance(data, list):
+        for value in data:
+            _localized(value, found)
+    return found
+
+
+def bench(bodies: list[bytes], build: Callable[[dict[str, str]], object]) -> tuple[int, int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    fields: list[object] = []
+    for body in bodies:
+        fields.extend(build(text) for text in _localized(utils._from_json(body)['data'], []))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(fields), retained, elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG_PATH)
+    parser.add_argument('--download', action='store_true', help='download the catalog from the live API first')
+    parser.add_argument('--locales', nargs='+', default=['ja-JP', 'ko-KR', 'th-TH'])
+    args = parser.parse_args()
+
+    if args.download:
+        await download_catalog(args.catalog, ['all'])
+
+    bodies = [body for (_, language), body in load_catalog(args.catalog).items() if language == 'all']
+    if not bodies:
+        raise SystemExit(f'no language=all catalog found in {args.catalog}, run with --download first')
+
+    locales = frozenset({'en-US', *args.locales})
+    for name, build in (
+        ('pydantic', PydanticLocalizedField.model_validate),
+        ('tuple', LocalizedField.from_mapping),
+        ('projected', lambda text: LocalizedField.from_mapping(text, locales=locales)),
+    ):
+        count, retained, elapsed = bench(bodies, build)
+        print(
+            f'{name:<10} texts={count}  heap={retained / 1024 / 1024:8.2f} MiB  '
+            f'per text={retained / count:7.1f} B  decode+build={elapsed * 1e3:8.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
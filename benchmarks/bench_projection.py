@@ -0,0 +1,99 @@
+"""
+Compare building the full models of every list endpoint with projecting them on ``--fields``.
+
+Each payload is decoded once and turned into models the way ``fetch_*(fields=...)`` does, validated
+or built with ``construct_trusted``, with and without the projection. The best time of ``--repeat``
+runs is reported per endpoint, the heap retained by the models of the last run in the totals.
+Endpoints whose models lack one of the fields are skipped.
+
+Usage:
+    python -m benchmarks.bench_projection --download
+    python -m benchmarks.bench_projection --fields uuid display_name display_icon --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, get_args
+
+from valorant import utils
+from valorant.models.base import construct_trusted, projection, type_adapter
+
+from ._catalog import DEFAULT_CATALOG_PATH, download_catalog, load_catalog
+from .bench_interning import MODELS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SCENARIOS = ('full', 'projected', 'full trusted', 'projected trusted')
+
+
+def _builders(tp: Any, fields: list[str]) -> dict[str, Callable[[Any], Any]]:
+    # tp is e.g. list[Chroma].
+    projected = projection(get_args(tp)[0], fields)
+    return {
+        'full': type_adapter(tp).validate_python,
+        'projected': projected.validate_python,
+        'full trusted': lambda data: construct_trusted(tp, data),
+        'projected trusted': projected.construct_trusted,
+    }
+
+
+def bench(build: Callable[[Any], Any], data: Any, repeat: int) -> tuple[float, int]:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(data)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    models = build(data)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return best, retained
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG_PATH)
+    parser.add_argument('--download', action='store_true', help='download the catalog from the live API first')
+    parser.add_argument('--languages', nargs='+', default=['en-US'])
+    parser.add_argument('--fields', nargs='+', default=['uuid', 'display_name', 'display_icon'])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.download:
+        await download_catalog(args.catalog, args.languages)
+
+    catalog = load_catalog(args.catalog)
+
+    print(f'{"endpoint":<32}' + ''.join(f'{name:>18} ms' for name in SCENARIOS))
+    totals = dict.fromkeys(SCENARIOS, 0.0)
+    heap = dict.fromkeys(SCENARIOS, 0)
+    for (endpoint, language), body in sorted(catalog.items()):
+        tp = MODELS[endpoint].model_fields['data'].annotation
+        if not set(args.fields) <= get_args(tp)[0].model_fields.keys():
+            continue
+        data = utils._from_json(body)['data']
+        timings = {name: bench(build, data, args.repeat) for name, build in _builders(tp, args.fields).items()}
+        print(f'{endpoint + " " + language:<32}' + ''.join(f'{timings[name][0] * 1e3:21.2f}' for name in SCENARIOS))
+        for name, (elapsed, retained) in timings.items():
+            totals[name] += elapsed
+            heap[name] += retained
+
+    print(f'{"total":<32}' + ''.join(f'{totals[name] * 1e3:21.2f}' for name in SCENARIOS))
+    print(f'{"retained MiB":<32}' + ''.join(f'{heap[name] / 2**20:21.2f}' for name in SCENARIOS))
+    if totals['projected']:
+        print(f'projected is {totals["full"] / totals["projected"]:.1f}x faster than full')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""
+Compare :mod:`valorant.models.serialization` with pickle for handing models over to other processes.
+
+Every list endpoint of a downloaded catalog is validated once, then serialized and deserialized both ways.
+The best time of ``--repeat`` runs, the payload size and the models per second are reported per endpoint.
+``--queue`` also times the whole catalog going through a :class:`multiprocessing.Queue` to a worker that
+rebuilds the models, as a parse-once-and-fan-out setup would.
+
+Usage:
+    python -m benchmarks.bench_serialization --download --languages all
+    python -m benchmarks.bench_serialization --repeat 10 --queue
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import pickle
+import time
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from valorant import utils
+from valorant.models.serialization import dumps, loads
+
+from ._catalog import DEFAULT_CATALOG_PATH, download_catalog, load_catalog
+from .bench_interning import MODELS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.queues import Queue
+
+CODECS: dict[str, tuple[Callable[[Any], bytes], Callable[[Any, bytes], Any]]] = {
+    'pickle': (
+        lambda models: pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL),
+        lambda _, data: pickle.loads(data),
+    ),
+    'valorant': (dumps, loads),
+}
+
+
+def best(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _worker(codec: str, tps: list[Any], payloads: Queue[bytes | None], done: Queue[int]) -> None:
+    load = CODECS[codec][1]
+    count = 0
+    for tp in tps:
+        data = payloads.get()
+        assert data is not None
+        count += len(load(tp, data))
+    done.put(count)
+
+
+def bench_queue(codec: str, catalog: list[tuple[Any, Any]]) -> float:
+    dump = CODECS[codec][0]
+    payloads: Queue[bytes | None] = multiprocessing.Queue()
+    done: Queue[int] = multiprocessing.Queue()
+    worker = multiprocessing.Process(target=_worker, args=(codec, [tp for tp, _ in catalog], payloads, done))
+    worker.start()
+    start = time.perf_counter()
+    for _, models in catalog:
+        payloads.put(dump(models))
+    done.get()
+    elapsed = time.perf_counter() - start
+    worker.join()
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG_PATH)
+    parser.add_argument('--download', action='store_true', help='download the catalog from the live API first')
+    parser.add_argument('--languages', nargs='+', default=['en-US'])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--queue', action='store_true', help='also time the handoff through a multiprocessing queue')
+    args = parser.parse_args()
+
+    if args.download:
+        await download_catalog(args.catalog, args.languages)
+
+    validated: list[tuple[str, Any, Any]] = []
+    for (endpoint, language), body in sorted(load_catalog(args.catalog).items()):
+        response = MODELS[endpoint]
+        try:
+            models = response.model_validate(utils._from_json(body)).data
+        except ValidationError:
+            print(f'skipped {endpoint} {language}, the models reject it')
+            continue
+        validated.append((endpoint + ' ' + language, response.model_fields['data'].annotation, models))
+
+    print(f'{"endpoint":<32}{"codec":>10}{"dumps ms":>12}{"loads ms":>12}{"KiB":>10}{"models/s":>12}')
+    totals = {codec: [0.0, 0.0, 0] for codec in CODECS}
+    for name, tp, models in validated:
+        for codec, (dump, load) in CODECS.items():
+            data = dump(models)
+            dumped = best(partial(dump, models), args.repeat)
+            loaded = best(partial(load, tp, data), args.repeat)
+            rate = len(models) / (dumped + loaded)
+            print(f'{name:<32}{codec:>10}{dumped * 1e3:12.2f}{loaded * 1e3:12.2f}{len(data) / 1024:10.0f}{rate:12.0f}')
+            totals[codec][0] += dumped
+            totals[codec][1] += loaded
+            totals[codec][2] += len(data)
+
+    for codec, (dumped, loaded, size) in totals.items():
+        print(f'{"total":<32}{codec:>10}{dumped * 1e3:12.2f}{loaded * 1e3:12.2f}{size / 1024:10.0f}')
+    if totals['valorant'][1]:
+        print(f'loads is {totals["pickle"][1] / totals["valorant"][1]:.1f}x faster than pickle.loads')
+
+    if args.queue:
+        catalog = [(tp, models) for _, tp, models in validated]
+        for codec in CODECS:
+            print(f'queue handoff with {codec}: {bench_queue(codec, catalog) * 1e3:.1f} ms')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+"""
+Compare the compressed and the indexed (memory-mapped) snapshot layouts.
+
+Reports the file size, the heap retained after looking up every entity once and the
+single entity lookup latency.
+
+Usage:
+    python -m benchmarks.bench_snapshot --download --languages en-US ja-JP
+    python -m benchmarks.bench_snapshot
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from valorant import utils
+from valorant.http import Route
+from valorant.snapshot import Snapshot
+
+from ._catalog import DEFAULT_CATALOG_PATH, download_catalog, load_catalog
+
+
+def _lookups(catalog: dict[tuple[str, str], bytes]) -> list[tuple[Route, str]]:
+    lookups = [
+        (Route('GET', endpoint + '/{uuid}', uuid=item['uuid']), language)
+        for (endpoint, language), body in catalog.items()
+        for item in utils._from_json(body)['data']
+    ]
+    random.shuffle(lookups)
+    return lookups
+
+
+def bench(catalog: dict[tuple[str, str], bytes], path: Path, *, indexed: bool) -> tuple[int, int, list[float]]:
+    Snapshot.write(path, catalog, manifest='bench', indexed=indexed)
+    lookups = _lookups(catalog)
+
+    with Snapshot.load(path) as snapshot:
+        timings: list[float] = []
+        for route, language in lookups:
+            start = time.perf_counter()
+            snapshot.lookup(route, language)
+            timings.append(time.perf_counter() - start)
+
+    # measured in a separate pass, tracing allocations skews the timings
+    gc.collect()
+    tracemalloc.start()
+    with Snapshot.load(path) as snapshot:
+        for route, language in lookups:
+            snapshot.lookup(route, language)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return path.stat().st_size, retained, timings
+
+
+def _report(name: str, result: tuple[int, int, list[float]]) -> None:
+    size, retained, timings = result
+    timings.sort()
+    p50 = statistics.median(timings) * 1e6
+    p99 = timings[int(len(timings) * 0.99) - 1] * 1e6
+    print(
+        f'{name:<12} size={size / 1024 / 1024:8.2f} MiB  heap={retained / 1024 / 1024:8.2f} MiB  '
+        f'lookup p50={p50:8.1f} us  p99={p99:8.1f} us'
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG_PATH)
+    parser.add_argument('--download', action='store_true', help='download the catalog from the live API first')
+    parser.add_argument('--languages', nargs='+', default=['en-US'])
+    args = parser.parse_args()
+
+    if args.download:
+        await download_catalog(args.catalog, args.languages)
+
+    catalog = {key: body for key, body in load_catalog(args.catalog).items() if key[0] != '/seasons/competitive'}
+    with tempfile.TemporaryDirectory() as tmp:
+        _report('compressed', bench(catalog, Path(tmp) / 'compressed.snapshot', indexed=False))
+        _report('indexed', bench(catalog, Path(tmp) / 'indexed.snapshot', indexed=True))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+Compare the validation modes of the client on every list endpoint of a downloaded catalog.
+
+Each payload is decoded once and turned into models the way ``Client(validation=...)`` does:
+'strict' and 'lax' validate it, 'trusted' builds the models with ``construct_trusted``.
+The best time of ``--repeat`` runs is reported per endpoint.
+
+Usage:
+    python -m benchmarks.bench_validation_modes --download --languages en-US ja-JP
+    python -m benchmarks.bench_validation_modes --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from valorant import utils
+from valorant.models.base import construct_trusted
+
+from ._catalog import DEFAULT_CATALOG_PATH, download_catalog, load_catalog
+from .bench_interning import MODELS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+MODES = ('strict', 'lax', 'trusted')
+
+
+def _builder(mode: str, endpoint: str) -> Callable[[Any], Any]:
+    model = MODELS[endpoint]
+    if mode == 'trusted':
+        return lambda data: construct_trusted(model, data)
+    context = {'strict': True} if mode == 'strict' else None
+    return lambda data: model.model_validate(data, context=context)
+
+
+def bench(build: Callable[[Any], Any], data: Any, repeat: int) -> float | None:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            build(data)
+        except ValidationError:
+            return None
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _format(elapsed: float | None) -> str:
+    return f'{elapsed * 1e3:12.2f}' if elapsed is not None else f'{"-":>12}'
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG_PATH)
+    parser.add_argument('--download', action='store_true', help='download the catalog from the live API first')
+    parser.add_argument('--languages', nargs='+', default=['en-US'])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.download:
+        await download_catalog(args.catalog, args.languages)
+
+    catalog = load_catalog(args.catalog)
+
+    print(f'{"endpoint":<32}' + ''.join(f'{mode:>9} ms' for mode in MODES))
+    totals = dict.fromkeys(MODES, 0.0)
+    for (endpoint, language), body in sorted(catalog.items()):
+        data = utils._from_json(body)
+        timings = {mode: bench(_builder(mode, endpoint), data, args.repeat) for mode in MODES}
+        print(f'{endpoint + " " + language:<32}' + ''.join(_format(timings[mode]) for mode in MODES))
+        # Payloads the models reject are left out of every total.
+        if None not in timings.values():
+            for mode in MODES:
+                totals[mode] += timings[mode] or 0
+
+    print(f'{"total":<32}' + ''.join(_format(totals[mode]) for mode in MODES))
+    if totals['trusted']:
+        print(f'trusted is {totals["lax"] / totals["trusted"]:.1f}x faster than lax')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from valorant import Client
+from valorant.http import Route
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -23,5 +28,61 @@ def cache_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
 
 @pytest.fixture(scope='session')
 async def client(cache_path: Path) -> AsyncGenerator[Client]:
-    async with Client(cache_path=cache_path) as client:
+    async with Client(cache_path=cache_path, validation='strict') as client:
         yield client
+
+
+class FakeAPI:
+    """A local stand-in for valorant-api.com serving canned payloads.
+
+    Lists are filtered on the query parameters other than ``language``, the way ``isPlayableCharacter``
+    filters ``/agents``: only the items whose field of that name has the given value are returned.
+    """
+
+    def __init__(self) -> None:
+        self.payloads: dict[str, Any] = {}
+        self.requests: Counter[str] = Counter()
+        self.fail_with: int | None = None
+        # Seconds every response is held back, to keep concurrent requests overlapping.
+        self.delay: float = 0
+
+    def add(self, path: str, data: Any) -> None:
+        self.payloads[path] = {'status': 200, 'data': data}
+
+    async def handle(self, request: web.Request) -> web.Response:
+        path = request.path.removeprefix('/v1')
+        self.requests[path] += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        if self.fail_with is not None:
+            return web.json_response({'status': self.fail_with, 'error': 'unavailable'}, status=self.fail_with)
+
+        payload = self.payloads.get(path)
+        if payload is None:
+            return web.json_response({'status': 404, 'error': 'not found'}, status=404)
+
+        filters = {name: value.lower() for name, value in request.query.items() if name != 'language'}
+        if filters and isinstance(payload['data'], list):
+            data = [
+                item
+                for item in payload['data']
+                if all(str(item.get(name)).lower() == value for name, value in filters.items())
+            ]
+            payload = {**payload, 'data': data}
+        return web.json_response(payload)
+
+
+@pytest.fixture
+async def api_server(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[FakeAPI]:
+    api = FakeAPI()
+    app = web.Application()
+    app.router.add_get('/v1/{tail:.*}', api.handle)
+
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(Route, 'BASE', str(server.make_url('/v1')))
+    try:
+        yield api
+    finally:
+        await server.close()
@@ -1,12 +1,36 @@
-from uuid import uuid4
+import copy
+import pickle  # noqa: S403
+from typing import Any
+from uuid import UUID, uuid4
 
-from valorant.models.base import BaseModel, BaseUUIDModel
-from valorant.utils import is_running_in_pytest
+import pytest
+from pydantic import Field, ValidationError
 
+from valorant.models.base import (
+    BaseModel,
+    BaseUUIDModel,
+    Compact,
+    Lazy,
+    Response,
+    construct_trusted,
+    projection,
+    schema_validator,
+    type_adapter,
+)
+from valorant.models.localization import LocalizedField
 
-def test_base_model_config_forbids_extra_in_pytest() -> None:
-    assert is_running_in_pytest()
-    assert BaseModel.model_config['extra'] == 'forbid'
+
+def test_base_model_extra_fields_strict() -> None:
+    uuid_val = uuid4()
+    model = BaseUUIDModel.model_validate({'uuid': uuid_val, 'added': 1})
+    assert model.model_extra == {'added': 1}
+
+    strict = schema_validator(list[BaseUUIDModel], strict=True)
+    assert schema_validator(list[BaseUUIDModel], strict=True) is strict
+    with pytest.raises(ValidationError, match='extra_forbidden'):
+        strict.validate_python([{'uuid': uuid_val, 'added': 1}])
+    (validated,) = strict.validate_python([{'uuid': uuid_val}])
+    assert (type(validated), validated.uuid, validated.model_extra) == (BaseUUIDModel, uuid_val, None)
 
 
 def test_base_uuid_model_eq_same_uuid_same_class() -> None:
@@ -69,3 +93,242 @@ def test_base_uuid_model_hash_equals_uuid_hash() -> None:
     uuid_val = uuid4()
     model = BaseUUIDModel(uuid=uuid_val)
     assert hash(model) == hash(uuid_val)
+
+
+class _Child(BaseModel):
+    value: int
+
+
+class _Parent(BaseModel):
+    name: str
+    children: Lazy[list[_Child]]
+    extra_children: Lazy[list[_Child] | None] = None
+
+
+def test_lazy_field_validates_on_access() -> None:
+    parent = _Parent.model_validate({'name': 'a', 'children': [{'value': '1'}]}, context={'lazy': True})
+    assert not isinstance(parent.__dict__['children'], list)
+
+    assert parent.children == [_Child(value=1)]
+    assert parent.__dict__['children'] is parent.children
+    assert parent.extra_children is None
+
+
+def test_lazy_field_eager_without_context() -> None:
+    parent = _Parent.model_validate({'name': 'a', 'children': [{'value': '1'}]})
+    assert parent.__dict__['children'] == [_Child(value=1)]
+
+    with pytest.raises(ValidationError):
+        _Parent.model_validate({'name': 'a', 'children': [{'value': 'x'}]})
+
+
+def test_lazy_field_error_raised_on_access() -> None:
+    parent = _Parent.model_validate({'name': 'a', 'children': [{'value': 'x'}]}, context={'lazy': True})
+    assert parent.name == 'a'
+    with pytest.raises(ValidationError):
+        _ = parent.children
+
+
+def test_lazy_field_dump_and_assignment() -> None:
+    parent = _Parent.model_validate({'name': 'a', 'children': [{'value': 2}]}, context={'lazy': True})
+    assert parent.model_dump() == {'name': 'a', 'children': [{'value': 2}], 'extra_children': None}
+
+    parent.children = []
+    assert parent.children == []
+
+
+@pytest.mark.parametrize(
+    'copy_',
+    [
+        lambda model: pickle.loads(pickle.dumps(model)),  # noqa: S301
+        copy.deepcopy,
+        lambda model: model.model_copy(deep=True),
+    ],
+    ids=['pickle', 'deepcopy', 'model_copy'],
+)
+def test_lazy_field_copy(copy_: Any) -> None:
+    data = {'name': 'a', 'children': [{'value': 1}]}
+    for parent in (
+        _Parent.model_validate(data, context={'lazy': True}),
+        construct_trusted(_Parent, data, {'lazy': True}),
+    ):
+        copied = copy_(parent)
+        assert copied.children == [_Child(value=1)]
+        assert copied.children is not parent.children
+        assert copied.model_dump() == parent.model_dump()
+
+
+def test_lazy_field_inherited() -> None:
+    class Subclass(_Parent):
+        pass
+
+    assert Subclass.model_fields['children'].is_required()
+    subclass = Subclass.model_validate({'name': 'a', 'children': [{'value': 3}]}, context={'lazy': True})
+    assert subclass.children == [_Child(value=3)]
+
+
+class _Asset(BaseModel):
+    display_icon: Compact[str | None]
+    asset_path: Compact[str]
+
+
+ASSET = {
+    'display_icon': 'https://media.valorant-api.com/agents/e370fa57/displayicon.png',
+    'asset_path': 'ShooterGame/Content/Characters/Agent_PrimaryAsset',
+}
+
+
+def test_compact_field() -> None:
+    asset = schema_validator(_Asset, compact=True).validate_python(ASSET)
+
+    assert asset.__dict__['display_icon'] == b'\x00agents/e370fa57/displayicon.png'
+    assert asset.__dict__['asset_path'] == b'\x01Characters/Agent_PrimaryAsset'
+    assert asset.display_icon == ASSET['display_icon']
+    assert asset.asset_path == ASSET['asset_path']
+    assert asset.model_dump() == ASSET
+
+
+def test_compact_field_other_values() -> None:
+    asset = schema_validator(_Asset, compact=True).validate_python({'display_icon': None, 'asset_path': 'Other/Path'})
+    assert asset.display_icon is None
+    assert asset.asset_path == 'Other/Path'
+
+    asset = _Asset.model_validate(ASSET, context={'compact': True})
+    assert asset.__dict__ == ASSET
+
+
+def test_compact_field_only_when_requested() -> None:
+    class Asset(BaseModel):
+        asset_path: Compact[str]
+
+    # Plain fields until a compact validator is built, the texts are rebuilt on access from then on.
+    assert Asset.model_validate(ASSET).__dict__['asset_path'] == ASSET['asset_path']
+    assert 'asset_path' not in vars(Asset)
+    (asset,) = projection(Asset, ['asset_path'], compact=True).validate_python([ASSET])
+    assert 'asset_path' in vars(Asset)
+    assert (asset.__dict__['asset_path'], asset.asset_path) == (
+        b'\x01Characters/Agent_PrimaryAsset',
+        ASSET['asset_path'],
+    )
+
+
+class _Named(BaseModel):
+    display_name: str | LocalizedField = Field(alias='displayName')
+    tags: list[str] | None = None
+
+
+def test_construct_trusted() -> None:
+    data: dict[str, Any] = {'status': 200, 'data': [{'displayName': 'a', 'tags': ['x']}, {'displayName': 'b'}]}
+    response = construct_trusted(Response[list[_Named]], data)
+
+    first, second = response.data
+    assert first.display_name == 'a'
+    assert first.tags == ['x']
+    assert first.tags is not data['data'][0]['tags']
+    assert first.model_fields_set == {'display_name', 'tags'}
+    assert second.tags is None
+    assert second.model_fields_set == {'display_name'}
+    assert response.model_dump() == Response[list[_Named]].model_validate(data).model_dump()
+
+
+def test_construct_trusted_skips_validation() -> None:
+    uuid_val = uuid4()
+    model = construct_trusted(BaseUUIDModel, {'uuid': str(uuid_val), 'added': 1})
+    assert model.uuid == uuid_val
+    assert model.model_extra == {}
+
+    parent = construct_trusted(_Parent, {'name': 'a', 'children': [{'value': 'x'}]})
+    assert parent.children[0].__dict__ == {'value': 'x'}
+
+
+class _Referencing(BaseUUIDModel):
+    parent_uuid: UUID | None = Field(alias='parentUuid')
+    related: list[UUID] = Field(default_factory=list)
+
+
+def test_construct_trusted_uuids() -> None:
+    data = {'uuid': str(uuid4()), 'parentUuid': str(uuid4()), 'related': [str(uuid4())]}
+    trusted = construct_trusted(_Referencing, data)
+    validated = type_adapter(_Referencing).validate_python(data)
+
+    assert trusted == validated
+    assert len({trusted, validated}) == 1
+    assert (trusted.parent_uuid, trusted.related) == (validated.parent_uuid, validated.related)
+    assert construct_trusted(_Referencing, {**data, 'parentUuid': None}).parent_uuid is None
+
+
+def test_construct_trusted_context() -> None:
+    parent = construct_trusted(_Parent, {'name': 'a', 'children': [{'value': 1}]}, {'lazy': True})
+    assert not isinstance(parent.__dict__['children'], list)
+    assert parent.children == [_Child(value=1)]
+
+    asset = construct_trusted(_Asset, ASSET, {'compact': True})
+    assert asset.__dict__['asset_path'] == b'\x01Characters/Agent_PrimaryAsset'
+    assert asset.asset_path == ASSET['asset_path']
+
+
+def test_construct_trusted_list() -> None:
+    children = construct_trusted(list[_Child], [{'value': 1}, {'value': 2}])
+    assert children == [_Child(value=1), _Child(value=2)]
+
+
+def test_type_adapter_shared() -> None:
+    adapter = type_adapter(list[_Child])
+    assert type_adapter(list[_Child]) is adapter
+    assert adapter.validate_python([{'value': '1'}]) == [_Child(value=1)]
+
+
+def test_projection() -> None:
+    names = projection(_Parent, ['name'])
+    parents = names.validate_python([{'name': 'a', 'children': [{'value': 'x'}], 'added': 1}])
+
+    assert type(parents[0]) is _Parent
+    assert parents[0].__dict__ == {'name': 'a'}
+    assert parents[0].model_extra is None
+    with pytest.raises(AttributeError):
+        _ = parents[0].children
+    assert parents[0].model_dump() == {'name': 'a'}
+
+    with pytest.raises(ValidationError):
+        names.validate_python([{'children': []}])
+
+
+def test_projection_strict() -> None:
+    data = [{'name': 'a', 'children': [{'value': 1, 'added': 1}], 'added': 1}]
+    strict = projection(_Parent, ['name', 'children'], strict=True)
+    assert strict is not projection(_Parent, ['name', 'children'])
+
+    # The fields left out of the projection are ignored, the unknown ones of the nested models rejected.
+    assert projection(_Parent, ['name'], strict=True).validate_python(data)[0].name == 'a'
+    with pytest.raises(ValidationError, match='extra_forbidden'):
+        strict.validate_python(data)
+
+
+def test_projection_trusted() -> None:
+    named = projection(_Named, ['display_name']).construct_trusted([{'displayName': 'a', 'tags': ['x']}])
+    assert named[0].__dict__ == {'display_name': 'a'}
+
+    assets = projection(_Asset, ['asset_path']).construct_trusted([ASSET], {'compact': True})
+    assert assets[0].asset_path == ASSET['asset_path']
+    with pytest.raises(AttributeError):
+        _ = assets[0].display_icon
+
+
+def test_projection_keeps_uuid() -> None:
+    data = [{'uuid': str(uuid4()), 'parentUuid': None}, {'uuid': str(uuid4()), 'parentUuid': None}]
+    parents = projection(_Referencing, ['parent_uuid'])
+
+    assert parents.fields == ('uuid', 'parent_uuid')
+    assert projection(_Referencing, ('uuid', 'parent_uuid')) is parents
+    for first, second in (parents.validate_python(data), parents.construct_trusted(data)):
+        assert first == first  # noqa: PLR0124
+        assert first != second
+        assert len({first, second, first}) == 2
+        assert repr(first) == "<_Referencing fields=('uuid', 'parent_uuid')>"
+        assert first == type_adapter(_Referencing).validate_python(data[0])
+
+
+def test_projection_shared() -> None:
+    assert projection(_Named, ('display_name', 'tags')) is projection(_Named, ['display_name', 'tags'])
+    with pytest.raises(ValueError, match='displayName'):
+        projection(_Named, ['displayName'])
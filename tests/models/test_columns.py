@@ -0,0 +1,183 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import Field
+from pydantic_extra_types.color import Color
+
+from valorant.enums import Language, ShopCategory, WeaponCategory
+from valorant.models.base import (
+    BaseModel,
+    BaseUUIDModel,
+    Compact,
+    Lazy,
+    construct_trusted,
+    projection,
+    schema_validator,
+)
+from valorant.models.columns import Categorical, ModelList, to_columns, to_dataframe
+from valorant.models.localization import LocalizedField
+
+np = pytest.importorskip('numpy')
+
+
+class _Stats(BaseModel):
+    fire_rate: float = Field(alias='fireRate')
+    magazine_size: int = Field(alias='magazineSize')
+    feature: str | None
+
+
+class _ShopData(BaseModel):
+    cost: int
+    category: ShopCategory
+    can_be_trashed: bool = Field(alias='canBeTrashed')
+
+
+class _Weapon(BaseUUIDModel):
+    display_name: str | LocalizedField = Field(alias='displayName')
+    category: WeaponCategory
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    release_date: datetime | None = Field(alias='releaseDate')
+    color: Color | None = None
+    weapon_stats: _Stats | None = Field(alias='weaponStats')
+    shop_data: _ShopData | None = Field(alias='shopData')
+    skins: Lazy[list[str]]
+
+
+def _weapon(stats: bool = True, **kwargs: Any) -> dict[str, Any]:
+    return {
+        'uuid': str(uuid4()),
+        'displayName': {language.value: f'text {language.value}' for language in Language},
+        'category': WeaponCategory.rifle.value,
+        'displayIcon': 'https://media.valorant-api.com/weapons/63e6c2b6/displayicon.png',
+        'releaseDate': '2020-06-02T00:00:00Z',
+        'weaponStats': {'fireRate': 9.75, 'magazineSize': 25, 'feature': None} if stats else None,
+        'shopData': {'cost': 2900, 'category': ShopCategory.rifles.value, 'canBeTrashed': True} if stats else None,
+        'skins': [],
+        **kwargs,
+    }
+
+
+WEAPONS: list[dict[str, Any]] = [
+    _weapon(color='red'),
+    _weapon(stats=False, category=WeaponCategory.melee.value, releaseDate=None),
+    _weapon(category=WeaponCategory.rifle.value),
+]
+
+
+def test_to_columns() -> None:
+    compact = schema_validator(_Weapon, compact=True)
+    weapons = [compact.validate_python(weapon, context={'lazy': True}) for weapon in WEAPONS]
+    columns = to_columns(weapons)
+
+    assert list(columns) == [
+        'uuid',
+        'display_name',
+        'category',
+        'display_icon',
+        'release_date',
+        'color',
+        'weapon_stats.fire_rate',
+        'weapon_stats.magazine_size',
+        'weapon_stats.feature',
+        'shop_data.cost',
+        'shop_data.category',
+        'shop_data.can_be_trashed',
+    ]
+
+    uuid = columns['uuid']
+    assert isinstance(uuid, Categorical)
+    assert uuid.codes.tolist() == [0, 1, 2]
+    assert list(uuid.categories) == [UUID(weapon['uuid']) for weapon in WEAPONS]
+
+    category = columns['category']
+    assert isinstance(category, Categorical)
+    assert category.codes.dtype == np.int32
+    assert category.codes.tolist() == [0, 1, 0]
+    assert list(category.categories) == [WeaponCategory.rifle, WeaponCategory.melee]
+
+    assert columns['display_name'].tolist() == ['text en-US'] * 3  # type: ignore[union-attr]
+    assert columns['display_icon'][0] == WEAPONS[0]['displayIcon']
+    assert columns['color'].tolist() == ['#ff0000', None, None]  # type: ignore[union-attr]
+
+    release_date = columns['release_date']
+    assert release_date.dtype == np.dtype('datetime64[us]')  # type: ignore[union-attr]
+    assert release_date[0] == np.datetime64('2020-06-02T00:00:00')
+    assert np.isnat(release_date[1])
+
+    # The fields of missing nested models read as None: NaN for numbers, no category.
+    magazine_size = columns['weapon_stats.magazine_size']
+    assert magazine_size.dtype == np.float64  # type: ignore[union-attr]
+    assert magazine_size[0] == WEAPONS[0]['weaponStats']['magazineSize']
+    assert np.isnan(magazine_size[1])
+    assert columns['shop_data.category'].codes.tolist() == [0, -1, 0]  # type: ignore[union-attr]
+    assert columns['shop_data.can_be_trashed'].tolist() == [True, None, True]  # type: ignore[union-attr]
+
+
+def test_to_columns_types() -> None:
+    weapons = [_Weapon.model_validate(WEAPONS[0]), _Weapon.model_validate(WEAPONS[2])]
+    columns = to_columns(weapons)
+
+    # The types come from the annotations, not the values: the fields of optional nested models stay nullable.
+    assert columns['weapon_stats.magazine_size'].dtype == np.float64  # type: ignore[union-attr]
+    assert columns['shop_data.can_be_trashed'].dtype == object  # type: ignore[union-attr]
+    assert columns['weapon_stats.feature'].tolist() == [None, None]  # type: ignore[union-attr]
+
+    stats = to_columns([weapon.weapon_stats for weapon in weapons if weapon.weapon_stats is not None])
+    assert stats['magazine_size'].dtype == np.int64  # type: ignore[union-attr]
+    assert stats['fire_rate'].dtype == np.float64  # type: ignore[union-attr]
+
+
+class _Tier(BaseModel):
+    color: Color
+    start_time: datetime = Field(alias='startTime')
+
+
+def test_to_columns_trusted() -> None:
+    trusted = to_columns(construct_trusted(list[_Weapon], WEAPONS))
+    validated = to_columns([_Weapon.model_validate(weapon) for weapon in WEAPONS])
+    for name in ('color', 'release_date'):
+        assert trusted[name].tolist() == validated[name].tolist()  # type: ignore[union-attr]
+
+    tiers = [{'color': 'ffffffff', 'startTime': '2020-06-02T00:00:00Z'}]
+    columns = to_columns(construct_trusted(list[_Tier], tiers))
+    assert columns['color'].tolist() == ['#ffffff']  # type: ignore[union-attr]
+    assert columns['start_time'][0] == np.datetime64('2020-06-02T00:00:00')
+
+
+def test_to_columns_projection() -> None:
+    weapons = projection(_Weapon, ['uuid', 'shop_data']).validate_python(WEAPONS)
+    columns = to_columns(weapons)
+
+    assert list(columns) == ['uuid', 'shop_data.cost', 'shop_data.category', 'shop_data.can_be_trashed']
+    assert columns['shop_data.cost'].tolist()[::2] == [2900, 2900]  # type: ignore[union-attr]
+
+
+def test_to_columns_empty() -> None:
+    assert to_columns([]) == {}
+
+    columns = to_columns([], _Weapon)
+    assert 'shop_data.cost' in columns
+    assert all(len(getattr(column, 'codes', column)) == 0 for column in columns.values())
+
+
+def test_model_list() -> None:
+    weapons = ModelList(_Weapon, [_Weapon.model_validate(weapon) for weapon in WEAPONS])
+
+    assert weapons == list(weapons)
+    assert weapons.to_columns()['shop_data.cost'][0] == WEAPONS[0]['shopData']['cost']
+    assert ModelList(_Weapon).to_columns().keys() == weapons.to_columns().keys()
+
+
+def test_to_dataframe() -> None:
+    pd = pytest.importorskip('pandas')
+    weapons = ModelList(_Weapon, [_Weapon.model_validate(weapon) for weapon in WEAPONS])
+    frame = weapons.to_dataframe()
+
+    assert frame.shape == (3, 12)
+    assert isinstance(frame['category'].dtype, pd.CategoricalDtype)
+    assert frame['category'].tolist() == [WeaponCategory.rifle, WeaponCategory.melee, WeaponCategory.rifle]
+    assert frame['shop_data.category'].isna().tolist() == [False, True, False]
+    assert frame['weapon_stats.fire_rate'].sum() == pytest.approx(19.5)
+    assert frame.equals(to_dataframe(weapons))
@@ -1,6 +1,29 @@
+from __future__ import annotations
+
+import copy
+import pickle  # noqa: S403
+from typing import TYPE_CHECKING, Any, Literal
+
 import pytest
 
+from valorant import Client
+from valorant.enums import Language
 from valorant.models.localization import LocalizedField
+from valorant.models.weapons import Chroma
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ..conftest import FakeAPI
+
+CHROMA: dict[str, Any] = {
+    'uuid': '19629ae1-4996-ae98-7742-24a240d41f99',
+    'displayIcon': None,
+    'fullRender': 'https://media.valorant-api.com/fullrender.png',
+    'swatch': None,
+    'streamedVideo': None,
+    'assetPath': 'ShooterGame/Content/Equippables/Guns/Chroma',
+}
 
 
 @pytest.fixture
@@ -66,3 +89,67 @@ def test_str_method(data: dict[str, str]) -> None:
 def test_repr_method(data: dict[str, str]) -> None:
     field = LocalizedField(**data)
     assert repr(field) == "<LocalizedField en_US='English'>"
+
+
+def test_compact_storage(data: dict[str, str]) -> None:
+    field = LocalizedField(**data)
+
+    assert not hasattr(field, '__dict__')
+    assert len(field) == len(Language)
+    assert [field[index] for index, _ in enumerate(Language)] == [data[language.value] for language in Language]
+
+
+def test_validate_in_model(data: dict[str, str]) -> None:
+    chroma = Chroma.model_validate(CHROMA | {'displayName': data})
+
+    assert isinstance(chroma.display_name, LocalizedField)
+    assert chroma.display_name.japanese == '日本語'
+    assert chroma.model_dump(by_alias=True)['displayName'] == data
+    assert Chroma.model_validate_json(chroma.model_dump_json(by_alias=True)).display_name == chroma.display_name
+
+
+def test_missing_or_unknown_locale(data: dict[str, str]) -> None:
+    with pytest.raises(ValueError, match='th-TH'):
+        LocalizedField(**{locale: text for locale, text in data.items() if locale != 'th-TH'})
+    with pytest.raises(ValueError, match='xx-XX'):
+        LocalizedField.from_mapping(data | {'xx-XX': 'unknown'}, strict=True)
+    assert LocalizedField.from_mapping(data | {'xx-XX': 'unknown'}) == LocalizedField(**data)
+
+
+def test_copy(data: dict[str, str]) -> None:
+    field = LocalizedField(**data)
+    copied = copy.deepcopy(field)
+    assert type(copied) is LocalizedField
+    assert copied == field
+
+
+def test_locale_projection(data: dict[str, str]) -> None:
+    field = LocalizedField.from_mapping(data, locales={'ja-JP', 'ko-KR'})
+
+    assert (field.ja_JP, field.ko_KR, str(field)) == ('日本語', '한국어', 'English')
+    # dropped locales cannot be mistaken for the en-US text
+    with pytest.raises(KeyError, match='th-TH'):
+        _ = field.thai
+    with pytest.raises(KeyError, match='de-DE'):
+        _ = field.de_DE
+    assert field.to_dict() == {'en-US': 'English', 'ja-JP': '日本語', 'ko-KR': '한국어'}
+
+    copied = pickle.loads(pickle.dumps(field))  # noqa: S301
+    assert copied == field
+    assert copy.deepcopy(field) == field
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('validation', ['lax', 'trusted'])
+async def test_client_locales(
+    data: dict[str, str], api_server: FakeAPI, tmp_path: Path, validation: Literal['lax', 'trusted']
+) -> None:
+    api_server.add('/weapons/skinchromas/19629ae1-4996-ae98-7742-24a240d41f99', CHROMA | {'displayName': data})
+
+    async with Client(cache_path=tmp_path, locales=[Language.japanese], validation=validation) as client:
+        chroma = await client.fetch_skin_chroma('19629ae1-4996-ae98-7742-24a240d41f99', language='all')
+
+    assert isinstance(chroma.display_name, LocalizedField)
+    assert chroma.display_name.japanese == '日本語'
+    with pytest.raises(KeyError, match='ko-KR'):
+        _ = chroma.display_name.korean
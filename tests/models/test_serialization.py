@@ -0,0 +1,98 @@
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import Field
+from pydantic_extra_types.color import Color
+
+from valorant import utils
+from valorant.enums import Language, WeaponCategory
+from valorant.models.base import BaseModel, BaseUUIDModel, Compact, Lazy, projection, schema_validator
+from valorant.models.localization import LocalizedField
+from valorant.models.serialization import dumps, loads
+
+
+class _Level(BaseUUIDModel):
+    display_name: str | LocalizedField = Field(alias='displayName')
+    color: Color | None = None
+
+
+class _Item(BaseUUIDModel):
+    display_name: str | LocalizedField = Field(alias='displayName')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    category: WeaponCategory
+    start_time: datetime = Field(alias='startTime')
+    parent_uuid: UUID | None = Field(alias='parentUuid')
+    colors: list[Color] = Field(alias='colors')
+    levels: Lazy[list[_Level]]
+    data: Any = None
+
+
+ITEM: dict[str, Any] = {
+    'uuid': str(uuid4()),
+    'displayName': {language.value: f'text {language.value}' for language in Language},
+    'displayIcon': 'https://media.valorant-api.com/weapons/63e6c2b6/displayicon.png',
+    'category': WeaponCategory.rifle.value,
+    'startTime': '2020-06-02T00:00:00Z',
+    'parentUuid': None,
+    'colors': ['#ff0000aa', 'rgb(0, 255, 0)'],
+    'levels': [{'uuid': str(uuid4()), 'displayName': 'level', 'color': 'red'}],
+    'data': {'any': [1, 'json']},
+    'addedLater': True,
+}
+
+
+def _fields(model: BaseModel) -> dict[str, Any]:
+    return {name: getattr(model, name) for name in model.__dict__}
+
+
+def test_round_trip() -> None:
+    item = _Item.model_validate(ITEM)
+    (unpacked,) = loads(list[_Item], dumps([item]))
+
+    assert type(unpacked) is _Item
+    assert _fields(unpacked) == _fields(item)
+    assert isinstance(unpacked.display_name, LocalizedField)
+    assert unpacked.display_name.japanese == item.display_name.japanese  # type: ignore[union-attr]
+    assert type(unpacked.category) is WeaponCategory
+    assert unpacked.start_time == datetime(2020, 6, 2, tzinfo=timezone.utc)
+    assert unpacked.colors[0].as_rgb() == item.colors[0].as_rgb()
+    assert unpacked.levels[0].color == item.levels[0].color
+    assert unpacked.model_extra == {'addedLater': True}
+    assert unpacked.model_dump() == item.model_dump()
+
+
+def test_round_trip_context() -> None:
+    item = schema_validator(_Item, compact=True).validate_python(ITEM, context={'lazy': True})
+    unpacked = loads(_Item, dumps(item))
+
+    assert unpacked.__dict__['display_icon'] == item.__dict__['display_icon']
+    assert unpacked.display_icon == ITEM['displayIcon']
+    assert unpacked.levels == item.levels
+
+
+def test_round_trip_projection() -> None:
+    (item,) = projection(_Item, ['uuid', 'category']).validate_python([ITEM])
+    (unpacked,) = loads(list[_Item], dumps([item]))
+
+    assert unpacked.__dict__ == item.__dict__
+    assert type(unpacked.uuid) is UUID
+    with pytest.raises(AttributeError):
+        _ = unpacked.levels
+
+
+def test_round_trip_without_msgspec(monkeypatch: pytest.MonkeyPatch) -> None:
+    item = _Item.model_validate(ITEM)
+    monkeypatch.setattr(utils, '_msgspec', None)
+    assert loads(_Item, dumps(item)).model_dump() == item.model_dump()
+
+
+def test_dumps_rejects_unknown_types() -> None:
+    with pytest.raises(TypeError):
+        dumps([object()])
+
+
+def test_loads_rejects_other_payloads() -> None:
+    with pytest.raises(ValueError, match='dumps'):
+        loads(_Item, b'{}')
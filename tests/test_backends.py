@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, NoReturn
+
+import pytest
+from aiohttp import ClientSession
+
+from valorant.backends import FileSystemCache, MemoryCache
+from valorant.cache import CacheBackend, SQLiteCache
+from valorant.http import HTTPClient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    from .conftest import FakeAPI
+
+BACKENDS: dict[str, Callable[[Path], CacheBackend]] = {
+    'memory': lambda _: MemoryCache(),
+    'filesystem': lambda path: FileSystemCache(path / 'responses'),
+    'sqlite': lambda path: SQLiteCache(path / 'cache.db'),
+}
+
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[CacheBackend]:
+    with BACKENDS[request.param](tmp_path) as backend:
+        yield backend
+
+
+def test_backend_round_trip(backend: CacheBackend) -> None:
+    backend.set('/agents?language=ja-JP', b'agents', route='/agents', language='ja-JP', manifest='A')
+    backend.set('/maps', b'{"status":404}', route='/maps', status=404, expire_after=60)
+
+    entry = backend.get('/agents?language=ja-JP')
+    assert entry is not None
+    assert (entry.body, entry.route, entry.language, entry.status) == (b'agents', '/agents', 'ja-JP', 200)
+    assert (entry.expires_at, entry.manifest) == (None, 'A')
+
+    entry = backend.get('/maps')
+    assert entry is not None
+    assert entry.status == 404
+    assert entry.expires_at is not None
+    assert backend.get('/buddies') is None
+
+    info = backend.info('/agents?language=ja-JP')
+    assert info is not None
+    assert (info.route, info.size) == ('/agents', len(b'agents'))
+    assert backend.info('/buddies') is None
+    assert len(backend) == 2
+
+
+def test_backend_expired(backend: CacheBackend) -> None:
+    backend.set('/agents', b'agents', route='/agents', expire_after=-1)
+
+    assert backend.get('/agents') is None
+    entry = backend.get('/agents', include_expired=True)
+    assert entry is not None
+    assert entry.is_expired()
+    assert backend.delete_expired() == 1
+    assert backend.get('/agents', include_expired=True) is None
+
+
+def test_backend_entries_and_purge(backend: CacheBackend) -> None:
+    backend.set('/agents', b'a', route='/agents')
+    backend.set('/agents?language=ja-JP', b'a', route='/agents', language='ja-JP')
+    backend.set('/weapons/skins/a', b'skin', route='/weapons/skins/{uuid}')
+
+    assert [info.key for info in backend.entries()] == ['/agents', '/agents?language=ja-JP', '/weapons/skins/a']
+    assert [info.key for info in backend.entries('/weapons/*')] == ['/weapons/skins/a']
+    assert [info.key for info in backend.entries('/agents', language='ja-JP')] == ['/agents?language=ja-JP']
+    assert [(usage.route, usage.entries) for usage in backend.usage()] == [
+        ('/agents', 1),
+        ('/agents', 1),
+        ('/weapons/skins/{uuid}', 1),
+    ]
+
+    assert backend.purge('/agents') == 2
+    assert backend.delete('/weapons/skins/a')
+    assert not backend.delete('/weapons/skins/a')
+    assert len(backend) == 0
+
+    backend.set('/maps', b'maps', route='/maps')
+    backend.clear()
+    assert backend.entries() == []
+
+
+def test_backend_evict(backend: CacheBackend) -> None:
+    for index in range(4):
+        backend.set(f'/agents/{index}', bytes(1000), route='/agents/{uuid}')
+    backend.get('/agents/0')
+
+    size = backend.total_size()
+    assert backend.evict(size // 2) > 0
+    assert backend.total_size() <= size // 2
+    assert backend.get('/agents/0') is not None
+
+
+def test_backend_fetch_lock(backend: CacheBackend) -> None:
+    token = backend.acquire('/agents', 30)
+    assert token is not None
+
+    if isinstance(backend, MemoryCache):
+        # not shared with other processes, nothing to wait for
+        assert backend.acquire('/agents', 30) is not None
+    else:
+        assert backend.acquire('/agents', 30) is None
+        assert backend.release('/agents', token)
+        assert not backend.release('/agents', token)
+        abandoned = backend.acquire('/agents', 0)
+        assert abandoned is not None
+        assert backend.acquire('/agents', 30) is not None
+        assert not backend.release('/agents', abandoned)
+
+
+def test_backend_acquire_or_get(backend: CacheBackend) -> None:
+    token, entry = backend.acquire_or_get('/agents', 30)
+    assert token is not None
+    assert entry is None
+    if backend.shared:
+        assert backend.acquire_or_get('/agents', 30) == (None, None)
+
+    backend.set('/agents', b'agents', route='/agents')
+    backend.release('/agents', token)
+    token, entry = backend.acquire_or_get('/agents', 30)
+    assert token is None
+    assert entry is not None
+    assert entry.body == b'agents'
+    # The lock is left alone when the entry is found.
+    assert backend.acquire('/agents', 30) is not None
+
+
+@pytest.mark.anyio
+async def test_http_client_memory_cache_takes_no_lock(api_server: FakeAPI, monkeypatch: pytest.MonkeyPatch) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    cache = MemoryCache()
+    monkeypatch.setattr(cache, 'acquire', _disk_full)
+    monkeypatch.setattr(cache, 'acquire_or_get', _disk_full)
+
+    async with ClientSession() as session:
+        http_client = HTTPClient(session, cache_backend=cache)
+        await http_client.start()
+        await http_client.get_agents()
+
+    assert api_server.requests['/agents'] == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('name', list(BACKENDS))
+async def test_http_client_cache_backend(name: str, api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    http_client = HTTPClient(cache_path=tmp_path, cache_backend=name)  # type: ignore[arg-type]
+
+    try:
+        await http_client.start()
+        assert isinstance(http_client._cache, type(BACKENDS[name](tmp_path)))
+        await http_client.get_agents()
+        await http_client.get_agents()
+        stats = http_client.cache_stats()
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/agents'] == 1
+    assert (stats.total.hits, stats.total.entries) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_http_client_backend_with_session(api_server: FakeAPI) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    cache = MemoryCache()
+
+    async with ClientSession() as session:
+        http_client = HTTPClient(session, cache_backend=cache)
+        await http_client.start()
+        await http_client.get_agents()
+        await http_client.get_agents()
+
+    assert api_server.requests['/agents'] == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.anyio
+async def test_http_client_unknown_backend(tmp_path: Path) -> None:
+    http_client = HTTPClient(cache_path=tmp_path, cache_backend='redis')  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='redis'):
+        await http_client.start()
+
+
+def test_filesystem_fetch_lock_is_never_half_written(tmp_path: Path) -> None:
+    backend = FileSystemCache(tmp_path / 'responses')
+    token = backend.acquire('/agents', 30)
+    assert token is not None
+
+    # The lock is complete as soon as it exists, a temporary file is never left behind.
+    (path,) = (tmp_path / 'responses' / 'locks').iterdir()
+    assert path.read_text(encoding='utf-8').startswith(token + ' ')
+    assert backend.acquire('/agents', 30) is None
+
+
+def _disk_full(*args: object, **kwargs: object) -> NoReturn:
+    raise OSError(28, 'No space left on device')
+
+
+@pytest.mark.anyio
+async def test_http_client_cache_errors_are_logged(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(HTTPClient, 'CACHE_MAINTENANCE_INTERVAL', 0.01)
+    monkeypatch.setattr(HTTPClient, 'CACHE_FLUSH_INTERVAL', 0.01)
+    cache = MemoryCache()
+    monkeypatch.setattr(cache, 'evict', _disk_full)
+    monkeypatch.setattr(cache, 'flush', _disk_full)
+    http_client = HTTPClient(cache_backend=cache, max_cache_bytes=0, cache_write_behind=True)
+
+    await http_client.start()
+    tasks = (http_client._maintenance_task, http_client._flush_task)
+    await asyncio.sleep(0.05)
+    # Both tasks keep running, and close() does not raise their errors.
+    assert all(task is not None and not task.done() for task in tasks)
+    await http_client.close()
+
+    assert 'failed to trim the cache' in caplog.text
+    assert 'failed to flush the cache' in caplog.text
+
+
+def test_incomplete_backend() -> None:
+    class Incomplete(CacheBackend):
+        shared = True
+
+    # Rejected when created, not on the first call of a missing method.
+    with pytest.raises(TypeError, match='abstract'):
+        Incomplete()  # type: ignore[abstract]
+
+
+def test_filesystem_fetch_lock_takeover_race(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = FileSystemCache(tmp_path / 'responses')
+    second = FileSystemCache(tmp_path / 'responses')
+    token = first.acquire('/agents', 30)
+    assert token is not None
+
+    # The second process found an abandoned lock, which was released and taken by the first one
+    # before it could take it over.
+    lock_owner = second._lock_owner
+    readings = iter([('abandoned', 0.0)])
+    monkeypatch.setattr(second, '_lock_owner', lambda path: next(readings, None) or lock_owner(path))
+
+    assert second.acquire('/agents', 30) is None
+    assert first.release('/agents', token)
+    assert [path.name for path in (tmp_path / 'responses' / 'locks').iterdir()] == []
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import uuid as uuid_
+from typing import TYPE_CHECKING
+
+import pytest
+
+from valorant.bloom import BloomFilter
+from valorant.errors import NotFound
+from valorant.http import HTTPClient, Route
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .conftest import FakeAPI
+
+
+def test_bloom_filter() -> None:
+    items = [str(uuid_.uuid4()) for _ in range(1000)]
+    bloom = BloomFilter.from_items(items, 0.01)
+
+    assert len(bloom) == 1000
+    assert all(item in bloom for item in items)
+    assert all(item.upper() in bloom for item in items)
+    assert 1 not in bloom
+
+    # about 9.6 bits and 7 hashes per item for a 1% false positive rate
+    assert bloom.hashes == 7
+    assert 1150 <= bloom.memory <= 1250
+    assert bloom.false_positive_rate == pytest.approx(0.01, rel=0.1)
+
+    false_positives = sum(str(uuid_.uuid4()) in bloom for _ in range(10_000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_empty() -> None:
+    bloom = BloomFilter.from_items([])
+    assert 'a' not in bloom
+    assert bloom.false_positive_rate == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('enable_cache', [True, False])
+async def test_uuid_filter(enable_cache: bool, api_server: FakeAPI, tmp_path: Path) -> None:
+    sprays = [{'uuid': 'a', 'levels': [{'uuid': 'a1'}]}, {'uuid': 'b', 'levels': []}]
+    api_server.add('/sprays', sprays)
+    api_server.add('/sprays/b', sprays[1])
+    http_client = HTTPClient(enable_cache=enable_cache, cache_path=tmp_path)
+
+    try:
+        await http_client.start()
+        await http_client.get_sprays()
+
+        with pytest.raises(NotFound):
+            await http_client.get_spray('unknown')
+        with pytest.raises(NotFound):
+            await http_client.get_spray_level('unknown')
+        assert (await http_client.get_spray('b'))['data'] == sprays[1]
+
+        filters = {stats.endpoint: stats for stats in http_client.uuid_filter_stats()}
+        counters = http_client.cache_stats().routes['/sprays/{uuid}']
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/sprays/unknown'] == 0
+    assert api_server.requests['/sprays/levels/unknown'] == 0
+    assert api_server.requests['/sprays/b'] == (0 if enable_cache else 1)
+    assert counters.rejected == 1
+
+    assert (filters['/sprays'].items, filters['/sprays/levels'].items) == (2, 1)
+    assert filters['/sprays'].memory > 0
+    assert filters['/sprays'].false_positive_rate < 0.001
+
+
+@pytest.mark.anyio
+async def test_uuid_filter_manifest_change(api_server: FakeAPI) -> None:
+    api_server.add('/sprays', [{'uuid': 'a'}])
+    api_server.add('/sprays/new', {'uuid': 'new'})
+    api_server.add('/version', {'manifestId': 'B'})
+    http_client = HTTPClient(enable_cache=False)
+
+    try:
+        await http_client.start()
+        await http_client.get_sprays()
+        with pytest.raises(NotFound):
+            await http_client.get_spray('new')
+
+        # a new game version may add uuids, the filter no longer applies
+        await http_client.request(Route('GET', '/version'))
+        assert (await http_client.get_spray('new'))['data'] == {'uuid': 'new'}
+        assert http_client.uuid_filter_stats() == []
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/sprays/new'] == 1
+
+
+@pytest.mark.anyio
+async def test_uuid_filter_filtered_list(api_server: FakeAPI) -> None:
+    agents = [{'uuid': 'a', 'isPlayableCharacter': True}, {'uuid': 'b', 'isPlayableCharacter': False}]
+    api_server.add('/agents', agents)
+    api_server.add('/agents/b', agents[1])
+    http_client = HTTPClient(enable_cache=False)
+
+    try:
+        await http_client.start()
+        assert (await http_client.get_agents(is_playable_character=True))['data'] == agents[:1]
+
+        # the filtered list leaves b out, it must not be rejected
+        assert (await http_client.get_agent('b'))['data'] == agents[1]
+        assert http_client.uuid_filter_stats() == []
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/agents/b'] == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('endpoint', ['/events', '/missions', '/seasons', '/seasons/competitive'])
+async def test_uuid_filter_unfiltered_endpoints(endpoint: str, api_server: FakeAPI) -> None:
+    api_server.add(endpoint, [{'uuid': 'a'}])
+    api_server.add(f'{endpoint}/new', {'uuid': 'new'})
+    http_client = HTTPClient(enable_cache=False)
+
+    try:
+        await http_client.start()
+        await http_client.request(Route('GET', endpoint))
+
+        # new uuids can appear in these lists at any time
+        assert (await http_client.request(Route('GET', endpoint + '/{uuid}', uuid='new')))['data'] == {'uuid': 'new'}
+        assert http_client.uuid_filter_stats() == []
+    finally:
+        await http_client.close()
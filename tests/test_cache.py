@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from aiohttp import ClientSession
-from aiohttp_client_cache.session import CachedSession
 
-from valorant.http import HTTPClient
+from valorant import Language
+from valorant.cache import CachePolicy, SQLiteCache, make_cache_key
+from valorant.errors import NotFound
+from valorant.http import HTTPClient, Route
+from valorant.stats import LatencyHistogram
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from .conftest import FakeAPI
+
 
 @pytest.mark.anyio
 @pytest.mark.parametrize('enable_cache', [True, False])
@@ -20,12 +29,12 @@ async def test_cache(enable_cache: bool, tmp_path: Path) -> None:
 
     try:
         await http_client.start()
-        assert http_client._session is not None
+        assert isinstance(http_client._session, ClientSession)
 
         if enable_cache:
-            assert isinstance(http_client._session, CachedSession)
+            assert isinstance(http_client._cache, SQLiteCache)
         else:
-            assert isinstance(http_client._session, ClientSession)
+            assert http_client._cache is None
 
     finally:
         await http_client.close()
@@ -44,7 +53,744 @@ async def test_custom_cache_path(tmp_path: Path) -> None:
         # try to request for initialize the cache
         await http_client.get_agent('add6443a-41bd-e414-f6ad-e58d267f4e95')  # Jett
 
-        assert (cache_path / 'aiohttp-cache.db').exists(), 'Cache database should exist after initialization'
+        assert (cache_path / 'valorant-cache.db').exists(), 'Cache database should exist after initialization'
+
+    finally:
+        await http_client.close()
+
+
+def test_make_cache_key() -> None:
+    assert make_cache_key('/agents') == '/agents'
+    assert make_cache_key('/agents', {'language': 'ja-JP', 'isPlayableCharacter': 'True'}) == (
+        '/agents?isPlayableCharacter=true&language=ja-JP'
+    )
+    assert make_cache_key('/agents', {'language': 'ja-JP', 'isPlayableCharacter': 'True'}, normalize=False) == (
+        '/agents?language=ja-JP&isPlayableCharacter=True'
+    )
+
+
+@pytest.mark.parametrize(
+    ('path', 'params'),
+    [
+        ('/agents', {'language': 'en-US'}),
+        ('/agents', {'language': Language.american_english}),
+        ('/agents', {'language': None}),
+        ('/Agents', {}),
+    ],
+)
+def test_make_cache_key_default_language(path: str, params: dict[str, Any]) -> None:
+    assert make_cache_key(path, params) == '/agents'
+
+
+def test_make_cache_key_normalization() -> None:
+    assert make_cache_key('/agents', {'isPlayableCharacter': True}) == (
+        make_cache_key('/agents', {'isPlayableCharacter': 'true'})
+    )
+    assert make_cache_key('/agents/ADD6443A-41BD-E414-F6AD-E58D267F4E95', {'language': Language.japanese}) == (
+        '/agents/add6443a-41bd-e414-f6ad-e58d267f4e95?language=ja-JP'
+    )
+
+
+@pytest.mark.parametrize('compression', ['zlib', 'identity'])
+def test_sqlite_cache_round_trip(compression: str, tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db', compression=compression)  # type: ignore[arg-type]
+    body = b'{"status": 200, "data": []}' * 100
+
+    try:
+        assert cache.get('/agents') is None
+
+        cache.set('/agents', body, route='/agents', language='ja-JP', expire_after=60, manifest='abc')
+        entry = cache.get('/agents')
+        assert entry is not None
+        assert entry.body == body
+        assert entry.language == 'ja-JP'
+        assert entry.manifest == 'abc'
+        assert len(cache) == 1
+
+        assert cache.delete('/agents')
+        assert cache.get('/agents') is None
+    finally:
+        cache.close()
+
+
+def test_sqlite_cache_expired(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db')
+
+    try:
+        cache.set('/agents', b'{}', route='/agents', expire_after=-1)
+        assert cache.get('/agents') is None
+        assert cache.get('/agents', include_expired=True) is not None
+
+        assert cache.delete_expired() == 1
+        assert len(cache) == 0
+    finally:
+        cache.close()
+
+
+def test_sqlite_cache_schema_upgrade(tmp_path: Path) -> None:
+    path = tmp_path / 'cache.db'
+    cache = SQLiteCache(path)
+    cache.set('/agents', b'{}', route='/agents')
+    cache.conn.execute('PRAGMA user_version = 0')
+    cache.close()
+
+    cache = SQLiteCache(path)
+    try:
+        assert len(cache) == 0
+    finally:
+        cache.close()
+
+
+@pytest.mark.anyio
+async def test_cache_hit(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    http_client = HTTPClient(cache_path=tmp_path)
+
+    try:
+        await http_client.start()
+        first = await http_client.get_agents(language='ja-JP')
+        second = await http_client.get_agents(language='ja-JP')
+    finally:
+        await http_client.close()
+
+    assert first == second == {'status': 200, 'data': [{'uuid': 'a'}]}
+    assert api_server.requests['/agents'] == 1
+
+
+@pytest.mark.anyio
+async def test_cache_not_found(api_server: FakeAPI, tmp_path: Path) -> None:
+    http_client = HTTPClient(cache_path=tmp_path)
+
+    try:
+        await http_client.start()
+        for _ in range(2):
+            with pytest.raises(NotFound) as exc_info:
+                await http_client.get_agent('fake-agent-id')
+            assert exc_info.value.status == 404
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/agents/fake-agent-id'] == 1
+
+
+@pytest.mark.anyio
+async def test_cache_no_store(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/version', {'manifestId': 'ABC'})
+    http_client = HTTPClient(cache_path=tmp_path)
+
+    try:
+        await http_client.start()
+        await http_client.get_version()
+        await http_client.get_version()
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/version'] == 2
+    assert http_client.manifest_id == 'ABC'
+
+
+@pytest.mark.parametrize(
+    ('path', 'ttl'),
+    [
+        ('/version', 0),
+        ('/events/{uuid}', 60 * 60),
+        ('/weapons/skins/{uuid}', 3 * 24 * 60 * 60),
+        ('/unknown', 24 * 60 * 60),
+    ],
+)
+def test_cache_policy_lookup(path: str, ttl: int) -> None:
+    http_client = HTTPClient()
+    assert http_client.get_cache_policy(Route('GET', path, uuid='x')).ttl == ttl
+
+
+def test_cache_policy_overrides() -> None:
+    http_client = HTTPClient(
+        cache_ttl=30,
+        cache_policies={'/weapons/skins': CachePolicy(ttl=5)},
+    )
+
+    assert http_client.get_cache_policy(Route('GET', '/version')).ttl == 0
+    assert http_client.get_cache_policy(Route('GET', '/agents')).ttl == 30
+    assert http_client.get_cache_policy(Route('GET', '/weapons/skins/{uuid}', uuid='x')).ttl == 5
+    assert http_client.get_cache_policy(Route('GET', '/weapons/skinlevels')).ttl == 30
+
+
+@pytest.mark.anyio
+async def test_cache_policy_not_found(api_server: FakeAPI, tmp_path: Path) -> None:
+    http_client = HTTPClient(cache_path=tmp_path)
+
+    try:
+        await http_client.start()
+        for _ in range(2):
+            with pytest.raises(NotFound):
+                await http_client.get_event('upcoming-event')
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/events/upcoming-event'] == 2
+
+
+@pytest.mark.anyio
+async def test_cache_policy_stale_if_error(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    http_client = HTTPClient(cache_path=tmp_path, cache_policies={'/agents': CachePolicy(ttl=60, allow_stale=True)})
+
+    try:
+        await http_client.start()
+        assert isinstance(http_client._cache, SQLiteCache)
+        await http_client.get_agents()
+        http_client._cache.conn.execute('UPDATE responses SET expires_at = 0')
+
+        api_server.fail_with = 503
+        assert await http_client.get_agents() == {'status': 200, 'data': [{'uuid': 'a'}]}
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/agents'] == 2
+
+
+def test_sqlite_cache_default_pragmas(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db')
+
+    try:
+        assert cache.conn.execute('PRAGMA journal_mode').fetchone() == ('wal',)
+        assert cache.conn.execute('PRAGMA synchronous').fetchone() == (1,)  # normal
+        assert cache.conn.execute('PRAGMA busy_timeout').fetchone() == (5,)
+    finally:
+        cache.close()
+
+
+def test_sqlite_cache_custom_pragmas(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db', pragmas={'journal_mode': 'delete', 'cache_size': -1024})
+
+    try:
+        assert cache.conn.execute('PRAGMA journal_mode').fetchone() == ('delete',)
+        assert cache.conn.execute('PRAGMA cache_size').fetchone() == (-1024,)
+    finally:
+        cache.close()
+
+
+@pytest.mark.parametrize(
+    ('pragmas'),
+    [
+        ({'foreign_keys': 1}),
+        ({'journal_mode': 'wal; DROP TABLE responses'}),
+    ],
+)
+def test_sqlite_cache_invalid_pragmas(pragmas: dict[str, int | str], tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match='pragma'):
+        SQLiteCache(tmp_path / 'cache.db', pragmas=pragmas)
+
+
+@pytest.mark.anyio
+async def test_http_client_cache_pragmas(tmp_path: Path) -> None:
+    http_client = HTTPClient(cache_path=tmp_path, cache_pragmas={'synchronous': 'full'})
+
+    try:
+        await http_client.start()
+        assert isinstance(http_client._cache, SQLiteCache)
+        assert http_client._cache.conn.execute('PRAGMA synchronous').fetchone() == (2,)  # full
+    finally:
+        await http_client.close()
+
+
+def test_sqlite_cache_locked(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db')
+    cache.set('/agents', b'agents', route='/agents')
+    token = cache.acquire('/maps', 30)
+    assert token is not None
+    other = sqlite3.connect(tmp_path / 'cache.db', isolation_level=None)
+    try:
+        # Another process holding the write lock does not hold up the event loop.
+        other.execute('BEGIN IMMEDIATE')
+        cache.set('/buddies', b'buddies', route='/buddies')
+        entry = cache.get('/buddies')
+        assert entry is not None
+        assert entry.body == b'buddies'
+        assert cache.pending == 1
+        assert cache.acquire_or_get('/sprays', 30) == (None, None)
+        assert cache.release('/maps', token)
+        other.rollback()
+
+        cache.set('/themes', b'themes', route='/themes')
+        assert cache.pending == 0
+        assert [info.key for info in cache.entries()] == ['/agents', '/buddies', '/themes']
+        assert cache.acquire('/maps', 30) is not None
+    finally:
+        other.close()
+        cache.close()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('backend', ['sqlite', 'filesystem'])
+async def test_legacy_cache_removed(backend: str, tmp_path: Path) -> None:
+    legacy = tmp_path / HTTPClient.LEGACY_CACHE_FILENAME
+    legacy.write_bytes(b'')
+    legacy.with_name(legacy.name + '-wal').write_bytes(b'')
+    http_client = HTTPClient(cache_path=tmp_path, cache_backend=backend)  # type: ignore[arg-type]
+
+    try:
+        await http_client.start()
+    finally:
+        await http_client.close()
+
+    assert not any(name.startswith(HTTPClient.LEGACY_CACHE_FILENAME) for name in os.listdir(tmp_path))
+
+
+def _fill(cache: SQLiteCache, count: int, size: int = 1024) -> None:
+    for i in range(count):
+        cache.set(f'/sprays/{i}', bytes(size), route='/sprays/{uuid}', expire_after=60)
+
+
+@pytest.mark.parametrize(
+    ('eviction', 'survivor'),
+    [
+        ('lru', '/sprays/3'),  # accessed most recently
+        ('lfu', '/sprays/0'),  # accessed most often
+    ],
+)
+def test_sqlite_cache_evict(eviction: str, survivor: str, tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db', compression='identity', eviction=eviction)  # type: ignore[arg-type]
+
+    try:
+        _fill(cache, 4)
+        for _ in range(3):
+            cache.get('/sprays/0')
+        cache.get('/sprays/3')
+
+        assert cache.evict(10 * 1024) == 0
+        assert cache.evict(1024, batch=1) == 1
+        while cache.evict(1024, batch=1):
+            pass
+
+        assert cache.total_size() <= 1024
+        assert cache.get(survivor) is not None
+    finally:
+        cache.close()
+
+
+def test_sqlite_cache_evict_expired_first(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db', compression='identity')
+
+    try:
+        cache.set('/sprays/expired', bytes(1024), route='/sprays/{uuid}', expire_after=-1)
+        _fill(cache, 1)
+
+        assert cache.evict(1024) == 1
+        assert cache.get('/sprays/expired', include_expired=True) is None
+        assert cache.get('/sprays/0') is not None
+    finally:
+        cache.close()
+
+
+def test_sqlite_cache_compact(tmp_path: Path) -> None:
+    path = tmp_path / 'cache.db'
+    cache = SQLiteCache(path, compression='identity')
+
+    try:
+        _fill(cache, 64, size=16 * 1024)
+        cache.compact()
+        size = path.stat().st_size
+
+        cache.clear()
+        assert cache.compact() > 0
+        assert path.stat().st_size < size
+    finally:
+        cache.close()
+
 
+@pytest.mark.anyio
+async def test_http_client_trim_cache(api_server: FakeAPI, tmp_path: Path) -> None:
+    for i in range(8):
+        api_server.add(f'/sprays/{i}', {'uuid': str(i), 'padding': os.urandom(1024).hex()})
+    http_client = HTTPClient(cache_path=tmp_path, max_cache_bytes=1024)
+
+    try:
+        await http_client.start()
+        assert http_client._maintenance_task is not None
+        for i in range(8):
+            await http_client.get_spray(str(i))
+
+        assert http_client._cache is not None
+        assert await http_client.trim_cache() > 0
+        assert http_client._cache.total_size() <= 1024
+    finally:
+        await http_client.close()
+
+    assert http_client._maintenance_task is None
+
+
+def test_sqlite_cache_entries_and_purge(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db')
+
+    try:
+        cache.set('/agents?language=en-US', b'{}', route='/agents', language='en-US')
+        cache.set('/agents?language=ja-JP', b'{}', route='/agents', language='ja-JP')
+        cache.set('/weapons/skinlevels/a?language=ja-JP', b'{}', route='/weapons/skinlevels/{uuid}', language='ja-JP')
+        cache.set('/weapons/skins/b', b'{}', route='/weapons/skins/{uuid}')
+
+        assert len(cache.entries()) == 4
+        assert [entry.key for entry in cache.entries('/weapons/*')] == [
+            '/weapons/skinlevels/a?language=ja-JP',
+            '/weapons/skins/b',
+        ]
+        assert len(cache.entries(language='ja-JP')) == 2
+        assert {(usage.route, usage.language, usage.entries) for usage in cache.usage()} == {
+            ('/agents', 'en-US', 1),
+            ('/agents', 'ja-JP', 1),
+            ('/weapons/skinlevels/{uuid}', 'ja-JP', 1),
+            ('/weapons/skins/{uuid}', '', 1),
+        }
+
+        assert cache.purge('/agents', language='ja-JP') == 1
+        assert cache.purge('/weapons/skins/{uuid}') == 1
+        assert [entry.key for entry in cache.entries()] == [
+            '/agents?language=en-US',
+            '/weapons/skinlevels/a?language=ja-JP',
+        ]
+    finally:
+        cache.close()
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram()
+    for seconds in (0.0001, 0.0002, 0.003, 10.0):
+        histogram.observe(seconds)
+
+    assert histogram.count == 4
+    assert histogram.percentile(50) == pytest.approx(0.0005)
+    assert histogram.percentile(75) == pytest.approx(0.005)
+    assert histogram.percentile(100) == float('inf')
+    assert histogram.to_dict()['buckets']['le_inf'] == 1
+
+
+@pytest.mark.anyio
+async def test_cache_stats(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    api_server.add('/weapons/skinlevels/a', {'uuid': 'a'})
+    http_client = HTTPClient(cache_path=tmp_path, cache_policies={'/agents': CachePolicy(ttl=60, allow_stale=True)})
+
+    try:
+        await http_client.start()
+        for _ in range(3):
+            await http_client.get_weapon_skin_level('a', language='ja-JP')
+        await http_client.get_agents()
+
+        assert isinstance(http_client._cache, SQLiteCache)
+        http_client._cache.conn.execute("UPDATE responses SET expires_at = 0 WHERE route = '/agents'")
+        api_server.fail_with = 503
+        await http_client.get_agents()
+
+        stats = http_client.cache_stats()
+    finally:
+        await http_client.close()
+
+    skin_levels = stats.routes['/weapons/skinlevels/{uuid}']
+    assert (skin_levels.hits, skin_levels.misses, skin_levels.stale) == (2, 1, 0)
+    assert skin_levels.hit_ratio == pytest.approx(2 / 3)
+    assert skin_levels.entries == 1
+    assert skin_levels.hit_latency.count == 2
+
+    agents = stats.routes['/agents']
+    assert (agents.hits, agents.misses, agents.stale) == (0, 1, 1)
+
+    assert stats.languages['ja-JP'].stored_size > 0
+    assert stats.total.entries == 2
+    assert stats.to_dict()['total']['hits'] == 2
+
+
+@pytest.mark.anyio
+async def test_cache_key_dedup(api_server: FakeAPI, tmp_path: Path) -> None:
+    uuid = 'add6443a-41bd-e414-f6ad-e58d267f4e95'
+    api_server.add('/agents', [{'uuid': 'e370fa57-4757-3604-3648-499e1f642d3f'}])
+    api_server.add(f'/agents/{uuid}', {'uuid': uuid})
+    api_server.add(f'/agents/{uuid.upper()}', {'uuid': uuid})
+    http_client = HTTPClient(cache_path=tmp_path)
+
+    try:
+        await http_client.start()
+        await http_client.get_agent(uuid.upper())
+        await http_client.get_agent(uuid)
+        await http_client.get_agents()
+        await http_client.get_agents(language='en-US')
+        await http_client.get_agents(language=Language.american_english)
+        stats = http_client.cache_stats()
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/agents'] == 1
+    assert api_server.requests[f'/agents/{uuid.upper()}'] == 1
+    assert api_server.requests[f'/agents/{uuid}'] == 0
+
+    agents = stats.routes['/agents']
+    assert (agents.hits, agents.misses, agents.normalized) == (2, 1, 2)
+    assert agents.dedup_rate == pytest.approx(2 / 3)
+    assert set(stats.languages) == {'en-US'}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('enable_cache', [True, False])
+async def test_request_coalescing(enable_cache: bool, api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    http_client = HTTPClient(enable_cache=enable_cache, cache_path=tmp_path)
+
+    try:
+        await http_client.start()
+        results = await asyncio.gather(*(http_client.get_agents() for _ in range(5)))
+        stats = http_client.cache_stats()
+    finally:
+        await http_client.close()
+
+    assert all(result == {'status': 200, 'data': [{'uuid': 'a'}]} for result in results)
+    assert api_server.requests['/agents'] == 1
+    assert not http_client._inflight
+    if enable_cache:
+        assert (stats.total.misses, stats.total.coalesced) == (1, 4)
+
+
+WEAPONS = [
+    {
+        'uuid': 'w1',
+        'skins': [
+            {
+                'uuid': 's1',
+                'chromas': [{'uuid': 'c1'}, {'uuid': 'c2'}],
+                'levels': [{'uuid': 'l1'}],
+            },
+            {
+                'uuid': 's2',
+                'chromas': [],
+                'levels': [{'uuid': 'L2'}],
+            },
+        ],
+    },
+]
+
+
+@pytest.mark.anyio
+async def test_derive_from_parent_list(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/weapons', WEAPONS)
+    http_client = HTTPClient(cache_path=tmp_path)
+
+    try:
+        await http_client.start()
+        await http_client.get_weapons(language='ja-JP')
+
+        assert await http_client.get_weapon('w1', language='ja-JP') == {'status': 200, 'data': WEAPONS[0]}
+        skin = await http_client.get_weapon_skin('s1', language='ja-JP')
+        assert skin['data']['uuid'] == 's1'
+        assert (await http_client.get_weapon_skin_level('l2', language='ja-JP'))['data'] == {'uuid': 'L2'}
+        levels = await http_client.get_weapon_skin_levels(language='ja-JP')
+        assert levels == {'status': 200, 'data': [{'uuid': 'l1'}, {'uuid': 'L2'}]}
+        chromas = await http_client.get_weapon_skin_chromas(language='ja-JP')
+        assert [chroma['uuid'] for chroma in chromas['data']] == ['c1', 'c2']
+
+        stats = http_client.cache_stats()
     finally:
         await http_client.close()
+
+    assert list(api_server.requests) == ['/weapons']
+    assert stats.total.derived == 5
+    assert stats.routes['/weapons/skinlevels/{uuid}'].derived == 1
+
+
+@pytest.mark.anyio
+async def test_derive_falls_back_to_upstream(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/weapons', WEAPONS)
+    api_server.add('/weapons/skins/s1', WEAPONS[0]['skins'][0])
+    http_client = HTTPClient(cache_path=tmp_path)
+
+    try:
+        await http_client.start()
+        await http_client.get_weapons()
+
+        # not in the parent list, rejected by its uuid filter
+        with pytest.raises(NotFound):
+            await http_client.get_weapon_skin('unknown')
+        # the parent was cached in another language
+        await http_client.get_weapon_skin('s1', language='ja-JP')
+
+        # the parent has expired
+        assert isinstance(http_client._cache, SQLiteCache)
+        http_client._cache.conn.execute('UPDATE responses SET expires_at = 0')
+        await http_client.get_weapon_skin('s1')
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/weapons/skins/unknown'] == 0
+    assert api_server.requests['/weapons/skins/s1'] == 2
+
+
+def test_sqlite_cache_write_behind(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db', write_behind=True, max_pending=3)
+    other = SQLiteCache(tmp_path / 'cache.db')
+
+    try:
+        cache.set('/agents', b'agents', route='/agents')
+        cache.set('/maps', b'maps', route='/maps', expire_after=-1)
+        assert cache.pending == 2
+        assert len(other) == 0
+
+        entry = cache.get('/agents')
+        assert entry is not None
+        assert entry.body == b'agents'
+        assert cache.get('/maps') is None
+        info = cache.info('/agents')
+        assert info is not None
+        assert info.size == len(b'agents')
+
+        # the fetch lock is released together with the entry
+        token = cache.acquire('/buddies', 30)
+        assert token is not None
+        cache.set('/buddies', b'buddies', route='/buddies')
+        assert cache.pending == 0
+        assert cache.release('/buddies', token)
+        assert len(other) == 3
+
+        cache.set('/sprays', b'sprays', route='/sprays')
+        token = cache.acquire('/sprays', 30)
+        assert token is not None
+        cache.release('/sprays', token)
+        assert other.acquire('/sprays', 30) is None
+        assert cache.delete('/agents')
+        assert cache.flush() == 1
+        assert other.acquire('/sprays', 30) is not None
+
+        assert (cache.write_stats.flushes, cache.write_stats.flushed, cache.write_stats.max_pending) == (2, 4, 3)
+        cache.set('/themes', b'themes', route='/themes')
+    finally:
+        cache.close()
+        other.close()
+
+    cache = SQLiteCache(tmp_path / 'cache.db')
+    try:
+        assert sorted(info.key for info in cache.entries()) == ['/buddies', '/maps', '/sprays', '/themes']
+    finally:
+        cache.close()
+
+
+@pytest.mark.anyio
+async def test_http_client_write_behind(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    http_client = HTTPClient(cache_path=tmp_path, cache_write_behind=True)
+
+    try:
+        await http_client.start()
+        await http_client.get_agents()
+        await http_client.get_agents()
+
+        assert http_client._cache is not None
+        assert http_client._cache.pending == 1
+        stats = http_client.cache_stats()
+    finally:
+        await http_client.close()
+
+    assert (stats.writes.pending, stats.writes.flushes, stats.writes.flushed) == (1, 1, 1)
+    assert stats.total.entries == 1
+    assert api_server.requests['/agents'] == 1
+
+    http_client = HTTPClient(cache_path=tmp_path)
+    try:
+        await http_client.start()
+        await http_client.get_agents()
+    finally:
+        await http_client.close()
+    assert api_server.requests['/agents'] == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('threaded', [True, False])
+async def test_hydrate(threaded: bool, api_server: FakeAPI, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    api_server.add('/agents', [{'uuid': 'a', 'displayName': 'Jett'}])
+    api_server.add('/weapons', WEAPONS)
+    http_client = HTTPClient(cache_path=tmp_path)
+    try:
+        await http_client.start()
+        with pytest.raises(NotFound):
+            await http_client.get_agent('missing')
+        await http_client.get_agents()
+        await http_client.get_weapons(language='ja-JP')
+    finally:
+        await http_client.close()
+
+    http_client = HTTPClient(cache_path=tmp_path)
+    try:
+        await http_client.start()
+        report = await http_client.hydrate(threaded=threaded)
+        assert http_client.hydration == report
+
+        def no_reads(*args: Any, **kwargs: Any) -> None:
+            pytest.fail('a body was read from the cache backend')
+
+        assert http_client._cache is not None
+        monkeypatch.setattr(http_client._cache, 'get', no_reads)
+        assert (await http_client.get_agents())['data'][0]['displayName'] == 'Jett'
+        assert (await http_client.get_weapons(language='ja-JP'))['data'] == WEAPONS
+        stats = http_client.cache_stats()
+    finally:
+        await http_client.close()
+
+    # The cached 404 is not loaded.
+    assert report.entries == 2
+    assert report.size > 0
+    assert report.resident > 0
+    assert report.elapsed > 0
+    assert (stats.total.hits, stats.total.misses) == (2, 0)
+    assert api_server.requests == {'/agents': 1, '/weapons': 1, '/agents/missing': 1}
+
+
+@pytest.mark.anyio
+async def test_hydrated_entry_replaced(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    http_client = HTTPClient(cache_path=tmp_path)
+    try:
+        await http_client.start()
+        await http_client.get_agents()
+        await http_client.hydrate()
+        assert http_client.hydration is not None
+        assert http_client.hydration.entries == 1
+
+        api_server.add('/agents', [{'uuid': 'b'}])
+        assert http_client.purge_cache('/agents') == 1
+        assert (await http_client.get_agents())['data'] == [{'uuid': 'b'}]
+        assert (await http_client.get_agents())['data'] == [{'uuid': 'b'}]
+    finally:
+        await http_client.close()
+
+    assert api_server.requests['/agents'] == 2
+
+
+@pytest.mark.anyio
+async def test_hydrated_responses_are_copies(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/weapons', WEAPONS)
+    http_client = HTTPClient(cache_path=tmp_path, cache_write_behind=True)
+    try:
+        await http_client.start()
+        await http_client.get_weapons()
+        assert http_client._cache is not None
+        flushed_on: list[threading.Thread] = []
+        flush = http_client._cache.flush
+
+        def record_flush() -> int:
+            flushed_on.append(threading.current_thread())
+            return flush()
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(http_client._cache, 'flush', record_flush)
+            await http_client.hydrate(threaded=True)
+        # The queue is written on the event loop thread only, not by the scan in the worker thread.
+        assert flushed_on == [threading.main_thread()]
+        assert http_client.hydration is not None
+        assert http_client.hydration.entries == 1
+
+        weapons = await http_client.get_weapons()
+        weapons['data'][0]['skins'].clear()
+        weapons['data'].clear()
+        assert (await http_client.get_weapons())['data'] == WEAPONS
+        skins = await http_client.get_weapon_skins()
+        skins['data'].clear()
+        assert (await http_client.get_weapon_skins())['data'] == WEAPONS[0]['skins']
+    finally:
+        await http_client.close()
+
+    assert api_server.requests == {'/weapons': 1}
@@ -1,16 +1,79 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 from typing import TYPE_CHECKING, Literal
 
 import pytest
+from pydantic import ValidationError
 
 from valorant import Client
 from valorant.enums import Language
 from valorant.errors import NotFound
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from valorant.client import LanguageOption
 
+    from .conftest import FakeAPI
+
+
+def test_import_is_lazy() -> None:
+    code = (
+        'import sys, valorant; valorant.Client(); '
+        "print(*sorted({'aiohttp', 'pydantic', 'sqlite3', 'valorant.models.agents'}.intersection(sys.modules)))"
+    )
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    # aiohttp is loaded by the client for its user agent, the models and the cache database only when used
+    assert output.split() == ['aiohttp']
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('validation', ['strict', 'lax', 'trusted'])
+async def test_fetch_fields(
+    api_server: FakeAPI, tmp_path: Path, validation: Literal['strict', 'lax', 'trusted']
+) -> None:
+    chroma = {
+        'uuid': '19629ae1-4996-ae98-7742-24a240d41f99',
+        'displayName': 'Chroma',
+        'displayIcon': None,
+        'fullRender': 'https://media.valorant-api.com/fullrender.png',
+        'swatch': None,
+        'streamedVideo': None,
+        'assetPath': 'ShooterGame/Content/Equippables/Guns/Chroma',
+    }
+    api_server.add('/weapons/skinchromas', [chroma])
+
+    async with Client(cache_path=tmp_path, validation=validation) as client:
+        chromas = await client.fetch_skin_chromas()
+        (projected,) = projection = await client.fetch_skin_chromas(fields=['uuid', 'display_name'])
+
+    (full,) = chromas
+    assert chromas.model is projection.model is type(full)
+
+    assert type(projected) is type(full)
+    assert projected.model_fields_set == {'uuid', 'display_name'}
+    assert (projected.uuid, projected.display_name) == (full.uuid, full.display_name)
+    with pytest.raises(AttributeError):
+        _ = projected.full_render
+
+
+@pytest.mark.anyio
+async def test_trusted_validates_api_responses(api_server: FakeAPI, tmp_path: Path) -> None:
+    chroma = {'uuid': '19629ae1-4996-ae98-7742-24a240d41f99', 'displayName': 'Chroma', 'fullRender': 1}
+    api_server.add('/weapons/skinchromas', [chroma])
+
+    async with Client(cache_path=tmp_path, validation='trusted') as client:
+        with pytest.raises(ValidationError):
+            await client.fetch_skin_chromas()
+        assert client.http.served_locally() is False
+
+        # stored before it was validated, the cache is trusted
+        (trusted,) = await client.fetch_skin_chromas()
+        assert client.http.served_locally() is True
+    assert trusted.full_render == 1  # type: ignore[comparison-overlap]
+
 
 @pytest.mark.anyio
 async def test_client_start_close() -> None:
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import aiohttp
 import pytest
 
+from valorant.__main__ import build_parser, prefetch
 from valorant.http import HTTPClient
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from valorant.http import PrefetchProgress
+
+    from .conftest import FakeAPI
+
 
 @pytest.mark.anyio
 async def test_http_client_start_close() -> None:
@@ -59,3 +69,78 @@ async def test_http_client_with_custom_session() -> None:
 
     await http_client.close()
     assert http_client._session.closed
+
+
+@pytest.mark.anyio
+async def test_http_client_prefetch(api_server: FakeAPI, tmp_path: Path) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    api_server.add('/seasons/competitive', [{'uuid': 'c'}])
+    http_client = HTTPClient(cache_path=tmp_path)
+    progress: list[PrefetchProgress] = []
+
+    try:
+        await http_client.start()
+        report = await http_client.prefetch(
+            ['/agents', '/maps', '/seasons/competitive'],
+            ['en-US', 'ja-JP'],
+            concurrency=2,
+            progress=progress.append,
+        )
+        assert http_client.cache_entries('/agents', language='ja-JP')
+
+        again = await http_client.prefetch(['/agents'], ['en-US', 'ja-JP'])
+    finally:
+        await http_client.close()
+
+    # /seasons/competitive is not localized and only fetched once
+    assert report.requests == len(progress) == 5
+    assert sorted((failure.endpoint, failure.language) for failure in report.failures) == [
+        ('/maps', 'en-US'),
+        ('/maps', 'ja-JP'),
+    ]
+    assert report.downloaded > 0
+    assert report.stored > 0
+    assert progress[-1].done == progress[-1].total == 5
+
+    assert again.downloaded == 0
+    assert api_server.requests['/agents'] == 2
+
+
+@pytest.mark.anyio
+async def test_http_client_prefetch_unknown_endpoint() -> None:
+    http_client = HTTPClient(enable_cache=False)
+    with pytest.raises(ValueError, match='unknown list endpoints'):
+        await http_client.prefetch(['/agents/{uuid}'])
+
+
+@pytest.mark.anyio
+async def test_prefetch_command(api_server: FakeAPI, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    api_server.add('/agents', [{'uuid': 'a'}])
+    args = build_parser().parse_args(['prefetch', '-e', '/agents', '-l', 'ja-JP', '--cache-path', str(tmp_path)])
+
+    assert await prefetch(args) == 0
+    assert 'prefetched 1/1 responses' in capsys.readouterr().out
+    assert (tmp_path / HTTPClient.CACHE_FILENAME).exists()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('intern_strings', [True, False])
+async def test_http_client_intern_strings(intern_strings: bool, api_server: FakeAPI, tmp_path: Path) -> None:
+    # built at runtime so that neither the literals nor the JSON decoder share the objects
+    category = ''.join(['EEquippableCategory::', 'Heavy'])
+    url = 'https://media.valorant-api.com/' + 'x' * 64
+    api_server.add('/weapons', [{'uuid': 'a', 'category': category, 'displayIcon': url}])
+    api_server.add('/gear', [{'uuid': 'b', 'category': category, 'displayIcon': url}])
+    http_client = HTTPClient(cache_path=tmp_path, intern_strings=intern_strings)
+
+    try:
+        await http_client.start()
+        weapon = (await http_client.get_weapons())['data'][0]
+        gear = (await http_client.get_all_gear())['data'][0]
+    finally:
+        await http_client.close()
+
+    assert weapon['category'] == gear['category'] == category
+    assert (weapon['category'] is gear['category']) is intern_strings
+    # long strings are left alone
+    assert weapon['displayIcon'] is not gear['displayIcon']
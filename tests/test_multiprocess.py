@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from typing import TYPE_CHECKING, Any
+
+import anyio
+import pytest
+
+from valorant.cache import SQLiteCache
+from valorant.http import HTTPClient, Route
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from multiprocessing.synchronize import Barrier
+    from pathlib import Path
+
+    from .conftest import FakeAPI
+
+WORKERS = 8
+
+
+def _worker(base: str, cache_path: str, path: str, barrier: Barrier, results: Queue[Any]) -> None:
+    Route.BASE = base
+
+    async def main() -> tuple[Any, int, int]:
+        http_client = HTTPClient(cache_path=cache_path)
+        try:
+            await http_client.start()
+            barrier.wait()
+            data = await http_client.request(Route('GET', path))
+            stats = http_client.cache_stats()
+        finally:
+            await http_client.close()
+        return data, stats.total.misses, stats.total.coalesced
+
+    results.put(asyncio.run(main()))
+
+
+@pytest.mark.anyio
+async def test_cross_process_singleflight(api_server: FakeAPI, tmp_path: Path) -> None:
+    skins = [{'uuid': 'a'}, {'uuid': 'b'}]
+    api_server.add('/weapons/skins', skins)
+    api_server.delay = 0.5
+
+    ctx = multiprocessing.get_context('spawn')
+    barrier = ctx.Barrier(WORKERS)
+    results: Queue[Any] = ctx.Queue()
+    processes = [
+        ctx.Process(target=_worker, args=(Route.BASE, str(tmp_path), '/weapons/skins', barrier, results))
+        for _ in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        outcomes = [await anyio.to_thread.run_sync(results.get, True, 60) for _ in processes]
+    finally:
+        for process in processes:
+            process.join(10)
+
+    assert [process.exitcode for process in processes] == [0] * WORKERS
+    assert api_server.requests['/weapons/skins'] == 1
+    assert all(data == {'status': 200, 'data': skins} for data, _, _ in outcomes)
+    assert sorted((misses, coalesced) for _, misses, coalesced in outcomes) == [(0, 1)] * (WORKERS - 1) + [(1, 0)]
+
+
+def test_fetch_lock(tmp_path: Path) -> None:
+    first = SQLiteCache(tmp_path / 'cache.db')
+    second = SQLiteCache(tmp_path / 'cache.db')
+
+    try:
+        token = first.acquire('/agents', 30)
+        assert token is not None
+        assert second.acquire('/agents', 30) is None
+        assert second.acquire('/maps', 30) is not None
+
+        assert first.release('/agents', token)
+        assert not first.release('/agents', token)
+        abandoned = second.acquire('/agents', 0)
+        assert abandoned is not None
+
+        # an expired lock is taken over and can no longer be released by its previous holder
+        token = first.acquire('/agents', 30)
+        assert token is not None
+        assert not second.release('/agents', abandoned)
+        assert first.release('/agents', token)
+    finally:
+        first.close()
+        second.close()
+
+
+def _use_inherited_cache(cache: SQLiteCache) -> None:
+    entry = cache.get('/agents')
+    assert entry is not None
+    assert entry.body == b'parent'
+    cache.set('/maps', b'child', route='/maps')
+    cache.close()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork()')
+@pytest.mark.filterwarnings('ignore:This process .* is multi-threaded:DeprecationWarning')
+def test_cache_after_fork(tmp_path: Path) -> None:
+    cache = SQLiteCache(tmp_path / 'cache.db')
+    try:
+        cache.set('/agents', b'parent', route='/agents')
+        conn = cache.conn
+
+        process = multiprocessing.get_context('fork').Process(target=_use_inherited_cache, args=(cache,))
+        process.start()
+        process.join(30)
+
+        assert process.exitcode == 0
+        assert cache.conn is conn
+        entry = cache.get('/maps')
+        assert entry is not None
+        assert entry.body == b'child'
+    finally:
+        cache.close()
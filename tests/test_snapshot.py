@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import struct
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from valorant import Client, Language
+from valorant.errors import NotFound, SnapshotError
+from valorant.http import HTTPClient, Route
+from valorant.snapshot import Snapshot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .conftest import FakeAPI
+
+VERSION = {
+    'manifestId': 'ABC',
+    'branch': 'release-09.00',
+    'version': '09.00.00.2366133',
+    'buildVersion': '12',
+    'engineVersion': '4.26.2.0',
+    'riotClientVersion': 'release-09.00-shipping-12-2366133',
+    'riotClientBuild': '84.0.1.887.1386',
+    'buildDate': '2024-06-24T00:00:00Z',
+}
+
+
+def _write(path: Path) -> None:
+    Snapshot.write(
+        path,
+        {
+            ('/agents', ''): b'{"status":200,"data":[{"uuid":"A1"}]}',
+            ('/agents', 'ja-JP'): b'{"status":200,"data":[{"uuid":"a1","name":"ja"}]}',
+        },
+        manifest='ABC',
+        compression='zlib',
+    )
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / 'catalog.snapshot'
+    _write(path)
+    snapshot = Snapshot.load(path)
+    assert not snapshot.indexed
+
+    assert snapshot.manifest == 'ABC'
+    assert len(snapshot.entries) == len(snapshot) == 2
+    assert snapshot.read('/agents', 'ja-JP') == b'{"status":200,"data":[{"uuid":"a1","name":"ja"}]}'
+    assert snapshot.read('/maps') is None
+
+    assert snapshot.lookup(Route('GET', '/agents')) == {'status': 200, 'data': [{'uuid': 'A1'}]}
+    assert snapshot.lookup(Route('GET', '/agents/{uuid}', uuid='a1'), 'ja-JP') == {
+        'status': 200,
+        'data': {'uuid': 'a1', 'name': 'ja'},
+    }
+    assert snapshot.lookup(Route('GET', '/agents/{uuid}', uuid='a1')) == {'status': 200, 'data': {'uuid': 'A1'}}
+    with pytest.raises(NotFound):
+        snapshot.lookup(Route('GET', '/agents/{uuid}', uuid='missing'))
+
+    # not covered by the snapshot
+    assert snapshot.lookup(Route('GET', '/agents'), 'de-DE') is None
+    assert snapshot.lookup(Route('GET', '/maps/{uuid}', uuid='m')) is None
+    snapshot.close()
+
+
+def test_snapshot_indexed(tmp_path: Path) -> None:
+    path = tmp_path / 'catalog.snapshot'
+    uuids = [str(uuid.uuid4()) for _ in range(50)]
+    skin_levels: dict[str, Any] = {
+        'status': 200,
+        'data': [{'uuid': value, 'displayName': f'レベル {value[:4]}'} for value in uuids],
+    }
+    Snapshot.write(
+        path,
+        {
+            ('/weapons/skinlevels', 'ja-JP'): json.dumps(skin_levels).encode(),
+            ('/version', ''): b'{"status":200,"data":{"manifestId":"ABC"}}',
+        },
+        manifest='ABC',
+        indexed=True,
+    )
+
+    with Snapshot.load(path) as snapshot:
+        assert snapshot.indexed
+        assert snapshot.compression == 'identity'
+        assert snapshot.lookup(Route('GET', '/version')) == {'status': 200, 'data': {'manifestId': 'ABC'}}
+        assert snapshot.lookup(Route('GET', '/weapons/skinlevels'), 'ja-JP') == skin_levels
+
+        for index, value in enumerate(uuids):
+            route = Route('GET', '/weapons/skinlevels/{uuid}', uuid=value.upper())
+            assert snapshot.lookup(route, 'ja-JP') == {'status': 200, 'data': skin_levels['data'][index]}
+
+        for value in (str(uuid.uuid4()), 'not-a-uuid'):
+            with pytest.raises(NotFound):
+                snapshot.lookup(Route('GET', '/weapons/skinlevels/{uuid}', uuid=value), 'ja-JP')
+        assert snapshot.lookup(Route('GET', '/weapons/skinlevels/{uuid}', uuid=uuids[0]), 'en-US') is None
+
+
+def test_snapshot_invalid(tmp_path: Path) -> None:
+    path = tmp_path / 'catalog.snapshot'
+    path.write_bytes(b'not a snapshot at all')
+    with pytest.raises(SnapshotError, match='not a valorant snapshot'):
+        Snapshot.load(path)
+
+    _write(path)
+    data = bytearray(path.read_bytes())
+    struct.pack_into('<H', data, 8, 999)
+    path.write_bytes(bytes(data))
+    with pytest.raises(SnapshotError, match='snapshot format 999'):
+        Snapshot.load(path)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('indexed', [False, True])
+async def test_export_and_import_snapshot(indexed: bool, api_server: FakeAPI, tmp_path: Path) -> None:
+    agent: dict[str, Any] = {'uuid': 'add6443a-41bd-e414-f6ad-e58d267f4e95', 'isPlayableCharacter': True}
+    unplayable = {'uuid': 'ded3520f-4264-bfed-162d-b080e2abccf9', 'isPlayableCharacter': False}
+    api_server.add('/version', VERSION)
+    api_server.add('/agents', [agent, unplayable])
+    api_server.add('/seasons/competitive', [])
+    path = tmp_path / 'catalog.snapshot'
+
+    async with Client(cache_path=tmp_path / 'cache') as client:
+        snapshot = await client.export_snapshot(
+            path,
+            endpoints=['/agents', '/seasons/competitive'],
+            languages=[Language.american_english, Language.japanese],
+            indexed=indexed,
+        )
+        snapshot.close()
+
+    assert snapshot.manifest == 'ABC'
+    assert snapshot.indexed is indexed
+    assert {(entry.endpoint, entry.language) for entry in snapshot.entries} == {
+        ('/agents', 'en-US'),
+        ('/agents', 'ja-JP'),
+        ('/seasons/competitive', ''),
+        ('/version', ''),
+    }
+
+    api_server.requests.clear()
+    api_server.fail_with = 503
+    async with Client(enable_cache=False, snapshot=path) as client:
+        assert client.http.manifest_id == 'ABC'
+        version = await client.fetch_version()
+        assert version.manifest_id == 'ABC'
+
+        http: HTTPClient = client.http
+        assert await http.get_agent(agent['uuid'], language='ja-JP') == {'status': 200, 'data': agent}
+        assert await http.get_competitive_seasons() == {'status': 200, 'data': []}
+
+    assert not api_server.requests
+
+    # The snapshot holds the unfiltered list, filtered requests go upstream.
+    api_server.fail_with = None
+    async with Client(enable_cache=False, snapshot=path) as client:
+        http = client.http
+        assert await http.get_agents(is_playable_character=True) == {'status': 200, 'data': [agent]}
+        assert len((await http.get_agents())['data']) == 2
+
+    assert api_server.requests['/agents'] == 1
+
+    # Every caller gets its own copy of the decoded snapshot.
+    http = HTTPClient(enable_cache=False, snapshot=path)
+    try:
+        await http.start()
+        agents = await http.get_agents()
+        agents['data'].clear()
+        single = await http.get_agent(agent['uuid'], language='ja-JP')
+        single['data']['displayName'] = 'changed'
+        assert len((await http.get_agents())['data']) == 2
+        assert await http.get_agent(agent['uuid'], language='ja-JP') == {'status': 200, 'data': agent}
+    finally:
+        await http.close()
@@ -28,7 +28,7 @@ from .enums import (
     ShopCategory,
     WeaponCategory,
 )
-from .errors import HTTPException, NotFound, ValorantError
+from .errors import HTTPException, NotFound, SnapshotError, ValorantError
 
 __all__ = (
     'AbilitySlot',
@@ -45,6 +45,7 @@ __all__ = (
     'RewardType',
     'SeasonType',
     'ShopCategory',
+    'SnapshotError',
     'ValorantError',
     'WeaponCategory',
     'models',
@@ -0,0 +1,113 @@
+"""
+The MIT License (MIT).
+
+Copyright (c) 2023-present STACiA
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import TYPE_CHECKING
+
+from .client import Client
+from .enums import Language
+from .http import HTTPClient
+
+if TYPE_CHECKING:
+    from .http import PrefetchProgress
+
+_KIB = 1024
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < _KIB:
+            return f'{size:.1f} {unit}'
+        size /= _KIB
+    return f'{size:.1f} GiB'
+
+
+def _print_progress(progress: PrefetchProgress) -> None:
+    status = 'ok' if progress.error is None else f'failed: {progress.error}'
+    language = progress.language or 'default'
+    print(
+        f'[{progress.done}/{progress.total}] {progress.endpoint} ({language}) {status}',
+        file=sys.stderr,
+    )
+
+
+async def prefetch(args: argparse.Namespace) -> int:
+    languages = list(Language) if args.all_languages else args.language or [None]
+    # Responses are written in batches instead of one transaction each.
+    async with Client(cache_path=args.cache_path, cache_write_behind=True) as client:
+        report = await client.prefetch(
+            args.endpoint,
+            languages,
+            concurrency=args.concurrency,
+            progress=None if args.quiet else _print_progress,
+        )
+
+    print(
+        f'prefetched {report.requests - len(report.failures)}/{report.requests} responses '
+        f'in {report.elapsed:.2f}s, downloaded {_format_bytes(report.downloaded)}, '
+        f'cache size {_format_bytes(report.stored)}'
+    )
+    return 1 if report.failures else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m valorant')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    parser_prefetch = commands.add_parser('prefetch', help='fill the response cache with every list endpoint')
+    parser_prefetch.add_argument(
+        '-e',
+        '--endpoint',
+        action='append',
+        choices=list(HTTPClient.LIST_ENDPOINTS),
+        metavar='ENDPOINT',
+        help='list endpoint to fetch, can be repeated (default: all)',
+    )
+    parser_prefetch.add_argument(
+        '-l',
+        '--language',
+        action='append',
+        choices=[*Language, 'all'],
+        metavar='LANGUAGE',
+        help='language to fetch, can be repeated (default: the API default)',
+    )
+    parser_prefetch.add_argument('--all-languages', action='store_true', help='fetch every supported language')
+    parser_prefetch.add_argument('-c', '--concurrency', type=int, default=8, help='requests in flight (default: 8)')
+    parser_prefetch.add_argument('--cache-path', help='cache folder (default: ./.valorant_cache)')
+    parser_prefetch.add_argument('-q', '--quiet', action='store_true', help='only print the summary')
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return asyncio.run(prefetch(args))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
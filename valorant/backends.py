@@ -0,0 +1,379 @@
+"""
+The MIT License (MIT).
+
+Copyright (c) 2023-present STACiA
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import secrets
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+from .cache import CacheBackend, CacheEntry, CacheEntryInfo, _compress, _decompress, _resolve_compression
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .cache import Compression, EvictionPolicy
+
+__all__ = (
+    'FileSystemCache',
+    'MemoryCache',
+)
+
+
+class MemoryCache(CacheBackend):
+    """A response cache kept in a dictionary of the current process.
+
+    Nothing survives a restart and nothing is shared with other processes, which suits short-lived
+    containers and tests. Bodies are kept uncompressed so a hit costs no decompression.
+    """
+
+    def __init__(self, *, eviction: Literal['lru', 'lfu'] | EvictionPolicy = 'lru') -> None:
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        eviction : Literal['lru', 'lfu'] | EvictionPolicy
+            The policy used by :meth:`evict`. Defaults to least recently used.
+        """
+        super().__init__(eviction=eviction)
+        self._entries: dict[str, CacheEntry] = {}
+        # The last access time and the hit count by key.
+        self._accesses: dict[str, tuple[float, int]] = {}
+
+    def get(self, key: str, *, include_expired: bool = False) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        now = time.time()
+        if not include_expired and entry.is_expired(now):
+            return None
+        _, hits = self._accesses[key]
+        self._accesses[key] = (now, hits + 1)
+        return entry
+
+    def set(  # noqa: PLR0913
+        self,
+        key: str,
+        body: bytes,
+        *,
+        route: str,
+        language: str = '',
+        status: int = 200,
+        expire_after: float | None = None,
+        manifest: str | None = None,
+    ) -> None:
+        now = time.time()
+        expires_at = None if expire_after is None else now + expire_after
+        self._entries[key] = CacheEntry(key, route, language, status, body, now, expires_at, manifest)
+        self._accesses[key] = (now, 0)
+
+    def info(self, key: str) -> CacheEntryInfo | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        accessed_at, hits = self._accesses[key]
+        return CacheEntryInfo(
+            key=key,
+            route=entry.route,
+            language=entry.language,
+            status=entry.status,
+            size=len(entry.body),
+            stored_size=len(entry.body),
+            created_at=entry.created_at,
+            expires_at=entry.expires_at,
+            accessed_at=accessed_at,
+            hits=hits,
+        )
+
+    def delete(self, key: str) -> bool:
+        self._accesses.pop(key, None)
+        return self._entries.pop(key, None) is not None
+
+    def entries(self, pattern: str = '*', *, language: str | None = None) -> list[CacheEntryInfo]:
+        infos = (self.info(key) for key in sorted(self._entries))
+        return [info for info in infos if info is not None and self._matches(info, pattern, language)]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._accesses.clear()
+
+    def scan(self) -> Iterator[CacheEntry]:
+        now = time.time()
+        return (entry for entry in list(self._entries.values()) if not entry.is_expired(now))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_SUFFIX: Final[str] = '.entry'
+
+
+class FileSystemCache(CacheBackend):
+    """A response cache storing one file per entry in a directory sharded by key hash.
+
+    Every file holds a one line JSON header followed by the compressed body, so listing entries only
+    reads the headers. Files are replaced atomically, which makes the directory safe to share between
+    processes and hosts mounting it, and fetch locks are lock files next to the entries. The access
+    time of an entry is the modification time of its file, hits are not counted.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        compression: Compression | None = None,
+        eviction: Literal['lru', 'lfu'] | EvictionPolicy = 'lru',
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        path : str | Path
+            The directory holding the entries, created when missing.
+        compression : Compression | None
+            Compression used for stored bodies. Defaults to ``zstd`` when available, otherwise ``zlib``.
+        eviction : Literal['lru', 'lfu'] | EvictionPolicy
+            The policy used by :meth:`evict`. Defaults to least recently used.
+        """
+        super().__init__(eviction=eviction)
+        self.path: Path = Path(path)
+        self.compression: Compression = _resolve_compression(compression)
+        self._locks: Path = self.path / 'locks'
+        self._locks.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key: str) -> Path:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.path / digest[:2] / (digest[2:] + _SUFFIX)
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        # Written next to the target and renamed over it, readers see either version but never a partial file.
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f'.{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp')
+        try:
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _info(path: Path, header: dict[str, Any]) -> CacheEntryInfo:
+        return CacheEntryInfo(
+            key=header['key'],
+            route=header['route'],
+            language=header['language'],
+            status=header['status'],
+            size=header['size'],
+            stored_size=header['stored_size'],
+            created_at=header['created_at'],
+            expires_at=header['expires_at'],
+            accessed_at=path.stat().st_mtime,
+            hits=0,
+        )
+
+    def get(self, key: str, *, include_expired: bool = False) -> CacheEntry | None:
+        path = self._file(key)
+        try:
+            with path.open('rb') as file:
+                header = json.loads(file.readline())
+                body = file.read()
+        except FileNotFoundError:
+            return None
+
+        expires_at = header['expires_at']
+        now = time.time()
+        if not include_expired and expires_at is not None and now >= expires_at:
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path, (now, now))
+        return CacheEntry(
+            key=key,
+            route=header['route'],
+            language=header['language'],
+            status=header['status'],
+            body=_decompress(body, header['encoding']),
+            created_at=header['created_at'],
+            expires_at=expires_at,
+            manifest=header['manifest'],
+        )
+
+    def set(  # noqa: PLR0913
+        self,
+        key: str,
+        body: bytes,
+        *,
+        route: str,
+        language: str = '',
+        status: int = 200,
+        expire_after: float | None = None,
+        manifest: str | None = None,
+    ) -> None:
+        now = time.time()
+        compressed = _compress(body, self.compression)
+        header = {
+            'key': key,
+            'route': route,
+            'language': language,
+            'status': status,
+            'encoding': self.compression,
+            'size': len(body),
+            'stored_size': len(compressed),
+            'created_at': now,
+            'expires_at': None if expire_after is None else now + expire_after,
+            'manifest': manifest,
+        }
+        self._write(self._file(key), json.dumps(header).encode() + b'\n' + compressed)
+
+    def info(self, key: str) -> CacheEntryInfo | None:
+        path = self._file(key)
+        try:
+            with path.open('rb') as file:
+                return self._info(path, json.loads(file.readline()))
+        except FileNotFoundError:
+            return None
+
+    def delete(self, key: str) -> bool:
+        try:
+            self._file(key).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _files(self) -> list[Path]:
+        return [
+            path
+            for shard in self.path.iterdir()
+            if shard.is_dir() and shard != self._locks
+            for path in shard.glob('*' + _SUFFIX)
+        ]
+
+    def entries(self, pattern: str = '*', *, language: str | None = None) -> list[CacheEntryInfo]:
+        entries: list[CacheEntryInfo] = []
+        for path in self._files():
+            try:
+                with path.open('rb') as file:
+                    info = self._info(path, json.loads(file.readline()))
+            except FileNotFoundError:
+                # deleted by another process in the meantime
+                continue
+            if self._matches(info, pattern, language):
+                entries.append(info)
+        entries.sort(key=lambda info: info.key)
+        return entries
+
+    def clear(self) -> None:
+        for path in self._files():
+            path.unlink(missing_ok=True)
+
+    def compact(self) -> int:
+        """Remove empty shard directories, returns how many were removed."""
+        removed = 0
+        for shard in self.path.iterdir():
+            if shard.is_dir() and shard != self._locks and not any(shard.iterdir()):
+                with contextlib.suppress(OSError):
+                    shard.rmdir()
+                    removed += 1
+        return removed
+
+    def _lock_file(self, key: str) -> Path:
+        return self._locks / (hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '.lock')
+
+    @staticmethod
+    def _lock_owner(path: Path) -> tuple[str | None, float]:
+        # Lock files are only ever put in place complete (see _create_lock), so one that cannot be
+        # parsed was damaged, for instance by a crash of the host, and is treated as abandoned.
+        try:
+            owner, _, expires_at = path.read_text(encoding='utf-8').partition(' ')
+            return owner, float(expires_at)
+        except (FileNotFoundError, ValueError):
+            return None, 0.0
+
+    @staticmethod
+    def _create_lock(path: Path, data: bytes) -> bool:
+        # Written to a temporary file first and hard linked into place, which fails when the lock
+        # exists. Unlike creating it with O_EXCL and writing to it, nobody can read it half written.
+        tmp = path.with_name(f'.{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp')
+        try:
+            tmp.write_bytes(data)
+            os.link(tmp, path)
+        except FileExistsError:
+            return False
+        finally:
+            tmp.unlink(missing_ok=True)
+        return True
+
+    def acquire(self, key: str, timeout: float) -> str | None:
+        token = f'{os.getpid()}:{secrets.token_hex(8)}'
+        data = f'{token} {time.time() + timeout}'.encode()
+        path = self._lock_file(key)
+        if self._create_lock(path, data):
+            return token
+
+        stale, expires_at = self._lock_owner(path)
+        if time.time() < expires_at:
+            return None
+        # Abandoned, take it over. Of several processes doing so at once, only one creates it again.
+        if not self._remove_stale_lock(path, stale) or not self._create_lock(path, data):
+            return None
+        owner, _ = self._lock_owner(path)
+        return token if owner == token else None
+
+    def _remove_stale_lock(self, path: Path, stale: str | None) -> bool:
+        # Moved aside before it is removed, since it may have been released and taken again after it
+        # was found abandoned. A live lock moved aside by mistake is put back.
+        aside = path.with_name(f'.{path.name}.{os.getpid()}.{secrets.token_hex(4)}.stale')
+        try:
+            path.rename(aside)
+        except FileNotFoundError:
+            return True
+        owner, _ = self._lock_owner(aside)
+        try:
+            if owner != stale:
+                with contextlib.suppress(FileExistsError):
+                    os.link(aside, path)
+                return False
+        finally:
+            aside.unlink(missing_ok=True)
+        return True
+
+    def release(self, key: str, token: str) -> bool:
+        path = self._lock_file(key)
+        owner, _ = self._lock_owner(path)
+        if owner != token:
+            return False
+        path.unlink(missing_ok=True)
+        return True
@@ -0,0 +1,125 @@
+"""
+The MIT License (MIT).
+
+Copyright (c) 2023-present STACiA
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = (
+    'BloomFilter',
+    'FilterStats',
+)
+
+# The false positive rate filters are sized for by default. A false positive only costs the
+# upstream request that would have been sent without a filter.
+DEFAULT_FALSE_POSITIVE_RATE: Final[float] = 0.001
+
+
+class FilterStats(NamedTuple):
+    """The size and accuracy of the uuid filter of one list endpoint."""
+
+    endpoint: str
+    items: int
+    memory: int
+    hashes: int
+    false_positive_rate: float
+    manifest: str | None
+
+
+class BloomFilter:
+    """A bloom filter of uuids: no false negatives, false positives at a configurable rate."""
+
+    __slots__ = ('bits', 'count', 'hashes', 'size')
+
+    def __init__(self, capacity: int, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> None:
+        """
+        Initialize an empty filter.
+
+        Parameters
+        ----------
+        capacity : int
+            The expected number of items.
+        false_positive_rate : float
+            The false positive rate once ``capacity`` items have been added.
+        """
+        capacity = max(capacity, 1)
+        # m = -n ln(p) / ln(2)^2 bits and k = m / n ln(2) hashes give the lowest rate for the memory.
+        self.size: int = max(math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2), 8)
+        self.hashes: int = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits: bytearray = bytearray((self.size + 7) // 8)
+        self.count: int = 0
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> BloomFilter:
+        items = list(items)
+        bloom = cls(len(items), false_positive_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def __repr__(self) -> str:
+        return f'<BloomFilter count={self.count} memory={self.memory} hashes={self.hashes}>'
+
+    def __len__(self) -> int:
+        return self.count
+
+    @staticmethod
+    def _hashes(item: str) -> tuple[int, int]:
+        # Double hashing: the k positions are h1 + i * h2 of two independent 64-bit hashes.
+        digest = hashlib.blake2b(item.lower().encode(), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+    def add(self, item: str) -> None:
+        h1, h2 = self._hashes(item)
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % self.size
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+
+        h1, h2 = self._hashes(item)
+        bits, size = self.bits, self.size
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def memory(self) -> int:
+        """The size of the bit array in bytes."""
+        return len(self.bits)
+
+    @property
+    def false_positive_rate(self) -> float:
+        """The expected false positive rate for the items added so far."""
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
@@ -0,0 +1,1095 @@
+"""
+The MIT License (MIT).
+
+Copyright (c) 2023-present STACiA
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import time
+import zlib
+from abc import ABC, abstractmethod
+from fnmatch import fnmatchcase
+from itertools import starmap
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, NamedTuple
+from urllib.parse import urlencode
+
+from . import utils
+from .stats import WriteStats
+
+try:
+    from compression import zstd  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover
+    try:
+        import zstandard as zstd  # type: ignore[import-not-found, no-redef, unused-ignore]
+    except ImportError:
+        zstd = None  # type: ignore[assignment, unused-ignore]
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterable, Iterator, Mapping
+    from typing import TypeAlias
+
+    from typing_extensions import Self
+
+    Compression: TypeAlias = Literal['zstd', 'zlib', 'identity']
+    PragmaValue: TypeAlias = int | str
+else:
+    # Only imported once a SQLite cache is opened.
+    sqlite3 = utils._lazy_import('sqlite3')
+
+__all__ = (
+    'DEFAULT_CACHE_POLICIES',
+    'DEFAULT_LANGUAGE',
+    'DEFAULT_PRAGMAS',
+    'EVICTION_POLICIES',
+    'CacheBackend',
+    'CacheEntry',
+    'CacheEntryInfo',
+    'CachePolicy',
+    'CacheUsage',
+    'EvictionPolicy',
+    'LFUPolicy',
+    'LRUPolicy',
+    'SQLiteCache',
+    'make_cache_key',
+    'normalize_params',
+)
+
+_log = logging.getLogger(__name__)
+
+# Bump this whenever the table layout changes. The cache only holds data that can be fetched
+# again, so an outdated database is simply dropped and recreated.
+SCHEMA_VERSION: Final[int] = 3
+
+# The locale the API answers in when no language is given.
+DEFAULT_LANGUAGE: Final[str] = 'en-US'
+
+# Defaults tuned for several processes sharing one cache file: WAL lets readers run alongside a
+# writer and ``synchronous=normal`` skips the fsync on every commit (safe with WAL, a crash can only lose
+# the most recent writes). The cache is used from the event loop, so ``busy_timeout`` only waits a few
+# milliseconds for another process to finish writing: a response that cannot be stored by then is
+# queued for the next write and a fetch lock that cannot be taken counts as held.
+DEFAULT_PRAGMAS: Final[Mapping[str, PragmaValue]] = {
+    'busy_timeout': 5,  # milliseconds
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'mmap_size': 64 * 1024 * 1024,  # bytes
+    'cache_size': -16 * 1024,  # negative values are KiB
+}
+
+# Seconds waited for other processes when opening the database, which happens once per process and may
+# have to switch the journal mode or recreate the schema, and when writing the queued entries on close.
+_SETUP_TIMEOUT: Final[float] = 5.0
+
+_ALLOWED_PRAGMAS: Final[frozenset[str]] = frozenset({
+    'busy_timeout',
+    'cache_size',
+    'journal_mode',
+    'journal_size_limit',
+    'mmap_size',
+    'synchronous',
+    'temp_store',
+    'wal_autocheckpoint',
+})
+
+
+class CachePolicy(NamedTuple):
+    """How responses of one route family are cached.
+
+    Attributes:
+    ----------
+    ttl: :class:`float`
+        Seconds a response stays fresh. ``0`` disables caching for the route.
+    cache_not_found: :class:`bool`
+        Whether 404 responses are cached as well.
+    allow_stale: :class:`bool`
+        Whether an expired entry may be served when the upstream request fails.
+    """
+
+    ttl: float
+    cache_not_found: bool = True
+    allow_stale: bool = False
+
+
+_HOUR: Final[int] = 60 * 60
+_DAY: Final[int] = 24 * _HOUR
+
+# Keyed by route path, a policy also applies to every route below it (``/weapons`` covers
+# ``/weapons/skins/{uuid}``) unless a longer path has its own entry.
+DEFAULT_CACHE_POLICIES: Final[Mapping[str, CachePolicy]] = {
+    # Always asked upstream, a new manifest is how a new patch shows up.
+    '/version': CachePolicy(ttl=0),
+    # Scheduled content rotates during a patch and new uuids can appear at any time.
+    '/events': CachePolicy(ttl=_HOUR, cache_not_found=False, allow_stale=True),
+    '/missions': CachePolicy(ttl=_HOUR, cache_not_found=False, allow_stale=True),
+    '/seasons': CachePolicy(ttl=_HOUR, cache_not_found=False, allow_stale=True),
+    '/bundles': CachePolicy(ttl=6 * _HOUR, cache_not_found=False, allow_stale=True),
+    '/contracts': CachePolicy(ttl=6 * _HOUR, cache_not_found=False, allow_stale=True),
+    # Everything else only changes with a game patch.
+    '/agents': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/buddies': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/ceremonies': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/competitivetiers': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/contenttiers': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/currencies': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/flex': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/gamemodes': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/gear': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/levelborders': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/maps': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/playercards': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/playertitles': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/sprays': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/themes': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+    '/weapons': CachePolicy(ttl=3 * _DAY, allow_stale=True),
+}
+
+_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    route TEXT NOT NULL,
+    language TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    encoding TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    manifest TEXT,
+    accessed_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_hits ON responses (hits, accessed_at);
+CREATE TABLE IF NOT EXISTS fetch_locks (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def _compress(data: bytes, encoding: Compression) -> bytes:
+    if encoding == 'zstd':
+        compressed: bytes = zstd.compress(data)
+        return compressed
+    if encoding == 'zlib':
+        return zlib.compress(data, 6)
+    return data
+
+
+def _decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'zstd':
+        decompressed: bytes = zstd.decompress(data)
+        return decompressed
+    if encoding == 'zlib':
+        return zlib.decompress(data)
+    return data
+
+
+def _is_busy(exc: sqlite3.OperationalError) -> bool:
+    # SQLITE_BUSY and SQLITE_LOCKED, the error codes are only exposed since Python 3.11.
+    return 'is locked' in str(exc)
+
+
+def _default_compression() -> Compression:
+    return 'zlib' if zstd is None else 'zstd'
+
+
+def _resolve_compression(compression: Compression | None) -> Compression:
+    if compression == 'zstd' and zstd is None:
+        raise RuntimeError('zstd compression requires Python 3.14+ or the zstandard package')  # noqa: TRY003
+    return compression or _default_compression()
+
+
+def normalize_params(params: Mapping[str, Any]) -> dict[str, str]:
+    """
+    Return the canonical form of request query parameters.
+
+    ``None`` values and the default language are dropped, values are converted to strings
+    and booleans are spelled ``true``/``false`` however they were passed.
+
+    Parameters
+    ----------
+    params : Mapping[str, Any]
+        The query parameters of the request.
+
+    Returns:
+    -------
+    dict[str, str]
+        The canonical parameters.
+    """
+    normalized: dict[str, str] = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        text = str(value)
+        if text.lower() in {'true', 'false'}:
+            text = text.lower()
+        if name == 'language' and text == DEFAULT_LANGUAGE:
+            continue
+        normalized[name] = text
+    return normalized
+
+
+def make_cache_key(path: str, params: Mapping[str, Any] | None = None, *, normalize: bool = True) -> str:
+    """
+    Build the cache key for a request.
+
+    Equivalent requests share one key: the path is lower-cased (uuids are case-insensitive) and the
+    parameters go through :func:`normalize_params` and are sorted.
+
+    Parameters
+    ----------
+    path : str
+        The formatted route path, e.g. ``/agents/{uuid}`` with the uuid filled in.
+    params : Mapping[str, Any] | None
+        The query parameters of the request.
+    normalize : bool
+        Whether to build the canonical key. When False the key is built from the request exactly as
+        given, which is only useful to tell whether normalization changed anything.
+
+    Returns:
+    -------
+    str
+        The cache key.
+    """
+    if normalize:
+        path = path.lower()
+        params = dict(sorted(normalize_params(params or {}).items()))
+    if not params:
+        return path
+    return path + '?' + urlencode(list(params.items()))
+
+
+class EvictionPolicy:
+    """Decides which entries are removed first when the cache is over its size limit.
+
+    Subclasses either set :attr:`order_by` (an SQL ``ORDER BY`` expression over the ``responses``
+    table columns) or override :meth:`select` entirely. Backends other than :class:`SQLiteCache`
+    order entries by :meth:`sort_key` instead. Expired entries are always evicted first.
+    """
+
+    name: ClassVar[str]
+    order_by: ClassVar[str]
+
+    def select(self, conn: sqlite3.Connection, limit: int) -> list[tuple[str, int]]:
+        """Return up to ``limit`` ``(key, stored_size)`` pairs in eviction order."""
+        query = (
+            'SELECT key, stored_size FROM responses '  # noqa: S608
+            f'ORDER BY (expires_at IS NOT NULL AND expires_at <= ?) DESC, {self.order_by} LIMIT ?'
+        )
+        return conn.execute(query, (time.time(), limit)).fetchall()
+
+    def sort_key(self, info: CacheEntryInfo) -> tuple[float, ...]:  # noqa: PLR6301
+        """Return the sort key of an entry, entries with the smallest keys are evicted first."""
+        return (info.accessed_at,)
+
+    def order(self, entries: Iterable[CacheEntryInfo]) -> list[CacheEntryInfo]:
+        """Return ``entries`` in eviction order."""
+        now = time.time()
+        return sorted(entries, key=lambda info: (not info.is_expired(now), *self.sort_key(info)))
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evicts the least recently used entries first."""
+
+    name = 'lru'
+    order_by = 'accessed_at'
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evicts the least frequently used entries first, oldest access breaking ties."""
+
+    name = 'lfu'
+    order_by = 'hits, accessed_at'
+
+    def sort_key(self, info: CacheEntryInfo) -> tuple[float, ...]:  # noqa: PLR6301
+        return (info.hits, info.accessed_at)
+
+
+EVICTION_POLICIES: Final[Mapping[str, type[EvictionPolicy]]] = {
+    LRUPolicy.name: LRUPolicy,
+    LFUPolicy.name: LFUPolicy,
+}
+
+
+class CacheEntry(NamedTuple):
+    key: str
+    route: str
+    language: str
+    status: int
+    body: bytes
+    created_at: float
+    expires_at: float | None
+    manifest: str | None
+
+    def is_expired(self, now: float | None = None) -> bool:
+        if self.expires_at is None:
+            return False
+        return (time.time() if now is None else now) >= self.expires_at
+
+
+class CacheEntryInfo(NamedTuple):
+    """A stored entry without its body, as listed by :meth:`SQLiteCache.entries`."""
+
+    key: str
+    route: str
+    language: str
+    status: int
+    size: int
+    stored_size: int
+    created_at: float
+    expires_at: float | None
+    accessed_at: float
+    hits: int
+
+    def is_expired(self, now: float | None = None) -> bool:
+        if self.expires_at is None:
+            return False
+        return (time.time() if now is None else now) >= self.expires_at
+
+
+_INFO_COLUMNS: Final[str] = ', '.join(CacheEntryInfo._fields)
+
+_INSERT: Final[str] = (
+    'INSERT OR REPLACE INTO responses '
+    '(key, route, language, status, encoding, body, size, stored_size, created_at, expires_at, manifest, accessed_at) '
+    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+)
+
+
+class CacheUsage(NamedTuple):
+    """Storage used by one route and language, as returned by :meth:`SQLiteCache.usage`."""
+
+    route: str
+    language: str
+    entries: int
+    size: int
+    stored_size: int
+
+
+class CacheBackend(ABC):
+    """The storage behind the response cache.
+
+    A backend stores response bodies by cache key (see :func:`make_cache_key`) together with their
+    route, language, status, expiry and the manifest id of the game version they were fetched for.
+    Subclasses must implement the abstract methods :meth:`get`, :meth:`set`, :meth:`info`, :meth:`delete`,
+    :meth:`entries` and :meth:`clear`. Everything else has a default built on top of those, which backends can replace
+    with something faster.
+
+    Backends shipped with the library are :class:`SQLiteCache` (the default, shared by every process
+    using the same file), :class:`~valorant.backends.FileSystemCache` (one file per entry) and
+    :class:`~valorant.backends.MemoryCache` (per process).
+    """
+
+    # Whether other processes can use the same storage. Fetch locks are only taken on shared backends.
+    shared: ClassVar[bool] = False
+
+    def __init__(self, *, eviction: Literal['lru', 'lfu'] | EvictionPolicy = 'lru') -> None:
+        self.eviction: EvictionPolicy = EVICTION_POLICIES[eviction]() if isinstance(eviction, str) else eviction
+        self.write_stats: WriteStats = WriteStats()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @abstractmethod
+    def get(self, key: str, *, include_expired: bool = False) -> CacheEntry | None:
+        """Return the entry stored under ``key``, None when there is none or it has expired."""
+
+    @abstractmethod
+    def set(  # noqa: PLR0913
+        self,
+        key: str,
+        body: bytes,
+        *,
+        route: str,
+        language: str = '',
+        status: int = 200,
+        expire_after: float | None = None,
+        manifest: str | None = None,
+    ) -> None:
+        """Store ``body`` under ``key``, replacing any previous entry."""
+
+    @abstractmethod
+    def info(self, key: str) -> CacheEntryInfo | None:
+        """Return an entry without reading its body, expired entries included."""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Delete the entry stored under ``key``, returns whether there was one."""
+
+    @abstractmethod
+    def entries(self, pattern: str = '*', *, language: str | None = None) -> list[CacheEntryInfo]:
+        """
+        List the stored entries whose route or key matches ``pattern``.
+
+        Parameters
+        ----------
+        pattern : str
+            A glob pattern (``*``, ``?`` and ``[...]``) matched against the route template
+            (e.g. ``/weapons/skinlevels/{uuid}``) and the cache key (e.g. ``/agents?language=ja-JP``).
+        language : str | None
+            Only list entries for this language.
+
+        Returns:
+        -------
+        list[CacheEntryInfo]
+            The matching entries ordered by key.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete every entry."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release the resources of the backend, after writing anything not written yet."""
+
+    @staticmethod
+    def _matches(info: CacheEntryInfo, pattern: str, language: str | None) -> bool:
+        # The same matching as SQLite's GLOB.
+        if language is not None and info.language != language:
+            return False
+        return fnmatchcase(info.route, pattern) or fnmatchcase(info.key, pattern)
+
+    def purge(self, pattern: str, *, language: str | None = None) -> int:
+        """Delete the entries matched like :meth:`entries` and return how many were deleted."""
+        return sum(self.delete(info.key) for info in self.entries(pattern, language=language))
+
+    def delete_expired(self) -> int:
+        now = time.time()
+        return sum(self.delete(info.key) for info in self.entries() if info.is_expired(now))
+
+    def scan(self) -> Iterator[CacheEntry]:
+        """Yield every entry that has not expired, used to load the whole cache at once."""
+        for info in self.entries():
+            entry = self.get(info.key)
+            if entry is not None:
+                yield entry
+
+    def usage(self) -> list[CacheUsage]:
+        """Return the number of entries and bytes stored per route and language."""
+        groups: dict[tuple[str, str], list[int]] = {}
+        for info in self.entries():
+            group = groups.setdefault((info.route, info.language), [0, 0, 0])
+            group[0] += 1
+            group[1] += info.size
+            group[2] += info.stored_size
+        return [CacheUsage(route, language, *group) for (route, language), group in sorted(groups.items())]
+
+    def total_size(self) -> int:
+        """Return the number of bytes used by the stored bodies."""
+        return sum(info.stored_size for info in self.entries())
+
+    def evict(self, max_bytes: int, *, batch: int = 256) -> int:
+        """
+        Evict one batch of entries if the cache is larger than ``max_bytes``.
+
+        Call it repeatedly until it returns ``0`` to bring the cache under the limit.
+
+        Parameters
+        ----------
+        max_bytes : int
+            The size limit for the stored bodies.
+        batch : int
+            The maximum number of entries removed by this call.
+
+        Returns:
+        -------
+        int
+            The number of evicted entries.
+        """
+        entries = self.entries()
+        excess = sum(info.stored_size for info in entries) - max_bytes
+        evicted = 0
+        for info in self.eviction.order(entries)[:batch]:
+            if excess <= 0:
+                break
+            self.delete(info.key)
+            excess -= info.stored_size
+            evicted += 1
+
+        if evicted:
+            _log.debug('evicted %s cache entries using the %s policy', evicted, self.eviction.name)
+        return evicted
+
+    def compact(self) -> int:  # noqa: PLR6301
+        """Return unused storage to the file system, returns how much was released in backend specific units."""
+        return 0
+
+    def acquire(self, key: str, timeout: float) -> str | None:  # noqa: ARG002, PLR6301
+        """
+        Take the fetch lock of ``key``, shared by every process using the same storage.
+
+        Backends that are not shared between processes need no lock and always succeed.
+
+        Parameters
+        ----------
+        key : str
+            The cache key about to be fetched.
+        timeout : float
+            Seconds after which the lock is considered abandoned and can be taken by someone else,
+            so a holder that crashed does not block the key forever.
+
+        Returns:
+        -------
+        str | None
+            A token for :meth:`release`, or None when the lock is held by someone else.
+        """
+        return secrets.token_hex(8)
+
+    def release(self, key: str, token: str) -> bool:  # noqa: ARG002, PLR6301
+        """Release a fetch lock taken by :meth:`acquire`, unless it has expired and been taken over since."""
+        return True
+
+    def acquire_or_get(self, key: str, timeout: float) -> tuple[str | None, CacheEntry | None]:
+        """
+        Return the entry stored under ``key``, or take its fetch lock when there is none.
+
+        The entry is looked up again once the lock is taken, since the previous holder may have stored
+        it right before releasing the lock. Backends replace this to do both at once.
+
+        Parameters
+        ----------
+        key : str
+            The cache key about to be fetched.
+        timeout : float
+            Seconds after which the lock is considered abandoned, see :meth:`acquire`.
+
+        Returns:
+        -------
+        tuple[str | None, CacheEntry | None]
+            The token of the taken lock or the stored entry, both None when someone else holds the lock.
+        """
+        token = self.acquire(key, timeout)
+        if token is None:
+            return None, self.get(key)
+        entry = self.get(key)
+        if entry is not None:
+            self.release(key, token)
+            return None, entry
+        return token, None
+
+    @property
+    def pending(self) -> int:
+        """The number of entries stored by :meth:`set` that have not been written yet."""
+        return 0
+
+    def flush(self) -> int:  # noqa: PLR6301
+        """Write the entries stored by :meth:`set` that have not been written yet, returns how many."""
+        return 0
+
+    def __len__(self) -> int:
+        return len(self.entries())
+
+
+class SQLiteCache(CacheBackend):
+    """A key/value response cache stored in a single SQLite table.
+
+    Only the raw response body is stored (compressed), so a cache hit is a single
+    primary key lookup followed by a decompression.
+    """
+
+    shared = True
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str | Path,
+        *,
+        compression: Compression | None = None,
+        pragmas: Mapping[str, PragmaValue] | None = None,
+        eviction: Literal['lru', 'lfu'] | EvictionPolicy = 'lru',
+        write_behind: bool = False,
+        max_pending: int = 256,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the SQLite database file.
+        compression : Compression | None
+            Compression used for stored bodies. Defaults to ``zstd`` when available, otherwise ``zlib``.
+        pragmas : Mapping[str, PragmaValue] | None
+            SQLite pragmas applied to every connection, merged over :data:`DEFAULT_PRAGMAS`.
+            Supported pragmas are ``busy_timeout``, ``cache_size``, ``journal_mode``, ``journal_size_limit``,
+            ``mmap_size``, ``synchronous``, ``temp_store`` and ``wal_autocheckpoint``.
+        eviction : Literal['lru', 'lfu'] | EvictionPolicy
+            The policy used by :meth:`evict`. Defaults to least recently used.
+        write_behind : bool
+            Queue the entries stored by :meth:`set` in memory and write them in batched transactions
+            by :meth:`flush` instead of one transaction each. Queued entries are served by :meth:`get`
+            right away and written at the latest by :meth:`close`. Defaults to False.
+        max_pending : int
+            The queue length at which :meth:`set` flushes by itself. Defaults to 256.
+        """
+        super().__init__(eviction=eviction)
+        self.pragmas: dict[str, PragmaValue] = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        for name, value in self.pragmas.items():
+            if name not in _ALLOWED_PRAGMAS:
+                raise ValueError(f'unsupported cache pragma: {name!r}')  # noqa: TRY003
+            if not isinstance(value, int) and not value.isidentifier():
+                raise ValueError(f'invalid value for cache pragma {name!r}: {value!r}')  # noqa: TRY003
+
+        self.path: Path = Path(path)
+        self.compression: Compression = _resolve_compression(compression)
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int = os.getpid()
+        # Connections inherited through fork(), kept so they are never used or closed by the child.
+        self._inherited: list[sqlite3.Connection] = []
+        # Reads only record their access here, it is written back in batches by flush_accesses().
+        self._accesses: dict[str, tuple[float, int]] = {}
+        self.write_behind: bool = write_behind
+        self.max_pending: int = max_pending
+        # Entries stored by set() but not written yet, and the fetch locks to release once they are,
+        # so that other processes waiting on a lock find the entry as soon as the lock is gone.
+        self._pending: dict[str, CacheEntry] = {}
+        self._pending_releases: dict[str, str] = {}
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            self._detach()
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    def _detach(self) -> None:
+        # SQLite connections must not cross a fork(), closing one in the child could release
+        # the parent's locks, so a forked child leaves it alone and opens its own.
+        if self._conn is not None:
+            self._inherited.append(self._conn)
+        self._conn = None
+        self._pid = os.getpid()
+        self._accesses.clear()
+        self._pending.clear()
+        self._pending_releases.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Until the configured busy timeout is applied last, switching the journal mode and creating
+        # the schema wait up to _SETUP_TIMEOUT for other processes.
+        conn = sqlite3.connect(self.path, timeout=_SETUP_TIMEOUT, isolation_level=None, check_same_thread=False)
+        for name, value in self.pragmas.items():
+            if name != 'busy_timeout':
+                conn.execute(f'PRAGMA {name} = {value}')
+
+        (version,) = conn.execute('PRAGMA user_version').fetchone()
+        if version != SCHEMA_VERSION:
+            _log.debug('cache schema version %s is outdated, recreating %s', version, self.path)
+            conn.execute('DROP TABLE IF EXISTS responses')
+            # Freed pages are only returned to the file system with incremental auto vacuum,
+            # which can only be switched on for an empty database followed by a VACUUM.
+            conn.execute('PRAGMA auto_vacuum = incremental')
+            conn.execute('VACUUM')
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION:d}')
+        conn.executescript(_SCHEMA)
+        conn.execute(f'PRAGMA busy_timeout = {self.pragmas["busy_timeout"]}')
+        return conn
+
+    def close(self) -> None:
+        if self._pid != os.getpid():
+            self._detach()
+        if self._conn is not None:
+            # Nothing is written after this, so wait for other processes as long as when opening.
+            self._conn.execute(f'PRAGMA busy_timeout = {_SETUP_TIMEOUT * 1000:.0f}')
+            self.flush()
+            self.flush_accesses()
+            self._conn.close()
+            self._conn = None
+
+    def get(self, key: str, *, include_expired: bool = False) -> CacheEntry | None:
+        pending = self._pending.get(key)
+        if pending is not None:
+            if not include_expired and pending.is_expired():
+                return None
+            return pending
+
+        row = self.conn.execute(
+            'SELECT key, route, language, status, encoding, body, created_at, expires_at, manifest '
+            'FROM responses WHERE key = ?',
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        key, route, language, status, encoding, body, created_at, expires_at, manifest = row
+        now = time.time()
+        if not include_expired and expires_at is not None and now >= expires_at:
+            return None
+
+        _, hits = self._accesses.get(key, (now, 0))
+        self._accesses[key] = (now, hits + 1)
+
+        return CacheEntry(
+            key=key,
+            route=route,
+            language=language,
+            status=status,
+            body=_decompress(body, encoding),
+            created_at=created_at,
+            expires_at=expires_at,
+            manifest=manifest,
+        )
+
+    def set(  # noqa: PLR0913
+        self,
+        key: str,
+        body: bytes,
+        *,
+        route: str,
+        language: str = '',
+        status: int = 200,
+        expire_after: float | None = None,
+        manifest: str | None = None,
+    ) -> None:
+        now = time.time()
+        expires_at = None if expire_after is None else now + expire_after
+        entry = CacheEntry(key, route, language, status, body, now, expires_at, manifest)
+        if not self.write_behind:
+            self._write_through(entry)
+            return
+
+        self._pending[key] = entry
+        self.write_stats.max_pending = max(self.write_stats.max_pending, len(self._pending))
+        if len(self._pending) >= self.max_pending:
+            self.flush()
+
+    def _write_through(self, entry: CacheEntry) -> None:
+        try:
+            if self._pending or self._pending_releases:
+                # Entries and releases queued while the database was locked are written together with this one.
+                self._pending[entry.key] = entry
+                self.flush()
+            else:
+                self.conn.execute(_INSERT, self._row(entry))
+        except sqlite3.OperationalError as exc:
+            if not _is_busy(exc):
+                raise
+            # Served from the queue until the next set() or flush() writes it.
+            _log.debug('the cache database is locked, queued %s', entry.key)
+            self._pending[entry.key] = entry
+
+    def _row(self, entry: CacheEntry) -> tuple[Any, ...]:
+        compressed = _compress(entry.body, self.compression)
+        return (
+            entry.key,
+            entry.route,
+            entry.language,
+            entry.status,
+            self.compression,
+            compressed,
+            len(entry.body),
+            len(compressed),
+            entry.created_at,
+            entry.expires_at,
+            entry.manifest,
+            entry.created_at,
+        )
+
+    @property
+    def pending(self) -> int:
+        """The number of entries queued by :meth:`set` that have not been written yet."""
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write the entries queued by :meth:`set` in a single transaction.
+
+        Returns:
+        -------
+        int
+            The number of written entries.
+        """
+        if not self._pending and not self._pending_releases:
+            return 0
+
+        started = time.perf_counter()
+        rows = [self._row(entry) for entry in self._pending.values()]
+        releases = list(self._pending_releases.items())
+        with self.conn:
+            self.conn.execute('BEGIN')
+            self.conn.executemany(_INSERT, rows)
+            self.conn.executemany('DELETE FROM fetch_locks WHERE key = ? AND owner = ?', releases)
+        self._pending.clear()
+        self._pending_releases.clear()
+
+        self.write_stats.flushes += 1
+        self.write_stats.flushed += len(rows)
+        self.write_stats.flush_latency.observe(time.perf_counter() - started)
+        return len(rows)
+
+    def delete(self, key: str) -> bool:
+        pending = self._pending.pop(key, None)
+        cursor = self.conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+        return pending is not None or cursor.rowcount > 0
+
+    def delete_expired(self) -> int:
+        self.flush()
+        cursor = self.conn.execute('DELETE FROM responses WHERE expires_at <= ?', (time.time(),))
+        return cursor.rowcount
+
+    def scan(self) -> Iterator[CacheEntry]:
+        """Yield every written entry that has not expired, call :meth:`flush` first to include the queued ones.
+
+        Unlike the other methods it does not write the queue itself, so it can run in a worker thread
+        while the event loop keeps queueing entries.
+        """
+        # One sequential pass over the table, which is not counted as an access of every entry.
+        rows = self.conn.execute(
+            'SELECT key, route, language, status, encoding, body, created_at, expires_at, manifest '
+            'FROM responses WHERE expires_at IS NULL OR expires_at > ?',
+            (time.time(),),
+        )
+        for key, route, language, status, encoding, body, created_at, expires_at, manifest in rows:
+            yield CacheEntry(
+                key, route, language, status, _decompress(body, encoding), created_at, expires_at, manifest
+            )
+
+    def clear(self) -> None:
+        self._accesses.clear()
+        self._pending.clear()
+        self.flush()
+        self.conn.execute('DELETE FROM responses')
+
+    def acquire(self, key: str, timeout: float) -> str | None:
+        """
+        Take the fetch lock of ``key``, shared by every process using this database.
+
+        Parameters
+        ----------
+        key : str
+            The cache key about to be fetched.
+        timeout : float
+            Seconds after which the lock is considered abandoned and can be taken by someone else,
+            so a holder that crashed does not block the key forever.
+
+        Returns:
+        -------
+        str | None
+            A token for :meth:`release`, or None when the lock is held by someone else.
+        """
+        token = f'{os.getpid()}:{secrets.token_hex(8)}'
+        now = time.time()
+        cursor = self.conn.execute(
+            'INSERT INTO fetch_locks (key, owner, expires_at) VALUES (?, ?, ?) '
+            'ON CONFLICT (key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at '
+            'WHERE fetch_locks.expires_at <= ?',
+            (key, token, now + timeout, now),
+        )
+        return token if cursor.rowcount > 0 else None
+
+    def release(self, key: str, token: str) -> bool:
+        """Release a fetch lock taken by :meth:`acquire`, unless it has expired and been taken over since."""
+        if key in self._pending:
+            # Released together with the entry, waiting processes poll for the entry.
+            self._pending_releases[key] = token
+            return True
+        try:
+            cursor = self.conn.execute('DELETE FROM fetch_locks WHERE key = ? AND owner = ?', (key, token))
+        except sqlite3.OperationalError as exc:
+            if not _is_busy(exc):
+                raise
+            # Released by the next write, processes waiting on it find the entry meanwhile.
+            self._pending_releases[key] = token
+            return True
+        return cursor.rowcount > 0
+
+    def acquire_or_get(self, key: str, timeout: float) -> tuple[str | None, CacheEntry | None]:
+        """Return the entry stored under ``key``, or take its fetch lock in the same transaction when there is none."""
+        if key in self._pending:
+            return None, self.get(key)
+        # The write lock is taken upfront, so no other process can store the entry in between.
+        try:
+            with self.conn:
+                self.conn.execute('BEGIN IMMEDIATE')
+                entry = self.get(key)
+                if entry is not None:
+                    return None, entry
+                return self.acquire(key, timeout), None
+        except sqlite3.OperationalError as exc:
+            if not _is_busy(exc):
+                raise
+            # Another process is writing, possibly the entry, so wait like for a held lock.
+            return None, None
+
+    def entries(self, pattern: str = '*', *, language: str | None = None) -> list[CacheEntryInfo]:
+        """
+        List the stored entries whose route or key matches ``pattern``.
+
+        Parameters
+        ----------
+        pattern : str
+            A glob pattern (``*``, ``?`` and ``[...]``) matched against the route template
+            (e.g. ``/weapons/skinlevels/{uuid}``) and the cache key (e.g. ``/agents?language=ja-JP``).
+        language : str | None
+            Only list entries for this language.
+
+        Returns:
+        -------
+        list[CacheEntryInfo]
+            The matching entries ordered by key.
+        """
+        self.flush()
+        self.flush_accesses()
+        where, params = self._match(pattern, language)
+        rows = self.conn.execute(
+            f'SELECT {_INFO_COLUMNS} FROM responses WHERE {where} ORDER BY key',  # noqa: S608
+            params,
+        ).fetchall()
+        return list(starmap(CacheEntryInfo, rows))
+
+    def info(self, key: str) -> CacheEntryInfo | None:
+        """Return an entry without reading its body, expired entries included."""
+        pending = self._pending.get(key)
+        if pending is not None:
+            # Not compressed yet, so the stored size is not known.
+            return CacheEntryInfo(
+                key=key,
+                route=pending.route,
+                language=pending.language,
+                status=pending.status,
+                size=len(pending.body),
+                stored_size=len(pending.body),
+                created_at=pending.created_at,
+                expires_at=pending.expires_at,
+                accessed_at=pending.created_at,
+                hits=0,
+            )
+
+        row = self.conn.execute(f'SELECT {_INFO_COLUMNS} FROM responses WHERE key = ?', (key,)).fetchone()  # noqa: S608
+        return None if row is None else CacheEntryInfo(*row)
+
+    def purge(self, pattern: str, *, language: str | None = None) -> int:
+        """Delete the entries matched like :meth:`entries` and return how many were deleted."""
+        self.flush()
+        where, params = self._match(pattern, language)
+        cursor = self.conn.execute(f'DELETE FROM responses WHERE {where}', params)  # noqa: S608
+        return cursor.rowcount
+
+    @staticmethod
+    def _match(pattern: str, language: str | None) -> tuple[str, tuple[str, ...]]:
+        if language is None:
+            return '(route GLOB ? OR key GLOB ?)', (pattern, pattern)
+        return '(route GLOB ? OR key GLOB ?) AND language = ?', (pattern, pattern, language)
+
+    def usage(self) -> list[CacheUsage]:
+        """Return the number of entries and bytes stored per route and language."""
+        self.flush()
+        rows = self.conn.execute(
+            'SELECT route, language, COUNT(*), SUM(size), SUM(stored_size) '
+            'FROM responses GROUP BY route, language ORDER BY route, language'
+        ).fetchall()
+        return list(starmap(CacheUsage, rows))
+
+    def flush_accesses(self) -> None:
+        """Write the access times and hit counts recorded by :meth:`get` back to the database."""
+        if not self._accesses:
+            return
+
+        accesses = [(accessed_at, hits, key) for key, (accessed_at, hits) in self._accesses.items()]
+        self._accesses.clear()
+        with self.conn:
+            self.conn.execute('BEGIN')
+            self.conn.executemany(
+                'UPDATE responses SET accessed_at = max(accessed_at, ?), hits = hits + ? WHERE key = ?',
+                accesses,
+            )
+
+    def total_size(self) -> int:
+        """Return the number of bytes used by the stored (compressed) bodies."""
+        self.flush()
+        (total,) = self.conn.execute('SELECT COALESCE(SUM(stored_size), 0) FROM responses').fetchone()
+        return total  # type: ignore[no-any-return]
+
+    def evict(self, max_bytes: int, *, batch: int = 256) -> int:
+        """
+        Evict one batch of entries if the cache is larger than ``max_bytes``.
+
+        Call it repeatedly until it returns ``0`` to bring the cache under the limit without
+        holding the write lock for long.
+
+        Parameters
+        ----------
+        max_bytes : int
+            The size limit for the stored bodies.
+        batch : int
+            The maximum number of entries removed by this call.
+
+        Returns:
+        -------
+        int
+            The number of evicted entries.
+        """
+        self.flush_accesses()
+        excess = self.total_size() - max_bytes
+        if excess <= 0:
+            return 0
+
+        victims: list[tuple[str]] = []
+        for key, stored_size in self.eviction.select(self.conn, batch):
+            victims.append((key,))
+            excess -= stored_size
+            if excess <= 0:
+                break
+
+        with self.conn:
+            self.conn.execute('BEGIN')
+            self.conn.executemany('DELETE FROM responses WHERE key = ?', victims)
+
+        _log.debug('evicted %s cache entries using the %s policy', len(victims), self.eviction.name)
+        return len(victims)
+
+    def compact(self, pages: int | None = None) -> int:
+        """
+        Return free pages to the file system so the database file shrinks.
+
+        Parameters
+        ----------
+        pages : int | None
+            The maximum number of pages to release. Defaults to all free pages.
+
+        Returns:
+        -------
+        int
+            The number of released pages.
+        """
+        (before,) = self.conn.execute('PRAGMA freelist_count').fetchone()
+        self.conn.execute(f'PRAGMA incremental_vacuum({pages or 0:d})').fetchall()
+        (after,) = self.conn.execute('PRAGMA freelist_count').fetchone()
+        if self.pragmas['journal_mode'] == 'wal':
+            self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchall()
+        return before - after  # type: ignore[no-any-return]
+
+    def __len__(self) -> int:
+        self.flush()
+        (count,) = self.conn.execute('SELECT COUNT(*) FROM responses').fetchone()
+        return count  # type: ignore[no-any-return]
@@ -25,32 +25,12 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Literal
+from types import GenericAlias
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
+from . import utils
+from .enums import Language
 from .http import HTTPClient
-from .models.agents import Agent
-from .models.base import Response
-from .models.buddies import Buddy, Level as BuddyLevel
-from .models.bundles import Bundle
-from .models.ceremonies import Ceremony
-from .models.competitive_tiers import CompetitiveTier
-from .models.content_tiers import ContentTier
-from .models.contracts import Contract
-from .models.currencies import Currency
-from .models.events import Event
-from .models.flex import Flex
-from .models.game_modes import Equippable as GameModeEquippable, GameMode
-from .models.gear import Gear
-from .models.level_borders import LevelBorder
-from .models.maps import Map
-from .models.missions import Mission
-from .models.player_cards import PlayerCard
-from .models.player_titles import PlayerTitle
-from .models.seasons import Competitive as CompetitiveSeason, Season
-from .models.sprays import Level as SprayLevel, Spray
-from .models.themes import Theme
-from .models.version import Version
-from .models.weapons import Chroma as SkinChroma, Level as SkinLevel, Skin, Weapon
 
 # fmt: off
 __all__ = (
@@ -59,20 +39,143 @@ __all__ = (
 # fmt: on
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
     from pathlib import Path
     from types import TracebackType
     from typing import TypeAlias
 
     from aiohttp import ClientSession
+    from pydantic import TypeAdapter
+    from pydantic_core import SchemaValidator
     from typing_extensions import Self
 
-    from .enums import Language
+    from .bloom import FilterStats
+    from .cache import CacheBackend, CacheEntryInfo, CachePolicy, EvictionPolicy
+    from .http import HydrationReport, PrefetchProgress, PrefetchReport
+    from .models import (
+        agents,
+        base,
+        buddies,
+        bundles,
+        ceremonies,
+        columns,
+        competitive_tiers,
+        content_tiers,
+        contracts,
+        currencies,
+        events,
+        flex,
+        game_modes,
+        gear,
+        level_borders,
+        maps,
+        missions,
+        player_cards,
+        player_titles,
+        seasons,
+        sprays,
+        themes,
+        version,
+        weapons,
+    )
+    from .models.agents import Agent
+    from .models.base import BaseModel
+    from .models.buddies import Buddy, Level as BuddyLevel
+    from .models.bundles import Bundle
+    from .models.ceremonies import Ceremony
+    from .models.columns import ModelList
+    from .models.competitive_tiers import CompetitiveTier
+    from .models.content_tiers import ContentTier
+    from .models.contracts import Contract
+    from .models.currencies import Currency
+    from .models.events import Event
+    from .models.flex import Flex
+    from .models.game_modes import Equippable as GameModeEquippable, GameMode
+    from .models.gear import Gear
+    from .models.level_borders import LevelBorder
+    from .models.maps import Map
+    from .models.missions import Mission
+    from .models.player_cards import PlayerCard
+    from .models.player_titles import PlayerTitle
+    from .models.seasons import Competitive as CompetitiveSeason, Season
+    from .models.sprays import Level as SprayLevel, Spray
+    from .models.themes import Theme
+    from .models.version import Version
+    from .models.weapons import Chroma as SkinChroma, Level as SkinLevel, Skin, Weapon
+    from .snapshot import Snapshot
+    from .stats import CacheStats
 
     LanguageOption: TypeAlias = Language | Literal['all']
+else:
+    # The models are imported by the first fetch_* method needing them, their schemas built on first validation.
+    agents = utils._lazy_import('valorant.models.agents')
+    base = utils._lazy_import('valorant.models.base')
+    buddies = utils._lazy_import('valorant.models.buddies')
+    bundles = utils._lazy_import('valorant.models.bundles')
+    ceremonies = utils._lazy_import('valorant.models.ceremonies')
+    columns = utils._lazy_import('valorant.models.columns')
+    competitive_tiers = utils._lazy_import('valorant.models.competitive_tiers')
+    content_tiers = utils._lazy_import('valorant.models.content_tiers')
+    contracts = utils._lazy_import('valorant.models.contracts')
+    currencies = utils._lazy_import('valorant.models.currencies')
+    events = utils._lazy_import('valorant.models.events')
+    flex = utils._lazy_import('valorant.models.flex')
+    game_modes = utils._lazy_import('valorant.models.game_modes')
+    gear = utils._lazy_import('valorant.models.gear')
+    level_borders = utils._lazy_import('valorant.models.level_borders')
+    maps = utils._lazy_import('valorant.models.maps')
+    missions = utils._lazy_import('valorant.models.missions')
+    player_cards = utils._lazy_import('valorant.models.player_cards')
+    player_titles = utils._lazy_import('valorant.models.player_titles')
+    seasons = utils._lazy_import('valorant.models.seasons')
+    sprays = utils._lazy_import('valorant.models.sprays')
+    themes = utils._lazy_import('valorant.models.themes')
+    version = utils._lazy_import('valorant.models.version')
+    weapons = utils._lazy_import('valorant.models.weapons')
+
+T = TypeVar('T')
+ModelT = TypeVar('ModelT', bound='BaseModel')
 
 _log = logging.getLogger(__name__)
 
 
+def _validated_types() -> Iterator[Any]:
+    """Yield every type validated by the fetch_* methods, importing their models."""
+    yield version.Version
+    for model in (
+        agents.Agent,
+        buddies.Buddy,
+        buddies.Level,
+        bundles.Bundle,
+        ceremonies.Ceremony,
+        seasons.Competitive,
+        competitive_tiers.CompetitiveTier,
+        content_tiers.ContentTier,
+        contracts.Contract,
+        currencies.Currency,
+        events.Event,
+        flex.Flex,
+        game_modes.GameMode,
+        game_modes.Equippable,
+        gear.Gear,
+        level_borders.LevelBorder,
+        maps.Map,
+        missions.Mission,
+        player_cards.PlayerCard,
+        player_titles.PlayerTitle,
+        seasons.Season,
+        weapons.Skin,
+        weapons.Chroma,
+        weapons.Level,
+        sprays.Spray,
+        sprays.Level,
+        themes.Theme,
+        weapons.Weapon,
+    ):
+        yield model
+        yield GenericAlias(list, model)
+
+
 class Client:
     # @overload
     # def __init__(
@@ -96,7 +199,7 @@ class Client:
     #     cache_ttl: int = 60 * 60 * 24,  # 24 hours in seconds
     # ) -> None: ...
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         language: LanguageOption | None = None,
         *,
@@ -104,7 +207,19 @@ class Client:
         # cache options
         enable_cache: bool = True,
         cache_path: str | Path | None = None,
-        cache_ttl: int = 60 * 60 * 24,  # 24 hours in seconds
+        cache_ttl: int | None = None,
+        cache_policies: Mapping[str, CachePolicy] | None = None,
+        cache_pragmas: Mapping[str, int | str] | None = None,
+        max_cache_bytes: int | None = None,
+        cache_eviction: Literal['lru', 'lfu'] | EvictionPolicy = 'lru',
+        cache_write_behind: bool = False,
+        cache_backend: Literal['sqlite', 'filesystem', 'memory'] | CacheBackend = 'sqlite',
+        snapshot: str | Path | None = None,
+        lazy_validation: bool = False,
+        locales: Iterable[Language | str] | None = None,
+        intern_strings: bool = False,
+        compact_urls: bool = False,
+        validation: Literal['strict', 'lax', 'trusted'] = 'lax',
     ) -> None:
         """
         Initialize the Client.
@@ -114,13 +229,56 @@ class Client:
         language : LanguageOption | None
             Default language for API requests.
         session : ClientSession | None
-            Optional custom aiohttp session. If provided, cache settings are ignored.
+            Optional custom aiohttp session. If provided, cache settings are ignored unless ``cache_backend``
+            is a backend instance.
         enable_cache : bool
             Whether to enable HTTP response caching. Defaults to True.
         cache_path : str | Path | None
             Path to the cache folder. Defaults to './.valorant_cache'. If None, uses the default cache path.
-        cache_ttl : int
-            Cache expiration time in seconds. Defaults to 86400 (24 hours).
+        cache_ttl : int | None
+            Cache expiration time in seconds for every route. Defaults to None, which uses TTLs tuned per
+            endpoint family (an hour for events, missions and seasons, days for patch-bound data).
+        cache_policies : Mapping[str, CachePolicy] | None
+            Per-route cache policies (TTL, whether 404s are cached, whether stale entries may be served)
+            keyed by route path, merged over the defaults.
+        cache_pragmas : Mapping[str, int | str] | None
+            SQLite pragmas for the cache database, merged over the high-concurrency defaults.
+        max_cache_bytes : int | None
+            Size limit for the cache. Entries are evicted in the background once it is exceeded.
+        cache_eviction : Literal['lru', 'lfu'] | EvictionPolicy
+            The eviction policy used with ``max_cache_bytes``. Defaults to 'lru'.
+        cache_write_behind : bool
+            Write new cache entries in batches in the background instead of before returning each response.
+            Pending entries are always written by :meth:`close`. Only used by the SQLite backend. Defaults to False.
+        cache_backend : Literal['sqlite', 'filesystem', 'memory'] | CacheBackend
+            Where responses are cached: a SQLite database shared by every process using the cache folder,
+            one file per response in the cache folder, or the memory of this process. Any
+            :class:`~valorant.cache.CacheBackend` instance can be passed as well. Defaults to 'sqlite'.
+        snapshot : str | Path | None
+            A snapshot file written by :meth:`export_snapshot`. ``fetch_*`` calls it covers are served from it
+            with no network and no cache writes. Defaults to None.
+        lazy_validation : bool
+            Validate the heavy nested collections (``Weapon.skins``, ``Skin.chromas`` and ``Skin.levels``,
+            ``Content.chapters``, ``Map.callouts``, ``Buddy.levels`` and ``Spray.levels``) on first access
+            instead of with the model they belong to, so that reading the other fields costs nothing extra.
+            Validation errors of those fields are raised on first access. Defaults to False.
+        locales : Iterable[Language | str] | None
+            The locales kept by every :class:`~valorant.models.localization.LocalizedField` parsed from
+            ``language='all'`` responses, en-US is always kept. Texts of other locales are dropped while the
+            models are built and reading them raises :exc:`KeyError`. Defaults to keeping every locale.
+        intern_strings : bool
+            Intern the short strings of decoded responses, so that values repeated across the catalog are held
+            once. Defaults to False.
+        compact_urls : bool
+            Store media URLs and asset paths of the models without their common prefix, the full string is
+            rebuilt on every access. Defaults to False.
+        validation : Literal['strict', 'lax', 'trusted']
+            How responses are turned into models. 'lax' validates them and keeps fields unknown to the models,
+            'strict' rejects those fields and locales unknown to :class:`~valorant.enums.Language`, which helps
+            noticing API changes. 'trusted' validates responses of the API as 'lax' does, but builds the models
+            of responses served from the cache or the snapshot without validating them, see
+            :func:`~valorant.models.base.construct_trusted`. Enums of those models are then left as the strings
+            of the JSON. Defaults to 'lax'.
         """
         self.language = language
         self.http = HTTPClient(
@@ -128,8 +286,35 @@ class Client:
             enable_cache=enable_cache,
             cache_path=cache_path,
             cache_ttl=cache_ttl,
+            cache_policies=cache_policies,
+            cache_pragmas=cache_pragmas,
+            max_cache_bytes=max_cache_bytes,
+            cache_eviction=cache_eviction,
+            cache_write_behind=cache_write_behind,
+            cache_backend=cache_backend,
+            snapshot=snapshot,
+            intern_strings=intern_strings,
+            # Responses are only read by the validation, a copy per call would be wasted.
+            copy_responses=False,
         )
         self._closed: bool = False
+        # Passed to every model validation, read by the validators of lazy and localized fields and by
+        # construct_trusted.
+        context: dict[str, Any] = {}
+        if lazy_validation:
+            context['lazy'] = True
+        if locales is not None:
+            context['locales'] = frozenset({Language.american_english.value, *map(str, locales)})
+        if compact_urls:
+            context['compact'] = True
+        if validation == 'strict':
+            context['strict'] = True
+        elif validation not in {'lax', 'trusted'}:
+            raise ValueError(f'unknown validation mode: {validation!r}')  # noqa: TRY003
+        self._validation_context: dict[str, Any] | None = context or None
+        self._strict: bool = validation == 'strict'
+        self._compact: bool = compact_urls
+        self._trusted: bool = validation == 'trusted'
 
     async def __aenter__(self) -> Self:
         await self.start()
@@ -144,8 +329,18 @@ class Client:
         if not self.is_closed():
             await self.close()
 
-    async def start(self) -> None:
+    async def start(self, *, hydrate: bool = False) -> None:
+        """
+        Start the client.
+
+        Parameters
+        ----------
+        hydrate : bool
+            Load every live cache entry into memory before returning, see :meth:`hydrate`. Defaults to False.
+        """
         await self.http.start()
+        if hydrate:
+            await self.hydrate()
         _log.info('client started')
 
     def is_closed(self) -> bool:
@@ -162,71 +357,270 @@ class Client:
         self._closed = False
         self.http.clear()
 
+    def build_validators(self) -> None:
+        """
+        Build the validators of every ``fetch_*`` method now rather than on their first use.
+
+        The ``status`` envelope of the responses is checked by the HTTP client, the validators only go through
+        the ``data`` they wrap.
+        """
+        for tp in _validated_types():
+            self._validator(tp)
+
+    def _validator(self, tp: type[T]) -> TypeAdapter[T] | SchemaValidator:
+        if self._strict or self._compact:
+            return base.schema_validator(tp, strict=self._strict, compact=self._compact)
+        return base.type_adapter(tp)
+
+    def _is_trusted(self) -> bool:
+        # Only what the cache or the snapshot answered was validated before, when it was first fetched.
+        return self._trusted and self.http.served_locally()
+
+    def _validate(self, tp: type[T], data: Any) -> T:
+        if self._is_trusted():
+            return base.construct_trusted(tp, data['data'], self._validation_context)
+        validated: T = self._validator(tp).validate_python(data['data'], context=self._validation_context)
+        return validated
+
+    def _validate_list(self, model: type[ModelT], data: Any, fields: Iterable[str] | None) -> ModelList[ModelT]:
+        # With fields, the models only hold those, the others are neither validated nor stored.
+        if fields is None:
+            tp: Any = GenericAlias(list, model)
+            validated: list[ModelT] = self._validate(tp, data)
+        elif self._is_trusted():
+            validated = base.projection(model, fields).construct_trusted(data['data'], self._validation_context)
+        else:
+            projected = base.projection(model, fields, strict=self._strict, compact=self._compact)
+            validated = projected.validate_python(data['data'], context=self._validation_context)
+        return columns.ModelList(model, validated)
+
+    # cache
+
+    async def prefetch(
+        self,
+        endpoints: Iterable[str] | None = None,
+        languages: Iterable[LanguageOption | None] | None = None,
+        *,
+        concurrency: int = 8,
+        progress: Callable[[PrefetchProgress], None] | None = None,
+    ) -> PrefetchReport:
+        """
+        Warm the cache by fetching list endpoints in every given language.
+
+        Parameters
+        ----------
+        endpoints : Iterable[str] | None
+            Paths from :attr:`HTTPClient.LIST_ENDPOINTS` such as ``'/agents'``. Defaults to every list endpoint.
+        languages : Iterable[LanguageOption | None] | None
+            The languages to fetch. Defaults to the client language.
+        concurrency : int
+            The maximum number of requests in flight. Defaults to 8.
+        progress : Callable[[PrefetchProgress], None] | None
+            Called after every request, e.g. to print progress.
+
+        Returns:
+        -------
+        PrefetchReport
+            Request count, failures, elapsed time and byte totals.
+        """
+        return await self.http.prefetch(
+            endpoints,
+            [self.language] if languages is None else languages,
+            concurrency=concurrency,
+            progress=progress,
+        )
+
+    async def hydrate(self, *, threaded: bool = True) -> HydrationReport:
+        """
+        Load every live cache entry into memory, decoded, so that cached requests skip the cache storage.
+
+        Responses stored afterwards replace their loaded entry. Memory use grows with the cache, see
+        :attr:`HydrationReport.resident`.
+
+        Parameters
+        ----------
+        threaded : bool
+            Read and decode the entries in a worker thread. Defaults to True.
+
+        Returns:
+        -------
+        HydrationReport
+            Entry count, body and resident sizes and elapsed time.
+        """
+        report = await self.http.hydrate(threaded=threaded)
+        _log.info(
+            'hydrated %d cache entries (%d bytes, ~%d bytes in memory) in %.3fs',
+            report.entries,
+            report.size,
+            report.resident,
+            report.elapsed,
+        )
+        return report
+
+    async def export_snapshot(
+        self,
+        path: str | Path,
+        *,
+        endpoints: Iterable[str] | None = None,
+        languages: Iterable[LanguageOption | None] | None = None,
+        concurrency: int = 8,
+        indexed: bool = False,
+    ) -> Snapshot:
+        """
+        Write every list endpoint in the given languages to one snapshot file.
+
+        The snapshot is tagged with the current ``/version`` manifest and can be loaded with
+        ``Client(snapshot=path)`` on other machines.
+
+        Parameters
+        ----------
+        path : str | Path
+            Where to write the snapshot.
+        endpoints : Iterable[str] | None
+            Paths from :attr:`HTTPClient.LIST_ENDPOINTS`. Defaults to every list endpoint.
+        languages : Iterable[LanguageOption | None] | None
+            The languages to export. Defaults to the client language.
+        concurrency : int
+            The maximum number of requests in flight. Defaults to 8.
+        indexed : bool
+            Write an uncompressed snapshot with a sorted uuid index per endpoint. It is larger, but lookups
+            are a binary search over the memory-mapped file and nothing is held on the heap, so many worker
+            processes can share one copy through the page cache. Defaults to False.
+
+        Returns:
+        -------
+        Snapshot
+            The written snapshot, opened for reading. Close it when done.
+        """
+        return await self.http.export_snapshot(
+            path,
+            endpoints,
+            [self.language] if languages is None else languages,
+            concurrency=concurrency,
+            indexed=indexed,
+        )
+
+    def cache_stats(self) -> CacheStats:
+        """
+        Return cache statistics grouped by route and by language.
+
+        Hits, misses, stale serves and their latency histograms are counted by this client since it was
+        created, entry counts and bytes are read from the cache database.
+
+        Returns:
+        -------
+        CacheStats
+            The statistics, :meth:`CacheStats.to_dict` turns them into plain data.
+        """
+        return self.http.cache_stats()
+
+    def cache_entries(self, pattern: str = '*', *, language: LanguageOption | None = None) -> list[CacheEntryInfo]:
+        """
+        List the cached entries whose route or cache key matches a glob pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            A glob pattern such as ``/weapons/*`` or ``/agents?*language=ja-JP*``. Defaults to every entry.
+        language : LanguageOption | None
+            Only list entries for this language.
+
+        Returns:
+        -------
+        list[CacheEntryInfo]
+            The matching entries, without their bodies.
+        """
+        return self.http.cache_entries(pattern, language=language)
+
+    def purge_cache(self, pattern: str, *, language: LanguageOption | None = None) -> int:
+        """
+        Delete the cached entries matching a glob pattern, see :meth:`cache_entries`.
+
+        Returns:
+        -------
+        int
+            The number of deleted entries.
+        """
+        return self.http.purge_cache(pattern, language=language)
+
+    def uuid_filter_stats(self) -> list[FilterStats]:
+        """
+        Return the uuid filters built from the loaded lists.
+
+        Once a full list such as ``/sprays`` has been loaded, fetching an uuid missing from it raises
+        :exc:`NotFound` without a request, for as long as the list is fresh and the game version unchanged.
+
+        Returns:
+        -------
+        list[FilterStats]
+            The number of uuids, memory use and expected false positive rate per list endpoint.
+        """
+        return self.http.uuid_filter_stats()
+
     # agents
 
     async def fetch_agent(self, uuid: str, /, *, language: LanguageOption | None = None) -> Agent:
         data = await self.http.get_agent(uuid, language=language or self.language)
-        agent = Response[Agent].model_validate(data)
-        return agent.data
+        return self._validate(agents.Agent, data)
 
     async def fetch_agents(
         self,
         *,
         language: LanguageOption | None = None,
         is_playable_character: Literal[True] | None = None,
-    ) -> list[Agent]:
+        fields: Iterable[str] | None = None,
+    ) -> ModelList[Agent]:
         data = await self.http.get_agents(
             language=language or self.language,
             is_playable_character=is_playable_character,
         )
-        agents = Response[list[Agent]].model_validate(data)
-        return agents.data
+        return self._validate_list(agents.Agent, data, fields)
 
     # buddies
 
     async def fetch_buddy(self, uuid: str, /, *, language: LanguageOption | None = None) -> Buddy:
         data = await self.http.get_buddy(uuid, language=language or self.language)
-        buddy = Response[Buddy].model_validate(data)
-        return buddy.data
+        return self._validate(buddies.Buddy, data)
 
-    async def fetch_buddies(self, *, language: LanguageOption | None = None) -> list[Buddy]:
+    async def fetch_buddies(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Buddy]:
         data = await self.http.get_buddies(language=language or self.language)
-        buddies = Response[list[Buddy]].model_validate(data)
-        return buddies.data
+        return self._validate_list(buddies.Buddy, data, fields)
 
     async def fetch_buddy_level(self, uuid: str, /, *, language: LanguageOption | None = None) -> BuddyLevel:
         data = await self.http.get_buddy_level(uuid, language=language or self.language)
-        buddy_level = Response[BuddyLevel].model_validate(data)
-        return buddy_level.data
+        return self._validate(buddies.Level, data)
 
-    async def fetch_buddy_levels(self, *, language: LanguageOption | None = None) -> list[BuddyLevel]:
+    async def fetch_buddy_levels(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[BuddyLevel]:
         data = await self.http.get_buddy_levels(language=language or self.language)
-        buddy_levels = Response[list[BuddyLevel]].model_validate(data)
-        return buddy_levels.data
+        return self._validate_list(buddies.Level, data, fields)
 
     # bundles
 
     async def fetch_bundle(self, uuid: str, /, *, language: LanguageOption | None = None) -> Bundle:
         data = await self.http.get_bundle(uuid, language=language or self.language)
-        bundle = Response[Bundle].model_validate(data)
-        return bundle.data
+        return self._validate(bundles.Bundle, data)
 
-    async def fetch_bundles(self, *, language: LanguageOption | None = None) -> list[Bundle]:
+    async def fetch_bundles(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Bundle]:
         data = await self.http.get_bundles(language=language or self.language)
-        bundles = Response[list[Bundle]].model_validate(data)
-        return bundles.data
+        return self._validate_list(bundles.Bundle, data, fields)
 
     # ceremonies
 
     async def fetch_ceremony(self, uuid: str, /, *, language: LanguageOption | None = None) -> Ceremony:
         data = await self.http.get_ceremony(uuid, language=language or self.language)
-        ceremony = Response[Ceremony].model_validate(data)
-        return ceremony.data
+        return self._validate(ceremonies.Ceremony, data)
 
-    async def fetch_ceremonies(self, *, language: LanguageOption | None = None) -> list[Ceremony]:
+    async def fetch_ceremonies(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Ceremony]:
         data = await self.http.get_ceremonies(language=language or self.language)
-        ceremonies = Response[list[Ceremony]].model_validate(data)
-        return ceremonies.data
+        return self._validate_list(ceremonies.Ceremony, data, fields)
 
     # competitive_tiers
 
@@ -234,271 +628,268 @@ class Client:
         self, uuid: str, /, *, language: LanguageOption | None = None
     ) -> CompetitiveTier | None:
         data = await self.http.get_competitive_tier(uuid, language=language or self.language)
-        competitive_tier = Response[CompetitiveTier].model_validate(data)
-        return competitive_tier.data
+        return self._validate(competitive_tiers.CompetitiveTier, data)
 
-    async def fetch_competitive_tiers(self, *, language: LanguageOption | None = None) -> list[CompetitiveTier]:
+    async def fetch_competitive_tiers(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[CompetitiveTier]:
         data = await self.http.get_competitive_tiers(language=language or self.language)
-        competitive_tiers = Response[list[CompetitiveTier]].model_validate(data)
-        return competitive_tiers.data
+        return self._validate_list(competitive_tiers.CompetitiveTier, data, fields)
 
     # content_tiers
 
     async def fetch_content_tier(self, uuid: str, /, *, language: LanguageOption | None = None) -> ContentTier:
         data = await self.http.get_content_tier(uuid, language=language or self.language)
-        content_tier = Response[ContentTier].model_validate(data)
-        return content_tier.data
+        return self._validate(content_tiers.ContentTier, data)
 
-    async def fetch_content_tiers(self, *, language: LanguageOption | None = None) -> list[ContentTier]:
+    async def fetch_content_tiers(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[ContentTier]:
         data = await self.http.get_content_tiers(language=language or self.language)
-        content_tiers = Response[list[ContentTier]].model_validate(data)
-        return content_tiers.data
+        return self._validate_list(content_tiers.ContentTier, data, fields)
 
     # contracts
 
     async def fetch_contract(self, uuid: str, /, *, language: LanguageOption | None = None) -> Contract:
         data = await self.http.get_contract(uuid, language=language or self.language)
-        contract = Response[Contract].model_validate(data)
-        return contract.data
+        return self._validate(contracts.Contract, data)
 
-    async def fetch_contracts(self, *, language: LanguageOption | None = None) -> list[Contract]:
+    async def fetch_contracts(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Contract]:
         data = await self.http.get_contracts(language=language or self.language)
-        contracts = Response[list[Contract]].model_validate(data)
-        return contracts.data
+        return self._validate_list(contracts.Contract, data, fields)
 
     # currencies
 
     async def fetch_currency(self, uuid: str, /, *, language: LanguageOption | None = None) -> Currency:
         data = await self.http.get_currency(uuid, language=language or self.language)
-        currency = Response[Currency].model_validate(data)
-        return currency.data
+        return self._validate(currencies.Currency, data)
 
-    async def fetch_currencies(self, *, language: LanguageOption | None = None) -> list[Currency]:
+    async def fetch_currencies(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Currency]:
         data = await self.http.get_currencies(language=language or self.language)
-        currencies = Response[list[Currency]].model_validate(data)
-        return currencies.data
+        return self._validate_list(currencies.Currency, data, fields)
 
     # events
 
     async def fetch_event(self, uuid: str, /, *, language: LanguageOption | None = None) -> Event:
         data = await self.http.get_event(uuid, language=language or self.language)
-        event = Response[Event].model_validate(data)
-        return event.data
+        return self._validate(events.Event, data)
 
-    async def fetch_events(self, *, language: LanguageOption | None = None) -> list[Event]:
+    async def fetch_events(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Event]:
         data = await self.http.get_events(language=language or self.language)
-        events = Response[list[Event]].model_validate(data)
-        return events.data
+        return self._validate_list(events.Event, data, fields)
 
     # flex
 
     async def fetch_flex(self, uuid: str, /, *, language: LanguageOption | None = None) -> Flex:
         data = await self.http.get_flex(uuid, language=language or self.language)
-        flex = Response[Flex].model_validate(data)
-        return flex.data
+        return self._validate(flex.Flex, data)
 
-    async def fetch_flexes(self, *, language: LanguageOption | None = None) -> list[Flex]:
+    async def fetch_flexes(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Flex]:
         data = await self.http.get_all_flex(language=language or self.language)
-        flexes = Response[list[Flex]].model_validate(data)
-        return flexes.data
+        return self._validate_list(flex.Flex, data, fields)
 
     # game_modes
 
     async def fetch_game_mode(self, uuid: str, /, *, language: LanguageOption | None = None) -> GameMode:
         data = await self.http.get_game_mode(uuid, language=language or self.language)
-        game_mode = Response[GameMode].model_validate(data)
-        return game_mode.data
+        return self._validate(game_modes.GameMode, data)
 
-    async def fetch_game_modes(self, *, language: LanguageOption | None = None) -> list[GameMode]:
+    async def fetch_game_modes(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[GameMode]:
         data = await self.http.get_game_modes(language=language or self.language)
-        game_modes = Response[list[GameMode]].model_validate(data)
-        return game_modes.data
+        return self._validate_list(game_modes.GameMode, data, fields)
 
     async def fetch_game_mode_equippable(
         self, uuid: str, /, *, language: LanguageOption | None = None
     ) -> GameModeEquippable | None:
         data = await self.http.get_game_mode_equippable(uuid, language=language or self.language)
-        game_mode_equippable = Response[GameModeEquippable].model_validate(data)
-        return game_mode_equippable.data
+        return self._validate(game_modes.Equippable, data)
 
-    async def fetch_game_mode_equippables(self, *, language: LanguageOption | None = None) -> list[GameModeEquippable]:
+    async def fetch_game_mode_equippables(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[GameModeEquippable]:
         data = await self.http.get_game_mode_equippables(language=language or self.language)
-        game_mode_equippables = Response[list[GameModeEquippable]].model_validate(data)
-        return game_mode_equippables.data
+        return self._validate_list(game_modes.Equippable, data, fields)
 
     # gear
 
     async def fetch_gear(self, uuid: str, /, *, language: LanguageOption | None = None) -> Gear:
         data = await self.http.get_gear(uuid, language=language or self.language)
-        gear = Response[Gear].model_validate(data)
-        return gear.data
+        return self._validate(gear.Gear, data)
 
-    async def fetch_gears(self, *, language: LanguageOption | None = None) -> list[Gear]:
+    async def fetch_gears(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Gear]:
         data = await self.http.get_all_gear(language=language or self.language)
-        gears = Response[list[Gear]].model_validate(data)
-        return gears.data
+        return self._validate_list(gear.Gear, data, fields)
 
     # level_borders
 
     async def fetch_level_border(self, uuid: str, /, *, language: LanguageOption | None = None) -> LevelBorder:
         data = await self.http.get_level_border(uuid, language=language or self.language)
-        level_border = Response[LevelBorder].model_validate(data)
-        return level_border.data
+        return self._validate(level_borders.LevelBorder, data)
 
-    async def fetch_level_borders(self, *, language: LanguageOption | None = None) -> list[LevelBorder]:
+    async def fetch_level_borders(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[LevelBorder]:
         data = await self.http.get_level_borders(language=language or self.language)
-        level_borders = Response[list[LevelBorder]].model_validate(data)
-        return level_borders.data
+        return self._validate_list(level_borders.LevelBorder, data, fields)
 
     # maps
 
     async def fetch_map(self, uuid: str, /, *, language: LanguageOption | None = None) -> Map:
         data = await self.http.get_map(uuid, language=language or self.language)
-        map_ = Response[Map].model_validate(data)
-        return map_.data
+        return self._validate(maps.Map, data)
 
-    async def fetch_maps(self, *, language: LanguageOption | None = None) -> list[Map]:
+    async def fetch_maps(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Map]:
         data = await self.http.get_maps(language=language or self.language)
-        maps = Response[list[Map]].model_validate(data)
-        return maps.data
+        return self._validate_list(maps.Map, data, fields)
 
     # missions
 
     async def fetch_mission(self, uuid: str, /, *, language: LanguageOption | None = None) -> Mission:
         data = await self.http.get_mission(uuid, language=language or self.language)
-        mission = Response[Mission].model_validate(data)
-        return mission.data
+        return self._validate(missions.Mission, data)
 
-    async def fetch_missions(self, *, language: LanguageOption | None = None) -> list[Mission]:
+    async def fetch_missions(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Mission]:
         data = await self.http.get_missions(language=language or self.language)
-        missions = Response[list[Mission]].model_validate(data)
-        return missions.data
+        return self._validate_list(missions.Mission, data, fields)
 
     # player cards
 
     async def fetch_player_card(self, uuid: str, /, *, language: LanguageOption | None = None) -> PlayerCard:
         data = await self.http.get_player_card(uuid, language=language or self.language)
-        player_card = Response[PlayerCard].model_validate(data)
-        return player_card.data
+        return self._validate(player_cards.PlayerCard, data)
 
-    async def fetch_player_cards(self, *, language: LanguageOption | None = None) -> list[PlayerCard]:
+    async def fetch_player_cards(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[PlayerCard]:
         data = await self.http.get_player_cards(language=language or self.language)
-        player_cards = Response[list[PlayerCard]].model_validate(data)
-        return player_cards.data
+        return self._validate_list(player_cards.PlayerCard, data, fields)
 
     # player titles
 
     async def fetch_player_title(self, uuid: str, /, *, language: LanguageOption | None = None) -> PlayerTitle:
         data = await self.http.get_player_title(uuid, language=language or self.language)
-        player_title = Response[PlayerTitle].model_validate(data)
-        return player_title.data
+        return self._validate(player_titles.PlayerTitle, data)
 
-    async def fetch_player_titles(self, *, language: LanguageOption | None = None) -> list[PlayerTitle]:
+    async def fetch_player_titles(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[PlayerTitle]:
         data = await self.http.get_player_titles(language=language or self.language)
-        player_titles = Response[list[PlayerTitle]].model_validate(data)
-        return player_titles.data
+        return self._validate_list(player_titles.PlayerTitle, data, fields)
 
     # seasons
 
     async def fetch_season(self, uuid: str, /, *, language: LanguageOption | None = None) -> Season:
         data = await self.http.get_season(uuid, language=language or self.language)
-        season = Response[Season].model_validate(data)
-        return season.data
+        return self._validate(seasons.Season, data)
 
-    async def fetch_seasons(self, *, language: LanguageOption | None = None) -> list[Season]:
+    async def fetch_seasons(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Season]:
         data = await self.http.get_seasons(language=language or self.language)
-        seasons = Response[list[Season]].model_validate(data)
-        return seasons.data
+        return self._validate_list(seasons.Season, data, fields)
 
     async def fetch_competitive_season(self, uuid: str, /) -> CompetitiveSeason:
         data = await self.http.get_competitive_season(uuid)
-        competitive_season = Response[CompetitiveSeason].model_validate(data)
-        return competitive_season.data
+        return self._validate(seasons.Competitive, data)
 
-    async def fetch_competitive_seasons(self) -> list[CompetitiveSeason]:
+    async def fetch_competitive_seasons(self, *, fields: Iterable[str] | None = None) -> ModelList[CompetitiveSeason]:
         data = await self.http.get_competitive_seasons()
-        competitive_seasons = Response[list[CompetitiveSeason]].model_validate(data)
-        return competitive_seasons.data
+        return self._validate_list(seasons.Competitive, data, fields)
 
     # sprays
 
     async def fetch_spray(self, uuid: str, /, *, language: LanguageOption | None = None) -> Spray:
         data = await self.http.get_spray(uuid, language=language or self.language)
-        spray = Response[Spray].model_validate(data)
-        return spray.data
+        return self._validate(sprays.Spray, data)
 
-    async def fetch_sprays(self, *, language: LanguageOption | None = None) -> list[Spray]:
+    async def fetch_sprays(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Spray]:
         data = await self.http.get_sprays(language=language or self.language)
-        sprays = Response[list[Spray]].model_validate(data)
-        return sprays.data
+        return self._validate_list(sprays.Spray, data, fields)
 
     async def fetch_spray_level(self, uuid: str, /, *, language: LanguageOption | None = None) -> SprayLevel:
         data = await self.http.get_spray_level(uuid, language=language or self.language)
-        spray_level = Response[SprayLevel].model_validate(data)
-        return spray_level.data
+        return self._validate(sprays.Level, data)
 
-    async def fetch_spray_levels(self, *, language: LanguageOption | None = None) -> list[SprayLevel]:
+    async def fetch_spray_levels(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[SprayLevel]:
         data = await self.http.get_spray_levels(language=language or self.language)
-        spray_levels = Response[list[SprayLevel]].model_validate(data)
-        return spray_levels.data
+        return self._validate_list(sprays.Level, data, fields)
 
     # themes
 
     async def fetch_theme(self, uuid: str, /, *, language: LanguageOption | None = None) -> Theme:
         data = await self.http.get_theme(uuid, language=language or self.language)
-        theme = Response[Theme].model_validate(data)
-        return theme.data
+        return self._validate(themes.Theme, data)
 
-    async def fetch_themes(self, *, language: LanguageOption | None = None) -> list[Theme]:
+    async def fetch_themes(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Theme]:
         data = await self.http.get_themes(language=language or self.language)
-        themes = Response[list[Theme]].model_validate(data)
-        return themes.data
+        return self._validate_list(themes.Theme, data, fields)
 
     # weapons
 
     async def fetch_weapon(self, uuid: str, /, *, language: LanguageOption | None = None) -> Weapon:
         data = await self.http.get_weapon(uuid, language=language or self.language)
-        weapon = Response[Weapon].model_validate(data)
-        return weapon.data
+        return self._validate(weapons.Weapon, data)
 
-    async def fetch_weapons(self, *, language: LanguageOption | None = None) -> list[Weapon]:
+    async def fetch_weapons(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Weapon]:
         data = await self.http.get_weapons(language=language or self.language)
-        weapons = Response[list[Weapon]].model_validate(data)
-        return weapons.data
+        return self._validate_list(weapons.Weapon, data, fields)
 
     async def fetch_skin(self, uuid: str, /, *, language: LanguageOption | None = None) -> Skin:
         data = await self.http.get_weapon_skin(uuid, language=language or self.language)
-        skin = Response[Skin].model_validate(data)
-        return skin.data
+        return self._validate(weapons.Skin, data)
 
-    async def fetch_skins(self, *, language: LanguageOption | None = None) -> list[Skin]:
+    async def fetch_skins(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[Skin]:
         data = await self.http.get_weapon_skins(language=language or self.language)
-        skins = Response[list[Skin]].model_validate(data)
-        return skins.data
+        return self._validate_list(weapons.Skin, data, fields)
 
     async def fetch_skin_chroma(self, uuid: str, /, *, language: LanguageOption | None = None) -> SkinChroma:
         data = await self.http.get_weapon_skin_chroma(uuid, language=language or self.language)
-        skin_chroma = Response[SkinChroma].model_validate(data)
-        return skin_chroma.data
+        return self._validate(weapons.Chroma, data)
 
-    async def fetch_skin_chromas(self, *, language: LanguageOption | None = None) -> list[SkinChroma]:
+    async def fetch_skin_chromas(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[SkinChroma]:
         data = await self.http.get_weapon_skin_chromas(language=language or self.language)
-        skin_chromas = Response[list[SkinChroma]].model_validate(data)
-        return skin_chromas.data
+        return self._validate_list(weapons.Chroma, data, fields)
 
     async def fetch_skin_level(self, uuid: str, /, *, language: LanguageOption | None = None) -> SkinLevel:
         data = await self.http.get_weapon_skin_level(uuid, language=language or self.language)
-        skin_level = Response[SkinLevel].model_validate(data)
-        return skin_level.data
+        return self._validate(weapons.Level, data)
 
-    async def fetch_skin_levels(self, *, language: LanguageOption | None = None) -> list[SkinLevel]:
+    async def fetch_skin_levels(
+        self, *, language: LanguageOption | None = None, fields: Iterable[str] | None = None
+    ) -> ModelList[SkinLevel]:
         data = await self.http.get_weapon_skin_levels(language=language or self.language)
-        skin_levels = Response[list[SkinLevel]].model_validate(data)
-        return skin_levels.data
+        return self._validate_list(weapons.Level, data, fields)
 
     # version
 
     async def fetch_version(self) -> Version:
         data = await self.http.get_version()
-        version = Response[Version].model_validate(data)
-        return version.data
+        return self._validate(version.Version, data)
@@ -33,6 +33,7 @@ __all__ = (
     'BadRequest',
     'HTTPException',
     'NotFound',
+    'SnapshotError',
     'ValorantError',
 )
 
@@ -46,19 +47,26 @@ class HTTPException(ValorantError):
 
     Attributes:
     ----------
-    response: :class:`aiohttp.ClientResponse`
+    response: Optional[:class:`aiohttp.ClientResponse`]
         The response of the failed HTTP request. This is an
-        instance of :class:`aiohttp.ClientResponse`. In some cases
-        this could also be a :class:`requests.Response`.
+        instance of :class:`aiohttp.ClientResponse`. This is ``None``
+        when the error was served from the cache or the uuid was
+        rejected by the filter of a loaded list.
     text: :class:`str`
         The text of the error. Could be an empty string.
     status: :class:`int`
         The status code of the HTTP request.
     """
 
-    def __init__(self, response: ClientResponse, message: str | dict[str, Any] | None) -> None:
-        self.response: ClientResponse = response
-        self.status: int = response.status
+    def __init__(
+        self,
+        response: ClientResponse | None,
+        message: str | dict[str, Any] | None,
+        *,
+        status: int | None = None,
+    ) -> None:
+        self.response: ClientResponse | None = response
+        self.status: int = response.status if response is not None else status or 0
         self.text: str
         if isinstance(message, dict):
             self.text = message.get('error', '')
@@ -69,7 +77,7 @@ class HTTPException(ValorantError):
         if len(self.text):
             fmt += ': {1}'
 
-        super().__init__(fmt.format(self.response, self.text))
+        super().__init__(fmt.format(self, self.text))
 
 
 class BadRequest(HTTPException):
@@ -84,3 +92,10 @@ class NotFound(HTTPException):
 
     Subclass of :exc:`HTTPException`
     """
+
+
+class SnapshotError(ValorantError):
+    """Exception that's raised when a catalog snapshot cannot be read.
+
+    Subclass of :exc:`ValorantError`
+    """
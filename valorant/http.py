@@ -25,31 +25,56 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
 import logging
 import sys
-from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias, TypeVar
+import time
+from itertools import starmap
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeAlias, TypeVar
 from urllib.parse import quote as _uriquote
 
-import aiohttp
-from aiohttp_client_cache.backends.sqlite import SQLiteBackend
-from aiohttp_client_cache.session import CachedSession
-
 from . import __version__, utils
+from .bloom import BloomFilter, FilterStats
+from .cache import (
+    DEFAULT_CACHE_POLICIES,
+    DEFAULT_LANGUAGE,
+    CacheBackend,
+    CachePolicy,
+    SQLiteCache,
+    make_cache_key,
+    normalize_params,
+)
 from .errors import HTTPException, NotFound
+from .stats import CacheCounters, CacheStats
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    import sqlite3
+    from collections.abc import Awaitable, Callable, Coroutine, Iterable, Mapping
     from pathlib import Path
+    from typing import Literal
+
+    import aiohttp
+
+    from . import backends, snapshot as snapshot_
+    from .cache import CacheEntry, CacheEntryInfo, EvictionPolicy
+    from .snapshot import Snapshot
+    from .stats import Outcome
 
     T = TypeVar('T')
     Response: TypeAlias = Coroutine[Any, Any, T]
+else:
+    # Imported on first use: aiohttp by the first client, the other backends and snapshots only when asked for.
+    aiohttp = utils._lazy_import('aiohttp')
+    backends = utils._lazy_import('valorant.backends')
+    snapshot_ = utils._lazy_import('valorant.snapshot')
+    sqlite3 = utils._lazy_import('sqlite3')
 
 _log = logging.getLogger(__name__)
 
-
-async def to_json(response: aiohttp.ClientResponse) -> dict[str, Any] | str:
-    text = await response.text(encoding='utf-8')
-    return utils._from_json(text)  # type: ignore[no-any-return]
+# Set by every request, read through HTTPClient.served_locally. Awaited requests run in the task of their caller.
+_served_locally: contextvars.ContextVar[bool] = contextvars.ContextVar('served_locally', default=False)
 
 
 class Route:
@@ -65,22 +90,161 @@ class Route:
         self.path = path
         self.parameters = parameters
 
-        url = Route.BASE + path
+        endpoint = path
 
         if parameters:
-            url = url.format_map({k: _uriquote(v, safe='') if isinstance(v, str) else v for k, v in parameters.items()})
-
-        self.url: str = url
+            endpoint = endpoint.format_map({
+                k: _uriquote(v, safe='') if isinstance(v, str) else v for k, v in parameters.items()
+            })
+
+        self.endpoint: str = endpoint
+        self.url: str = Route.BASE + endpoint
+
+
+class PrefetchProgress(NamedTuple):
+    """Reported by :meth:`HTTPClient.prefetch` after each request."""
+
+    endpoint: str
+    language: str | None
+    done: int
+    total: int
+    elapsed: float
+    error: Exception | None
+
+
+class PrefetchReport(NamedTuple):
+    """Returned by :meth:`HTTPClient.prefetch`.
+
+    Attributes:
+    ----------
+    requests: :class:`int`
+        The number of requests made, failures included.
+    failures: list[:class:`PrefetchProgress`]
+        The requests that failed.
+    elapsed: :class:`float`
+        The wall clock time of the prefetch in seconds.
+    downloaded: :class:`int`
+        Bytes received from upstream, responses already cached are not downloaded again.
+    stored: :class:`int`
+        Bytes used by the cache afterwards.
+    """
+
+    requests: int
+    failures: list[PrefetchProgress]
+    elapsed: float
+    downloaded: int
+    stored: int
+
+
+class HydrationReport(NamedTuple):
+    """Returned by :meth:`HTTPClient.hydrate`.
+
+    Attributes:
+    ----------
+    entries: :class:`int`
+        The number of cache entries loaded into memory.
+    size: :class:`int`
+        Bytes of the loaded response bodies.
+    resident: :class:`int`
+        Approximate bytes of memory held by the decoded responses.
+    elapsed: :class:`float`
+        The wall clock time of the hydration in seconds.
+    """
+
+    entries: int
+    size: int
+    resident: int
+    elapsed: float
 
 
 class HTTPClient:
-    def __init__(
+    CACHE_FILENAME: ClassVar[str] = 'valorant-cache.db'
+    # The database of older versions, which cached through aiohttp-client-cache. Nothing reads it
+    # anymore, so it is removed from the cache folder.
+    LEGACY_CACHE_FILENAME: ClassVar[str] = 'aiohttp-cache.db'
+    # The directory of the filesystem backend inside the cache folder.
+    CACHE_DIRNAME: ClassVar[str] = 'responses'
+    # How often, in seconds, the background task trims the cache when ``max_cache_bytes`` is set.
+    CACHE_MAINTENANCE_INTERVAL: ClassVar[float] = 60.0
+    # How often, in seconds, queued entries are written when ``cache_write_behind`` is set, and how
+    # many may be queued before they are written right away.
+    CACHE_FLUSH_INTERVAL: ClassVar[float] = 1.0
+    CACHE_MAX_PENDING: ClassVar[int] = 256
+    # Processes sharing a cache fetch each key once: the first one takes a lock in the cache storage,
+    # the others poll every FETCH_LOCK_INTERVAL seconds for its result. A lock older than
+    # FETCH_LOCK_TIMEOUT seconds is considered abandoned by a crashed process. Backends that are not
+    # shared between processes (MemoryCache) take no lock.
+    FETCH_LOCK_TIMEOUT: ClassVar[float] = 30.0
+    FETCH_LOCK_INTERVAL: ClassVar[float] = 0.05
+    # Every list endpoint mapped to the method fetching it, the catalog filled by ``prefetch()``.
+    LIST_ENDPOINTS: ClassVar[Mapping[str, str]] = {
+        '/agents': 'get_agents',
+        '/buddies': 'get_buddies',
+        '/buddies/levels': 'get_buddy_levels',
+        '/bundles': 'get_bundles',
+        '/ceremonies': 'get_ceremonies',
+        '/competitivetiers': 'get_competitive_tiers',
+        '/contenttiers': 'get_content_tiers',
+        '/contracts': 'get_contracts',
+        '/currencies': 'get_currencies',
+        '/events': 'get_events',
+        '/flex': 'get_all_flex',
+        '/gamemodes': 'get_game_modes',
+        '/gamemodes/equippables': 'get_game_mode_equippables',
+        '/gear': 'get_all_gear',
+        '/levelborders': 'get_level_borders',
+        '/maps': 'get_maps',
+        '/missions': 'get_missions',
+        '/playercards': 'get_player_cards',
+        '/playertitles': 'get_player_titles',
+        '/seasons': 'get_seasons',
+        '/seasons/competitive': 'get_competitive_seasons',
+        '/sprays': 'get_sprays',
+        '/sprays/levels': 'get_spray_levels',
+        '/themes': 'get_themes',
+        '/weapons': 'get_weapons',
+        '/weapons/skins': 'get_weapon_skins',
+        '/weapons/skinchromas': 'get_weapon_skin_chromas',
+        '/weapons/skinlevels': 'get_weapon_skin_levels',
+    }
+    # List endpoints without localized fields, fetched once regardless of the requested languages.
+    UNLOCALIZED_ENDPOINTS: ClassVar[frozenset[str]] = frozenset({'/seasons/competitive'})
+    # List endpoints left out of the uuid filters, new uuids can appear in them at any time during a patch.
+    UNFILTERED_ENDPOINTS: ClassVar[frozenset[str]] = frozenset({
+        '/events',
+        '/missions',
+        '/seasons',
+        '/seasons/competitive',
+    })
+    # List endpoints whose items are nested inside the items of other lists, as (parent list, keys
+    # leading to the children) in order of preference. ``/weapons`` holds every skin, which holds its
+    # chromas and levels, so all of them can be answered from a cached ``/weapons``.
+    NESTED_ENDPOINTS: ClassVar[Mapping[str, tuple[tuple[str, tuple[str, ...]], ...]]] = {
+        '/buddies/levels': (('/buddies', ('levels',)),),
+        '/sprays/levels': (('/sprays', ('levels',)),),
+        '/weapons/skins': (('/weapons', ('skins',)),),
+        '/weapons/skinchromas': (('/weapons/skins', ('chromas',)), ('/weapons', ('skins', 'chromas'))),
+        '/weapons/skinlevels': (('/weapons/skins', ('levels',)), ('/weapons', ('skins', 'levels'))),
+    }
+    # How many decoded parent lists are kept to answer derived requests.
+    DERIVED_INDEX_LIMIT: ClassVar[int] = 8
+
+    def __init__(  # noqa: PLR0913
         self,
         session: aiohttp.ClientSession | None = None,
         *,
         enable_cache: bool = True,
         cache_path: str | Path | None = None,
-        cache_ttl: int = 60 * 60 * 24,  # 24 hours in seconds
+        cache_ttl: int | None = None,
+        cache_policies: Mapping[str, CachePolicy] | None = None,
+        cache_pragmas: Mapping[str, int | str] | None = None,
+        max_cache_bytes: int | None = None,
+        cache_eviction: Literal['lru', 'lfu'] | EvictionPolicy = 'lru',
+        cache_write_behind: bool = False,
+        cache_backend: Literal['sqlite', 'filesystem', 'memory'] | CacheBackend = 'sqlite',
+        snapshot: str | Path | None = None,
+        intern_strings: bool = False,
+        copy_responses: bool = True,
     ) -> None:
         """
         Initialize the HTTPClient.
@@ -88,14 +252,47 @@ class HTTPClient:
         Parameters
         ----------
         session : aiohttp.ClientSession | None
-            Optional custom session to use. If provided, cache settings are ignored.
+            Optional custom session to use. If provided, cache settings are ignored unless ``cache_backend``
+            is a backend instance.
         enable_cache : bool
             Whether to enable HTTP response caching. Defaults to True.
-            Requires aiohttp-client-cache to be installed.
         cache_path : str | Path | None
             Path to the cache folder. Defaults to './.valorant_cache'. If None, uses the default cache path.
-        cache_ttl : int
-            Time-to-live for cached responses in seconds. Defaults to 24 hours (86400 seconds).
+        cache_ttl : int | None
+            Time-to-live for cached responses in seconds, applied to every route. Defaults to None,
+            which uses the per-route TTLs from :data:`valorant.cache.DEFAULT_CACHE_POLICIES`.
+        cache_policies : Mapping[str, CachePolicy] | None
+            Per-route cache policies keyed by route path (e.g. ``'/weapons'`` or ``'/weapons/skins/{uuid}'``),
+            merged over the defaults. A policy applies to its route and every route below it.
+        cache_pragmas : Mapping[str, int | str] | None
+            SQLite pragmas for the cache database, merged over :data:`valorant.cache.DEFAULT_PRAGMAS`
+            (WAL journal, ``synchronous=normal``, a 64 MiB mmap, a 16 MiB page cache and a 5 millisecond busy timeout).
+        max_cache_bytes : int | None
+            Upper bound for the stored (compressed) cache bodies. When set, a background task evicts entries
+            in small batches and compacts the database file. Defaults to no limit.
+        cache_eviction : Literal['lru', 'lfu'] | EvictionPolicy
+            Which entries are evicted first once the cache is over ``max_cache_bytes``. Defaults to 'lru'.
+        cache_write_behind : bool
+            Return responses before they are written to the cache and write them in batched transactions
+            every :attr:`CACHE_FLUSH_INTERVAL` seconds and on :meth:`close`. Other processes sharing the
+            cache wait for the batch holding a key they are waiting for. Only used by the SQLite backend.
+            Defaults to False.
+        cache_backend : Literal['sqlite', 'filesystem', 'memory'] | CacheBackend
+            Where responses are cached: a SQLite database in the cache folder shared by every process using it,
+            one file per response in the cache folder, or the memory of this process. Pragmas only apply to
+            SQLite. A :class:`~valorant.cache.CacheBackend` instance is used as is. Defaults to 'sqlite'.
+        snapshot : str | Path | None
+            A catalog snapshot written by :meth:`export_snapshot`. Requests it covers are answered from it
+            without touching the network or the cache, everything else falls back to the usual path.
+        intern_strings : bool
+            Intern the short strings of every response decoded from upstream or the cache, so that values
+            repeated across the catalog (categories, rarities, referenced uuids) are held once. Costs a pass
+            over every decoded response. Snapshot answers are not interned.
+            Defaults to False.
+        copy_responses : bool
+            Hand every caller its own copy of the responses answered from memory (the snapshot, hydrated cache
+            entries and lists derived from cached ones), so that modifying one does not change what later requests get.
+            :class:`~valorant.Client` turns it off since it only reads responses. Defaults to True.
         """
         self._session: aiohttp.ClientSession | None = session
         user_agent = 'valorantx (https://github.com/staciax/valorant {0}) Python/{1[0]}.{1[1]} aiohttp/{2}'
@@ -104,44 +301,548 @@ class HTTPClient:
         self._enable_cache = enable_cache
         self._cache_path = cache_path
         self._cache_ttl = cache_ttl
+        self._cache_policies: dict[str, CachePolicy] = dict(DEFAULT_CACHE_POLICIES)
+        if cache_ttl is not None:
+            self._cache_policies = {
+                path: policy._replace(ttl=cache_ttl) if policy.ttl else policy
+                for path, policy in self._cache_policies.items()
+            }
+        self._cache_policies.update(cache_policies or {})
+        self._default_cache_policy = CachePolicy(ttl=cache_ttl or 60 * 60 * 24)
+        self._cache_pragmas = cache_pragmas
+        self._cache_eviction = cache_eviction
+        self._max_cache_bytes = max_cache_bytes
+        self._cache_write_behind = cache_write_behind
+        self._cache_backend = cache_backend
+        self._cache: CacheBackend | None = None
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self._cache_counters: dict[tuple[str, str], CacheCounters] = {}
+        # Requests sent upstream right now by cache key, identical requests wait for these instead.
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        # Children of cached parent lists by (parent key, nested keys): the parent's created_at,
+        # the children and the children by uuid.
+        self._derived: dict[tuple[str, tuple[str, ...]], tuple[float, list[Any], dict[str, Any]]] = {}
+        # Uuid filters of the loaded lists by list endpoint: the filter, the manifest it was built for
+        # and when the list expires. Uuids missing from them are rejected without going upstream.
+        self._uuid_filters: dict[str, tuple[BloomFilter, str | None, float]] = {}
+        # Cache entries loaded by hydrate() by key: the entry without its body and the decoded body.
+        # Hits on them skip the cache backend and decoding, storing a key drops it from here.
+        self._hydrated: dict[str, tuple[CacheEntry, Any]] = {}
+        # The last hydrate() report, None until the cache has been hydrated.
+        self.hydration: HydrationReport | None = None
+        self._snapshot_path = snapshot
+        self._intern_strings = intern_strings
+        self._copy_responses = copy_responses
+        self._snapshot: Snapshot | None = None
+        # Bytes received from upstream, used to report prefetch totals.
+        self.bytes_received: int = 0
+
+        # The manifest id of the last seen ``/version`` response, cache entries are tagged with it.
+        self.manifest_id: str | None = None
 
     async def start(self) -> None:
+        if self._snapshot_path is not None and self._snapshot is None:
+            self._snapshot = snapshot_.Snapshot.load(self._snapshot_path)
+            self.manifest_id = self._snapshot.manifest
+
+        if self._cache is None and self._enable_cache:
+            if isinstance(self._cache_backend, CacheBackend):
+                self._cache = self._cache_backend
+            elif self._session is None:
+                self._cache = self._create_cache(self._cache_backend)
+
+            if self._cache is not None:
+                if self._max_cache_bytes is not None:
+                    self._maintenance_task = asyncio.create_task(self._maintain_cache())
+                if self._cache_write_behind:
+                    self._flush_task = asyncio.create_task(self._flush_cache())
+
         if self._session is None:
-            if self._enable_cache:
-                cache_path = self._cache_path or utils.get_default_cache_path()
-                cache_dir = utils.create_cache_folder(cache_path)
-                cache_name = cache_dir / 'aiohttp-cache.db'
-
-                self._session = CachedSession(
-                    cache=SQLiteBackend(
-                        cache_name=str(cache_name),
-                        expire_after=self._cache_ttl,
-                        allowed_codes=(200, 404),
-                        cache_control=True,
-                    ),
-                )
-            else:
-                self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession()
+
+    def _create_cache(self, backend: Literal['sqlite', 'filesystem', 'memory']) -> CacheBackend:
+        if backend == 'memory':
+            return backends.MemoryCache(eviction=self._cache_eviction)
+
+        cache_path = self._cache_path or utils.get_default_cache_path()
+        cache_dir = utils.create_cache_folder(cache_path)
+        self._remove_legacy_cache(cache_dir)
+        if backend == 'filesystem':
+            return backends.FileSystemCache(cache_dir / self.CACHE_DIRNAME, eviction=self._cache_eviction)
+        if backend == 'sqlite':
+            return SQLiteCache(
+                cache_dir / self.CACHE_FILENAME,
+                pragmas=self._cache_pragmas,
+                eviction=self._cache_eviction,
+                write_behind=self._cache_write_behind,
+                max_pending=self.CACHE_MAX_PENDING,
+            )
+        raise ValueError(f'unknown cache backend: {backend!r}')  # noqa: TRY003
+
+    def _remove_legacy_cache(self, cache_dir: Path) -> None:
+        legacy = cache_dir / self.LEGACY_CACHE_FILENAME
+        if not legacy.exists():
+            return
+
+        _log.info('removing the outdated cache database %s', legacy)
+        try:
+            for suffix in ('-wal', '-shm', '-journal', ''):
+                legacy.with_name(legacy.name + suffix).unlink(missing_ok=True)
+        except OSError:
+            _log.warning('failed to remove the outdated cache database %s', legacy, exc_info=True)
+
+    async def _maintain_cache(self) -> None:
+        while True:
+            await asyncio.sleep(self.CACHE_MAINTENANCE_INTERVAL)
+            try:
+                await self.trim_cache()
+            except (OSError, sqlite3.Error):
+                _log.exception('failed to trim the cache')
+
+    async def _flush_cache(self) -> None:
+        assert self._cache is not None
+        while True:
+            await asyncio.sleep(self.CACHE_FLUSH_INTERVAL)
+            try:
+                self._cache.flush()
+            except (OSError, sqlite3.Error):
+                _log.exception('failed to flush the cache')
+
+    async def trim_cache(self) -> int:
+        """
+        Evict entries until the cache is under ``max_cache_bytes``, then compact the database.
+
+        Eviction runs in small batches and yields to the event loop in between.
+
+        Returns:
+        -------
+        int
+            The number of evicted entries.
+        """
+        if self._cache is None or self._max_cache_bytes is None:
+            return 0
+
+        evicted = 0
+        while count := self._cache.evict(self._max_cache_bytes):
+            evicted += count
+            await asyncio.sleep(0)
+
+        self._cache.compact()
+        return evicted
+
+    def cache_stats(self) -> CacheStats:
+        """Return the cache counters of this client together with the storage used per route and language."""
+        stats = CacheStats()
+        for (route, language), counters in self._cache_counters.items():
+            stats.add(route, language, counters)
+
+        if self._cache is not None:
+            # Read before usage() writes the queue out.
+            pending = self._cache.pending
+            for usage in self._cache.usage():
+                counters = CacheCounters()
+                counters.entries = usage.entries
+                counters.size = usage.size
+                counters.stored_size = usage.stored_size
+                stats.add(usage.route, usage.language, counters)
+            stats.writes.merge(self._cache.write_stats)
+            stats.writes.pending = pending
+        return stats
+
+    def cache_entries(self, pattern: str = '*', *, language: str | None = None) -> list[CacheEntryInfo]:
+        if self._cache is None:
+            return []
+        return self._cache.entries(pattern, language=language)
+
+    def purge_cache(self, pattern: str, *, language: str | None = None) -> int:
+        if self._cache is None:
+            return 0
+        self._hydrated.clear()
+        return self._cache.purge(pattern, language=language)
+
+    async def hydrate(self, *, threaded: bool = True) -> HydrationReport:
+        """
+        Load every live cache entry into memory, decoded, so that hits skip the cache backend.
+
+        The entries are read in a single pass over the cache. Only successful responses are loaded.
+
+        Parameters
+        ----------
+        threaded : bool
+            Read and decode the entries in a worker thread so the event loop keeps running. Defaults to True.
 
-    async def request(self, route: Route, **kwargs: Any) -> Any:
+        Returns:
+        -------
+        HydrationReport
+            The number of loaded entries, their size and the time it took.
+        """
+        started = time.perf_counter()
+        if self._cache is None:
+            return HydrationReport(0, 0, 0, 0.0)
+
+        # Write-behind queues are only touched on the event loop thread, the scan may run on another one
+        # and does not write them itself.
+        self._cache.flush()
+        if threaded:
+            hydrated, size, resident = await asyncio.to_thread(self._load_entries, self._cache)
+        else:
+            hydrated, size, resident = self._load_entries(self._cache)
+
+        self._hydrated = hydrated
+        self.hydration = HydrationReport(len(hydrated), size, resident, time.perf_counter() - started)
+        return self.hydration
+
+    def _load_entries(self, cache: CacheBackend) -> tuple[dict[str, tuple[CacheEntry, Any]], int, int]:
+        hydrated: dict[str, tuple[CacheEntry, Any]] = {}
+        size = resident = 0
+        for entry in cache.scan():
+            if entry.status != 200:
+                continue
+            data = self._decode(entry.body)
+            size += len(entry.body)
+            resident += utils._sizeof(data)
+            hydrated[entry.key] = (entry._replace(body=b''), data)
+        return hydrated, size, resident
+
+    def _cache_get(self, cache: CacheBackend, key: str, *, include_expired: bool, raw: bool) -> CacheEntry | None:
+        hydrated = self._hydrated.get(key)
+        if hydrated is None or raw:
+            return cache.get(key, include_expired=include_expired)
+
+        entry = hydrated[0]
+        if entry.is_expired():
+            # Another process may have stored a fresh response since.
+            del self._hydrated[key]
+            return cache.get(key, include_expired=include_expired)
+        return entry
+
+    def _record_cache(
+        self,
+        route: Route,
+        language: str,
+        outcome: Outcome,
+        started: float,
+        *,
+        normalized: bool,
+    ) -> None:
+        counters = self._cache_counters.get((route.path, language))
+        if counters is None:
+            counters = self._cache_counters[route.path, language] = CacheCounters()
+        counters.record(outcome, time.perf_counter() - started, normalized=normalized)
+
+    def get_cache_policy(self, route: Route) -> CachePolicy:
+        """Return the cache policy of the closest configured parent path of ``route``."""
+        path = route.path
+        while path:
+            policy = self._cache_policies.get(path)
+            if policy is not None:
+                return policy
+            path = path.rpartition('/')[0]
+        return self._default_cache_policy
+
+    def _decode(self, body: bytes) -> Any:
+        data = utils._from_json(body)
+        return utils._intern_strings(data) if self._intern_strings else data
+
+    def _from_cache(self, entry: CacheEntry, *, raw: bool = False) -> Any:
+        if raw and entry.status != 404:
+            return entry.body
+        hydrated = self._hydrated.get(entry.key)
+        if hydrated is not None and hydrated[0] is entry:
+            return self._shared(hydrated[1])
+        data = self._decode(entry.body)
+        if entry.status == 404:
+            raise NotFound(None, data, status=entry.status)
+        return data
+
+    async def request(self, route: Route, *, raw: bool = False, **kwargs: Any) -> Any:  # noqa: PLR0915
+        """
+        Send a request, answering it from the snapshot or the cache when possible.
+
+        Parameters
+        ----------
+        route : Route
+            The route to request.
+        raw : bool
+            Return the response body as bytes instead of the decoded JSON. Raw requests and requests with query
+            parameters other than ``language`` skip the snapshot.
+        **kwargs : Any
+            Forwarded to :meth:`aiohttp.ClientSession.request`.
+
+        Returns:
+        -------
+        Any
+            The decoded response, or the body when ``raw`` is set.
+        """
         assert self._session is not None, 'Session is not initialized'
 
+        _served_locally.set(False)
+        started = time.perf_counter()
         method = route.method
         url = route.url
 
-        # create headers
-        headers = kwargs.get('headers', {})
-        headers['User-Agent'] = self.user_agent
-        kwargs['headers'] = headers
+        kwargs['headers'] = {**kwargs.get('headers', {}), 'User-Agent': self.user_agent}
+
+        policy = self.get_cache_policy(route)
+        cache = self._cache if policy.ttl > 0 else None
+
+        params = kwargs.get('params') or {}
+        query = normalize_params(params)
+        language = query.get('language', DEFAULT_LANGUAGE)
+
+        # Snapshots hold the unfiltered lists, filtered requests such as isPlayableCharacter go past them.
+        if self._snapshot is not None and not raw and query.keys() <= {'language'}:
+            data = self._snapshot.lookup(route, language)
+            if data is not None:
+                _log.debug('%s %s has been served from the snapshot', method, url)
+                _served_locally.set(True)
+                return self._shared(data)
+
+        key = make_cache_key(route.endpoint, query)
+        normalized = key != make_cache_key(route.endpoint, params, normalize=False)
+
+        stale: CacheEntry | None = None
+        if cache is not None:
+            entry = self._cache_get(cache, key, include_expired=policy.allow_stale, raw=raw)
+            if entry is not None:
+                if not entry.is_expired():
+                    _log.debug('%s %s has been served from the cache', method, url)
+                    self._record_cache(route, language, 'hit', started, normalized=normalized)
+                    _served_locally.set(True)
+                    return self._from_cache(entry, raw=raw)
+                stale = entry
+
+        if not raw and query.keys() <= {'language'}:
+            outcome, data = self._resolve(cache, route, language)
+            if outcome is not None:
+                self._record_cache(route, language, outcome, started, normalized=normalized)
+                if outcome == 'rejected':
+                    raise NotFound(None, data, status=404)
+                _served_locally.set(True)
+                return data
+
+        async def fetch() -> Any:
+            outcome: Outcome = 'miss'
+            try:
+                data, outcome = await self._send_once(route, key, language, cache, policy, raw=raw, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError, HTTPException) as exc:
+                if stale is None or (isinstance(exc, HTTPException) and exc.status < 500):
+                    raise
+                _log.warning('%s %s failed, serving a stale cache entry', method, url, exc_info=True)
+                outcome = 'stale'
+                return self._from_cache(stale, raw=raw)
+            else:
+                return data
+            finally:
+                if cache is not None:
+                    self._record_cache(route, language, outcome, started, normalized=normalized)
+
+        if raw:
+            return await fetch()
+
+        if key in self._inflight:
+            _log.debug('%s %s is waiting for an identical request in flight', method, url)
+            if cache is not None:
+                self._record_cache(route, language, 'coalesced', started, normalized=normalized)
+        return await self._coalesce(key, fetch)
+
+    @staticmethod
+    def served_locally() -> bool:
+        """
+        Whether the last response :meth:`request` returned to the current task came from the snapshot or the cache.
+
+        Responses fetched from the API count as not, and so do the cache entries stored by another request
+        while this one waited for it, or served in place of a failed request.
+        """
+        return _served_locally.get()
+
+    def _resolve(self, cache: CacheBackend | None, route: Route, language: str) -> tuple[Outcome | None, Any]:
+        """Derive a request from a cached list containing it, or reject a uuid missing from its loaded list."""
+        if cache is not None:
+            data = self._derive(cache, route, language)
+            if data is not None:
+                _log.debug('%s %s has been derived from a cached list', route.method, route.url)
+                return 'derived', self._shared(data)
+
+        entity = route.parameters.get('uuid')
+        if entity is not None and not self._may_exist(route.path.removesuffix('/{uuid}'), str(entity)):
+            _log.debug('%s %s has been rejected by the uuid filter', route.method, route.url)
+            return 'rejected', {'status': 404, 'error': f'the requested uuid {entity} was not found'}
+        return None, None
+
+    def _may_exist(self, endpoint: str, uuid: str) -> bool:
+        entry = self._uuid_filters.get(endpoint)
+        if entry is None:
+            return True
+
+        bloom, manifest, expires_at = entry
+        # A filter is only trusted for the game version and the lifetime of the list it was built from.
+        if manifest != self.manifest_id or time.time() >= expires_at:
+            del self._uuid_filters[endpoint]
+            return True
+        return uuid in bloom
+
+    def _index_uuids(self, endpoint: str, items: list[Any], created_at: float) -> None:
+        """Build the uuid filters of a loaded list and of the lists nested in its items."""
+        ttl = self.get_cache_policy(Route('GET', endpoint)).ttl
+        if ttl <= 0:
+            return
+
+        lists: list[tuple[str, tuple[str, ...]]] = [(endpoint, ())]
+        for child, sources in self.NESTED_ENDPOINTS.items():
+            lists.extend((child, nested) for parent, nested in sources if parent == endpoint)
+        for path, nested in lists:
+            if path in self.UNFILTERED_ENDPOINTS:
+                continue
+            uuids = [item['uuid'] for item in self._nested_items(items, nested) if item.get('uuid')]
+            self._uuid_filters[path] = (BloomFilter.from_items(uuids), self.manifest_id, created_at + ttl)
+
+    def uuid_filter_stats(self) -> list[FilterStats]:
+        """Return the size and false positive rate of the uuid filter of every loaded list."""
+        return [
+            FilterStats(endpoint, len(bloom), bloom.memory, bloom.hashes, bloom.false_positive_rate, manifest)
+            for endpoint, (bloom, manifest, _) in sorted(self._uuid_filters.items())
+        ]
+
+    @staticmethod
+    def _nested_items(items: list[Any], nested: tuple[str, ...]) -> list[Any]:
+        for name in nested:
+            items = [child for item in items for child in item.get(name) or ()]
+        return items
+
+    def _derive(self, cache: CacheBackend, route: Route, language: str) -> Any:
+        """Answer a list or single entity request from a fresh cached list containing it, if there is one."""
+        path = route.path.removesuffix('/{uuid}')
+        single = path != route.path
+        if path not in self.LIST_ENDPOINTS:
+            return None
+
+        # A single entity can come from its own list, a list never comes from itself.
+        sources = self.NESTED_ENDPOINTS.get(path, ())
+        if single:
+            sources = ((path, ()), *sources)
+
+        for parent, nested in sources:
+            key = make_cache_key(parent, {'language': language})
+            hydrated = self._hydrated.get(key)
+            info = cache.info(key) if hydrated is None else hydrated[0]
+            if info is None or info.status != 200 or info.is_expired():
+                continue
+
+            derived = self._derived.get((key, nested))
+            if derived is None or derived[0] != info.created_at:
+                entry = self._cache_get(cache, key, include_expired=False, raw=False)
+                if entry is None:
+                    continue
+                data = self._from_cache(entry)['data']
+                self._index_uuids(parent, data, entry.created_at)
+                items = self._nested_items(data, nested)
+                derived = (entry.created_at, items, {item['uuid'].lower(): item for item in items if 'uuid' in item})
+                self._derived.pop((key, nested), None)
+                self._derived[key, nested] = derived
+                while len(self._derived) > self.DERIVED_INDEX_LIMIT:
+                    del self._derived[next(iter(self._derived))]
+
+            _, items, by_uuid = derived
+            if not single:
+                return {'status': 200, 'data': items}
+            item = by_uuid.get(str(route.parameters['uuid']).lower())
+            if item is not None:
+                return {'status': 200, 'data': item}
+        return None
+
+    async def _send_once(  # noqa: PLR0913
+        self,
+        route: Route,
+        key: str,
+        language: str,
+        cache: CacheBackend | None,
+        policy: CachePolicy,
+        *,
+        raw: bool,
+        **kwargs: Any,
+    ) -> tuple[Any, Outcome]:
+        # The outcome is 'coalesced' when the response was fetched by another process sharing the cache.
+        if cache is None or not cache.shared:
+            return await self._send(route, key, language, cache, policy, raw=raw, **kwargs), 'miss'
+
+        token, entry = await self._lock_fetch(cache, key)
+        if entry is not None:
+            _log.debug('%s %s has been fetched by another process', route.method, route.url)
+            return self._from_cache(entry, raw=raw), 'coalesced'
+
+        assert token is not None
+        try:
+            return await self._send(route, key, language, cache, policy, raw=raw, **kwargs), 'miss'
+        finally:
+            cache.release(key, token)
+
+    async def _lock_fetch(self, cache: CacheBackend, key: str) -> tuple[str | None, CacheEntry | None]:
+        """Take the cross-process fetch lock of ``key``, or wait for the process holding it and return its entry."""
+        while True:
+            token, entry = cache.acquire_or_get(key, self.FETCH_LOCK_TIMEOUT)
+            if token is not None or entry is not None:
+                return token, entry
+            await asyncio.sleep(self.FETCH_LOCK_INTERVAL)
+
+    def _shared(self, data: Any) -> Any:
+        # Responses kept in memory are handed out as copies, unless the caller only reads them.
+        return utils._copy_json(data) if self._copy_responses else data
+
+    async def _coalesce(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        # Identical requests share one upstream request, the shield keeps a cancelled caller
+        # from cancelling it for the others.
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _send(  # noqa: PLR0913
+        self,
+        route: Route,
+        key: str,
+        language: str,
+        cache: CacheBackend | None,
+        policy: CachePolicy,
+        *,
+        raw: bool,
+        **kwargs: Any,
+    ) -> Any:
+        assert self._session is not None, 'Session is not initialized'
+
+        method = route.method
+        url = route.url
 
         async with self._session.request(method, url, **kwargs) as response:
             _log.debug('%s %s with returned %s', method, url, response.status)
 
-            data = await to_json(response)
+            body = await response.read()
+            self.bytes_received += len(body)
+            data = self._decode(body)
+
+            self._hydrated.pop(key, None)
+            if cache is not None and (response.status == 200 or (response.status == 404 and policy.cache_not_found)):
+                cache.set(
+                    key,
+                    body,
+                    route=route.path,
+                    language=language,
+                    status=response.status,
+                    expire_after=policy.ttl,
+                    manifest=self.manifest_id,
+                )
 
             if 300 > response.status >= 200:
                 _log.debug('%s %s has received %s', method, url, data)
-                return data
+                if route.path == '/version':
+                    if data['data']['manifestId'] != self.manifest_id:
+                        self._uuid_filters.clear()
+                    self.manifest_id = data['data']['manifestId']
+                elif not raw and route.path in self.LIST_ENDPOINTS and self._is_unfiltered(kwargs):
+                    self._index_uuids(route.path, data['data'], time.time())
+                return body if raw else data
 
             # if response.status in {400, 404}:
             #     _log.debug('%s %s has received %s', method, url, data)
@@ -152,14 +853,168 @@ class HTTPClient:
 
             raise HTTPException(response, data)  # pragma: no cover
 
+    @staticmethod
+    def _is_unfiltered(kwargs: Mapping[str, Any]) -> bool:
+        # Whether a list request returns the whole list, isPlayableCharacter and the like leave items out.
+        return normalize_params(kwargs.get('params') or {}).keys() <= {'language'}
+
     async def close(self) -> None:
+        for task in (self._maintenance_task, self._flush_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._maintenance_task = self._flush_task = None
         if self._session is not None:
             await self._session.close()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+        self._hydrated.clear()
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
 
     def clear(self) -> None:
         if self._session and self._session.closed:
             self._session = None
 
+    def _list_jobs(
+        self,
+        endpoints: Iterable[str] | None,
+        languages: Iterable[str | None],
+    ) -> list[tuple[str, str | None]]:
+        endpoints = list(self.LIST_ENDPOINTS if endpoints is None else endpoints)
+        unknown = [endpoint for endpoint in endpoints if endpoint not in self.LIST_ENDPOINTS]
+        if unknown:
+            raise ValueError(f'unknown list endpoints: {", ".join(unknown)}')  # noqa: TRY003
+
+        languages = list(dict.fromkeys(languages))
+        return [
+            (endpoint, language)
+            for endpoint in endpoints
+            for language in ((None,) if endpoint in self.UNLOCALIZED_ENDPOINTS else languages)
+        ]
+
+    async def prefetch(
+        self,
+        endpoints: Iterable[str] | None = None,
+        languages: Iterable[str | None] = (None,),
+        *,
+        concurrency: int = 8,
+        progress: Callable[[PrefetchProgress], None] | None = None,
+    ) -> PrefetchReport:
+        """
+        Fill the cache with list endpoints across languages.
+
+        Failed requests are reported and skipped, they do not stop the prefetch.
+
+        Parameters
+        ----------
+        endpoints : Iterable[str] | None
+            Paths from :attr:`LIST_ENDPOINTS`. Defaults to all of them.
+        languages : Iterable[str | None]
+            The languages to fetch every endpoint in, ``None`` for the API default. Defaults to ``(None,)``.
+        concurrency : int
+            The maximum number of requests in flight. Defaults to 8.
+        progress : Callable[[PrefetchProgress], None] | None
+            Called after every request.
+
+        Returns:
+        -------
+        PrefetchReport
+            Request count, failures, elapsed time and byte totals.
+        """
+        jobs = self._list_jobs(endpoints, languages)
+        semaphore = asyncio.Semaphore(concurrency)
+        failures: list[PrefetchProgress] = []
+        done = 0
+        started = time.perf_counter()
+        received = self.bytes_received
+
+        async def fetch(endpoint: str, language: str | None) -> None:
+            nonlocal done
+            error: Exception | None = None
+            async with semaphore:
+                method = getattr(self, self.LIST_ENDPOINTS[endpoint])
+                try:
+                    if endpoint in self.UNLOCALIZED_ENDPOINTS:
+                        await method()
+                    else:
+                        await method(language=language)
+                except (HTTPException, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    error = exc
+
+            done += 1
+            report = PrefetchProgress(endpoint, language, done, len(jobs), time.perf_counter() - started, error)
+            if error is not None:
+                _log.warning('failed to prefetch %s (%s): %s', endpoint, language, error)
+                failures.append(report)
+            if progress is not None:
+                progress(report)
+
+        await asyncio.gather(*starmap(fetch, jobs))
+
+        return PrefetchReport(
+            requests=len(jobs),
+            failures=failures,
+            elapsed=time.perf_counter() - started,
+            downloaded=self.bytes_received - received,
+            stored=self._cache.total_size() if self._cache is not None else 0,
+        )
+
+    async def export_snapshot(
+        self,
+        path: str | Path,
+        endpoints: Iterable[str] | None = None,
+        languages: Iterable[str | None] = (None,),
+        *,
+        concurrency: int = 8,
+        indexed: bool = False,
+    ) -> Snapshot:
+        """
+        Fetch list endpoints across languages and write them to one snapshot file.
+
+        Responses come from the cache when they are fresh there. Unlike :meth:`prefetch`, any failed
+        request aborts the export so a snapshot is always complete.
+
+        Parameters
+        ----------
+        path : str | Path
+            Where to write the snapshot.
+        endpoints : Iterable[str] | None
+            Paths from :attr:`LIST_ENDPOINTS`. Defaults to all of them.
+        languages : Iterable[str | None]
+            The languages to export, ``None`` for the API default. Defaults to ``(None,)``.
+        concurrency : int
+            The maximum number of requests in flight. Defaults to 8.
+        indexed : bool
+            Write the uncompressed, uuid indexed layout meant to be memory-mapped by many processes.
+
+        Returns:
+        -------
+        Snapshot
+            The written snapshot, opened for reading. Close it when done.
+        """
+        jobs = self._list_jobs(endpoints, languages)
+        version = await self.request(Route('GET', '/version'), raw=True)
+        manifest = utils._from_json(version)['data']['manifestId']
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(endpoint: str, language: str | None) -> bytes:
+            params = {} if language is None else {'language': language}
+            async with semaphore:
+                body: bytes = await self.request(Route('GET', endpoint), raw=True, params=params)
+                return body
+
+        bodies = await asyncio.gather(*starmap(fetch, jobs))
+        payloads = {(endpoint, language or ''): body for (endpoint, language), body in zip(jobs, bodies, strict=True)}
+        payloads['/version', ''] = version
+        snapshot_.Snapshot.write(path, payloads, manifest=manifest, indexed=indexed)
+        _log.info('exported %s responses for manifest %s to %s', len(payloads), manifest, path)
+        return snapshot_.Snapshot.load(path)
+
     # agents
 
     def get_agents(
@@ -542,4 +1397,4 @@ class HTTPClient:
     # version
 
     def get_version(self) -> Response[Any]:
-        return self.request(Route('GET', '/version'), headers={'Cache-Control': 'no-store'})
+        return self.request(Route('GET', '/version'))
@@ -29,7 +29,7 @@ from pydantic import Field
 from pydantic_extra_types.color import Color
 
 from ..enums import AbilitySlot
-from .base import BaseModel, BaseUUIDModel
+from .base import BaseModel, BaseUUIDModel, Compact
 from .localization import LocalizedField  # Changed from language to localization
 
 __all__ = (
@@ -44,8 +44,8 @@ class Role(BaseUUIDModel):
     # uuid: str
     display_name: str | LocalizedField = Field(alias='displayName')
     description: str | LocalizedField
-    display_icon: str = Field(alias='displayIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
     def __repr__(self) -> str:
         return f'<Role display_name={self.display_name!r}>'
@@ -65,7 +65,7 @@ class Ability(BaseModel):
     slot: AbilitySlot
     display_name: str | LocalizedField = Field(alias='displayName')
     description: str | LocalizedField
-    display_icon: str | None = Field(alias='displayIcon')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
 
     def __repr__(self) -> str:
         return f'<Ability display_name={self.display_name!r}>'
@@ -78,15 +78,15 @@ class Agent(BaseUUIDModel):
     developer_name: str = Field(alias='developerName')
     release_date: datetime = Field(alias='releaseDate')
     character_tags: list[str | LocalizedField] | None = Field(alias='characterTags')
-    display_icon: str = Field(alias='displayIcon')
-    display_icon_small: str | None = Field(alias='displayIconSmall')
-    bust_portrait: str | None = Field(alias='bustPortrait')
-    full_portrait: str | None = Field(alias='fullPortrait')
-    full_portrait_v2: str | None = Field(alias='fullPortraitV2')
-    killfeed_portrait: str = Field(alias='killfeedPortrait')
-    background: str | None
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    display_icon_small: Compact[str | None] = Field(alias='displayIconSmall')
+    bust_portrait: Compact[str | None] = Field(alias='bustPortrait')
+    full_portrait: Compact[str | None] = Field(alias='fullPortrait')
+    full_portrait_v2: Compact[str | None] = Field(alias='fullPortraitV2')
+    killfeed_portrait: Compact[str] = Field(alias='killfeedPortrait')
+    background: Compact[str | None]
     background_gradient_colors: list[Color] = Field(alias='backgroundGradientColors')
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
     is_full_portrait_right_facing: bool = Field(alias='isFullPortraitRightFacing')
     is_playable_character: bool = Field(alias='isPlayableCharacter')
     is_available_for_test: bool = Field(alias='isAvailableForTest')
@@ -97,8 +97,8 @@ class Agent(BaseUUIDModel):
     voice_line: Any = Field(alias='voiceLine')
 
     # NOTE: added in patch 11.x (maybe)
-    minimap_portrait: str | None = Field(alias='minimapPortrait')
-    home_screen_promo_tile_image: str | None = Field(alias='homeScreenPromoTileImage')
+    minimap_portrait: Compact[str | None] = Field(alias='minimapPortrait')
+    home_screen_promo_tile_image: Compact[str | None] = Field(alias='homeScreenPromoTileImage')
 
     def __repr__(self) -> str:
         return f'<Agent display_name={self.display_name!r}>'
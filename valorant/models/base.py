@@ -24,28 +24,213 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+from datetime import datetime
+from types import UnionType
+from typing import TYPE_CHECKING, Annotated, Any, Final, Generic, NamedTuple, TypeVar, Union, get_args, get_origin
 from uuid import UUID
 
-from pydantic import BaseModel as PydanticBaseModel, ConfigDict
+from pydantic import (
+    BaseModel as PydanticBaseModel,
+    ConfigDict,
+    TypeAdapter,
+    WrapSerializer,
+    WrapValidator,
+)
+from pydantic_core import SchemaValidator, core_schema
+from pydantic_extra_types.color import Color
+
+from .localization import LocalizedField
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
 
-from ..utils import is_running_in_pytest
+    from pydantic import SerializerFunctionWrapHandler, ValidationInfo, ValidatorFunctionWrapHandler
+    from pydantic.fields import FieldInfo
+    from pydantic_core import CoreSchema
+    from typing_extensions import Self
+
+    _Converter = Callable[[Any, Mapping[str, Any]], Any]
 
 T = TypeVar('T')
+ModelT = TypeVar('ModelT', bound=PydanticBaseModel)
 
 __all__ = (
     'BaseModel',
     'BaseUUIDModel',
+    'Compact',
+    'Lazy',
+    'Projection',
     'Response',
+    'construct_trusted',
+    'projection',
+    'schema_validator',
+    'type_adapter',
+)
+
+
+class _Deferred:
+    """The decoded data of a lazy field together with the validator it still has to go through."""
+
+    __slots__ = ('data', 'handler')
+
+    def __init__(self, data: Any, handler: Callable[[Any], Any]) -> None:
+        self.data = data
+        self.handler = handler
+
+    def resolve(self) -> Any:
+        return self.handler(self.data)
+
+
+def _validate_lazily(value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+    if info.context and info.context.get('lazy'):
+        return _Deferred(value, handler)
+    return handler(value)
+
+
+def _serialize_lazily(value: Any, handler: SerializerFunctionWrapHandler) -> Any:
+    if type(value) is _Deferred:
+        value = value.resolve()
+    return handler(value)
+
+
+_LAZY_VALIDATOR = WrapValidator(_validate_lazily)
+
+# A field validated on first access instead of with its model, when validating with ``context={'lazy': True}``.
+# Validation errors of the field are raised by that first access.
+Lazy = Annotated[T, _LAZY_VALIDATOR, WrapSerializer(_serialize_lazily)]
+
+
+# Shared by most URLs and asset paths of the catalog. Compact fields store the index of the prefix
+# followed by the rest of the text as bytes, 15 bytes plus the length of the prefix less than the text.
+_PREFIXES: Final[tuple[str, ...]] = (
+    'https://media.valorant-api.com/',
+    'ShooterGame/Content/',
 )
 
 
+def _shorten(value: str) -> Any:
+    for index, prefix in enumerate(_PREFIXES):
+        if value.startswith(prefix):
+            return bytes((index,)) + value[len(prefix) :].encode()
+    return value
+
+
+def _compact(value: Any) -> Any:
+    return _shorten(value) if type(value) is str else value
+
+
+def _expand(value: Any) -> Any:
+    if type(value) is bytes:
+        return _PREFIXES[value[0]] + value[1:].decode()
+    return value
+
+
+def _serialize_compact(value: Any, handler: SerializerFunctionWrapHandler) -> Any:
+    return handler(_expand(value))
+
+
+class _CompactMarker:
+    """Marks compact fields, which only the validators with ``compact=True`` shorten."""
+
+    __slots__ = ()
+
+
+_COMPACT: Final[_CompactMarker] = _CompactMarker()
+
+# A text stored without its common prefix when validating with ``schema_validator(tp, compact=True)``,
+# the full text is rebuilt on every access. Other validators store the text as it is.
+Compact = Annotated[T, _COMPACT, WrapSerializer(_serialize_compact)]
+
+
+class _FieldAttribute:
+    # A data descriptor takes precedence over the instance __dict__ pydantic stores fields in.
+    __slots__ = ('name',)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> Any:
+        if instance is None:
+            # Like any other field, and keeps pydantic from taking this for the default of subclasses.
+            raise AttributeError(self.name)
+        try:
+            return self.get(instance)
+        except KeyError:
+            # A field left out of a projection.
+            raise AttributeError(f'{type(instance).__name__!r} object has no attribute {self.name!r}') from None  # noqa: TRY003
+
+    def get(self, instance: object) -> Any:
+        raise NotImplementedError
+
+    def __set__(self, instance: object, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+
+class _LazyAttribute(_FieldAttribute):
+    __slots__ = ()
+
+    def get(self, instance: object) -> Any:
+        value = instance.__dict__[self.name]
+        if type(value) is _Deferred:
+            value = instance.__dict__[self.name] = value.resolve()
+        return value
+
+
+class _CompactAttribute(_FieldAttribute):
+    __slots__ = ()
+
+    def get(self, instance: object) -> Any:
+        return _expand(instance.__dict__[self.name])
+
+
+def _compact_fields(model: type[PydanticBaseModel]) -> tuple[str, ...]:
+    return tuple(name for name, field in model.__pydantic_fields__.items() if _COMPACT in field.metadata)
+
+
+_EXPANDED: set[type[PydanticBaseModel]] = set()
+
+
+def _expand_on_access(model: type[PydanticBaseModel]) -> None:
+    # Installed once the fields of the model may be stored compact, reading those of the others costs nothing
+    # until then.
+    if model not in _EXPANDED:
+        for name in _compact_fields(model):
+            setattr(model, name, _CompactAttribute(name))
+        _EXPANDED.add(model)
+
+
 class BaseModel(PydanticBaseModel):
     """Base class for all models."""
 
-    model_config = ConfigDict(extra='forbid' if is_running_in_pytest() else 'allow')
+    # Fields added to the API are kept rather than rejected, unless validating with :func:`schema_validator`.
+    # Schemas are built on first validation rather than when the models are imported.
+    model_config = ConfigDict(extra='allow', defer_build=True)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        for name, field in cls.__pydantic_fields__.items():
+            if _LAZY_VALIDATOR in field.metadata:
+                setattr(cls, name, _LazyAttribute(name))
+
+    def _resolve_lazy(self) -> None:
+        # Pending lazy fields hold a validator, which cannot be pickled or copied.
+        for name, value in self.__dict__.items():
+            if type(value) is _Deferred:
+                self.__dict__[name] = value.resolve()
+
+    def __getstate__(self) -> dict[Any, Any]:
+        self._resolve_lazy()
+        return super().__getstate__()
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        self._resolve_lazy()
+        return super().__deepcopy__(memo)
 
     def __repr__(self) -> str:
+        if len(self.__dict__) < len(self.__pydantic_fields__):
+            # Built by a projection, which leaves fields out.
+            return f'<{self.__class__.__name__} fields={tuple(self.__dict__)!r}>'
         return f'<{self.__class__.__name__}>'
 
 
@@ -65,3 +250,413 @@ class BaseUUIDModel(BaseModel):
 class Response(BaseModel, Generic[T]):
     status: int
     data: T
+
+
+# trusted construction
+
+_object_setattr = object.__setattr__
+
+
+class _Plan(NamedTuple):
+    """How construct_trusted builds a model, worked out on its first use."""
+
+    # (alias, name) of every field.
+    aliases: tuple[tuple[str, str], ...]
+    converters: tuple[tuple[str, _Converter], ...]
+    compact: tuple[str, ...]
+    defaults: tuple[tuple[str, FieldInfo], ...]
+    # Whether unknown fields are kept, model_extra is then an empty dict rather than None.
+    extra: bool
+
+
+_PLANS: dict[type[PydanticBaseModel], _Plan] = {}
+# The converter of every type built by construct_trusted, None when the decoded JSON is stored as is.
+_CONVERTERS: dict[Any, _Converter | None] = {}
+
+
+def _plan(model: type[PydanticBaseModel], fields: Mapping[str, FieldInfo] | None = None) -> _Plan:
+    # Unknown fields are kept unless building a projection, which ignores the fields it leaves out.
+    extra = fields is None and model.model_config.get('extra') == 'allow'
+    fields = model.__pydantic_fields__ if fields is None else fields
+    converters = []
+    compact = []
+    for name, field in fields.items():
+        if _COMPACT in field.metadata:
+            compact.append(name)
+        elif (convert := _converter(field.annotation)) is not None:
+            converters.append((name, _lazy_converter(convert) if _LAZY_VALIDATOR in field.metadata else convert))
+    return _Plan(
+        aliases=tuple((field.alias or name, name) for name, field in fields.items()),
+        converters=tuple(converters),
+        compact=tuple(compact),
+        defaults=tuple((name, field) for name, field in fields.items() if not field.is_required()),
+        extra=extra,
+    )
+
+
+def _construct(
+    model: type[ModelT], data: Mapping[str, Any], context: Mapping[str, Any], plan: _Plan | None = None
+) -> ModelT:
+    if plan is None:
+        plan = _PLANS.get(model)
+        if plan is None:
+            plan = _PLANS[model] = _plan(model)
+
+    values = {name: data[alias] for alias, name in plan.aliases if alias in data}
+    fields_set = set(values)
+    for name, convert in plan.converters:
+        if name in values:
+            values[name] = convert(values[name], context)
+    if plan.compact and context.get('compact'):
+        _expand_on_access(model)
+        for name in plan.compact:
+            value = values.get(name)
+            if type(value) is str:
+                values[name] = _shorten(value)
+    for name, field in plan.defaults:
+        if name not in values:
+            values[name] = field.get_default(call_default_factory=True)
+
+    # What model_construct does, without its per-field bookkeeping.
+    instance = model.__new__(model)
+    _object_setattr(instance, '__dict__', values)
+    _object_setattr(instance, '__pydantic_fields_set__', fields_set)
+    _object_setattr(instance, '__pydantic_extra__', {} if plan.extra else None)
+    _object_setattr(instance, '__pydantic_private__', None)
+    return instance
+
+
+def _converter(annotation: Any) -> _Converter | None:
+    # Only the decoded JSON objects and arrays, the uuids, dates and colors need converting, other values are
+    # stored as they are.
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _converter(get_args(annotation)[0])
+    if origin is list:
+        item = _converter(get_args(annotation)[0])
+        return _copy_list if item is None else _list_converter(item)
+    if origin is Union or origin is UnionType:
+        return _union_converter(get_args(annotation))
+    if isinstance(annotation, type) and issubclass(annotation, PydanticBaseModel):
+        return lambda value, context: _construct(annotation, value, context)
+    return _SCALAR_CONVERTERS.get(annotation)
+
+
+def _lazy_converter(convert: _Converter) -> _Converter:
+    def defer(value: Any, context: Mapping[str, Any]) -> Any:
+        if context.get('lazy'):
+            return _Deferred(value, lambda data: convert(data, context))
+        return convert(value, context)
+
+    return defer
+
+
+def _copy_list(value: Any, _context: Mapping[str, Any]) -> Any:
+    # The decoded data may be shared with the cache, the models get lists of their own.
+    return list(value)
+
+
+def _list_converter(item: _Converter) -> _Converter:
+    return lambda value, context: [item(element, context) for element in value]
+
+
+def _union_converter(options: tuple[Any, ...]) -> _Converter | None:
+    # The options are told apart by the JSON type of the value, the API never mixes two kinds of objects.
+    on_object = on_array = on_string = None
+    for option in options:
+        if get_origin(option) is list:
+            on_array = _converter(option)
+        elif option in _STRING_CONVERTERS:
+            on_string = _STRING_CONVERTERS[option]
+        else:
+            on_object = _converter(option) or on_object
+    if on_object is None and on_array is None and on_string is None:
+        return None
+
+    def convert(value: Any, context: Mapping[str, Any]) -> Any:
+        if on_object is not None and type(value) is dict:
+            return on_object(value, context)
+        if on_array is not None and type(value) is list:
+            return on_array(value, context)
+        if on_string is not None and type(value) is str:
+            return on_string(value, context)
+        return value
+
+    return convert
+
+
+def _localized(value: Any, context: Mapping[str, Any]) -> Any:
+    return LocalizedField.from_mapping(value, locales=context.get('locales'))
+
+
+def _uuid(value: Any, _context: Mapping[str, Any]) -> Any:
+    # Models are compared and hashed by uuid, which has to be a UUID like a validated one.
+    return UUID(value) if type(value) is str else value
+
+
+_DATETIMES: Final[SchemaValidator] = SchemaValidator(core_schema.datetime_schema())
+
+
+def _datetime(value: Any, _context: Mapping[str, Any]) -> Any:
+    # Parsed like a validated model's, for the columns and comparisons needing datetimes.
+    return _DATETIMES.validate_python(value) if type(value) is str else value
+
+
+def _color(value: Any, _context: Mapping[str, Any]) -> Any:
+    return Color(value) if type(value) is str else value
+
+
+# The types parsed from JSON strings.
+_STRING_CONVERTERS: Final[dict[Any, _Converter]] = {UUID: _uuid, datetime: _datetime, Color: _color}
+_SCALAR_CONVERTERS: Final[dict[Any, _Converter]] = {LocalizedField: _localized, **_STRING_CONVERTERS}
+
+
+def construct_trusted(tp: type[T], data: Any, context: Mapping[str, Any] | None = None) -> T:
+    """
+    Build models from data without validating it, for data validated once before like the responses of the cache.
+
+    Nested models, lists, localized fields, uuids, dates and colors are built like
+    :meth:`~pydantic.BaseModel.model_validate` would, so built models compare and hash like validated ones and
+    turn into the same columns. Every other value is stored as found in the decoded JSON and does not match its
+    annotation: enums stay strings, and fields compared with ``==`` or dumped differ from a validated model's.
+    Aliases and defaults are applied, unknown fields are dropped.
+
+    Parameters
+    ----------
+    tp : type[T]
+        The type to build, a model or e.g. ``list[Agent]``.
+    data : Any
+        The decoded JSON.
+    context : Mapping[str, Any] | None
+        The validation context, its ``'lazy'``, ``'locales'`` and ``'compact'`` options are honoured.
+
+    Returns:
+    -------
+    T
+        The built value.
+    """
+    try:
+        convert = _CONVERTERS[tp]
+    except KeyError:
+        convert = _CONVERTERS[tp] = _converter(tp)
+    built: T = data if convert is None else convert(data, context or {})
+    return built
+
+
+# validators
+
+_ADAPTERS: dict[Any, TypeAdapter[Any]] = {}
+
+
+def type_adapter(tp: type[T]) -> TypeAdapter[T]:
+    """
+    Return the shared :class:`~pydantic.TypeAdapter` of a type, built on first use.
+
+    Parameters
+    ----------
+    tp : type[T]
+        The type to validate, a model or e.g. ``list[Agent]``.
+
+    Returns:
+    -------
+    TypeAdapter[T]
+        The adapter, the same one for every call with an equal type.
+    """
+    try:
+        return _ADAPTERS[tp]
+    except KeyError:
+        adapter = _ADAPTERS[tp] = TypeAdapter(tp)
+        return adapter
+
+
+def _models(schema: Any) -> set[type[PydanticBaseModel]]:
+    if type(schema) is list:
+        return set().union(*map(_models, schema))
+    if type(schema) is not dict:
+        return set()
+    found = set().union(*map(_models, schema.values()))
+    if schema.get('type') == 'model':
+        found.add(schema['cls'])
+    return found
+
+
+def _schema_validator(schema: CoreSchema) -> SchemaValidator:
+    """Build a validator from a modified copy of the schemas of some models."""
+    # pydantic-core validates the schema of a complete model with the validator of its class wherever it
+    # finds it, which would ignore the changes made to the copy. The models look incomplete until it is built.
+    models = [model for model in _models(schema) if model.__dict__.get('__pydantic_complete__')]
+    for model in models:
+        model.__pydantic_complete__ = False
+    try:
+        return SchemaValidator(schema)
+    finally:
+        for model in models:
+            model.__pydantic_complete__ = True
+
+
+def _variant_schema(schema: Any, *, strict: bool, compact: bool) -> Any:
+    # Copies the schema down to its models. Strict ones reject the fields they keep otherwise, compact ones
+    # shorten the texts of their compact fields.
+    if type(schema) is list:
+        return [_variant_schema(item, strict=strict, compact=compact) for item in schema]
+    if type(schema) is not dict:
+        return schema
+    variant = {key: _variant_schema(value, strict=strict, compact=compact) for key, value in schema.items()}
+    if strict:
+        for key in ('extra_behavior', 'extra_fields_behavior'):
+            if variant.get(key) == 'allow':
+                variant[key] = 'forbid'
+    if compact and variant.get('type') == 'model' and variant['schema']['type'] == 'model-fields':
+        fields = variant['schema']['fields']
+        for name in fields.keys() & _compact_fields(variant['cls']):
+            inner = core_schema.no_info_after_validator_function(_compact, fields[name]['schema'])
+            fields[name] = {**fields[name], 'schema': inner}
+    return variant
+
+
+def _variant_validator(schema: CoreSchema, *, strict: bool, compact: bool) -> SchemaValidator:
+    validator = _schema_validator(_variant_schema(schema, strict=strict, compact=compact))
+    if compact:
+        for model in _models(schema):
+            _expand_on_access(model)
+    return validator
+
+
+_VALIDATORS: dict[tuple[Any, bool, bool], SchemaValidator] = {}
+
+
+def schema_validator(tp: type[Any], *, strict: bool = False, compact: bool = False) -> SchemaValidator:
+    """
+    Return the shared validator of a type with some options, built on first use.
+
+    The validator of :func:`type_adapter` with none is faster, it keeps unknown fields in ``model_extra``
+    and stores :data:`Compact` fields as they are.
+
+    Parameters
+    ----------
+    tp : type[Any]
+        The type to validate, a model or e.g. ``list[Agent]``.
+    strict : bool
+        Reject the fields unknown to the models, as the API adds some now and then. Defaults to False.
+    compact : bool
+        Store the :data:`Compact` fields without their common prefix. Defaults to False.
+
+    Returns:
+    -------
+    SchemaValidator
+        The validator, the same one for every call with an equal type and the same options.
+    """
+    try:
+        return _VALIDATORS[tp, strict, compact]
+    except KeyError:
+        pass
+    adapter = type_adapter(tp)
+    # The schemas of models are built on first validation.
+    adapter.rebuild()
+    validator = _VALIDATORS[tp, strict, compact] = _variant_validator(
+        adapter.core_schema, strict=strict, compact=compact
+    )
+    return validator
+
+
+# projections
+
+
+def _project_schema(schema: CoreSchema, model: type[PydanticBaseModel], fields: tuple[str, ...]) -> Any:
+    # Copies the path down to the fields of the model, through the validators and definitions wrapping it,
+    # the schemas of the fields kept are shared with the model.
+    projected: Any = dict(schema)
+    if projected['type'] != 'model' or projected['cls'] is not model:
+        projected['schema'] = _project_schema(projected['schema'], model, fields)
+        return projected
+    inner = projected['schema']
+    projected['schema'] = {
+        **inner,
+        'fields': {name: inner['fields'][name] for name in fields},
+        'extra_behavior': 'ignore',
+    }
+    projected['config'] = {**projected.get('config', {}), 'extra_fields_behavior': 'ignore'}
+    return projected
+
+
+class Projection(Generic[ModelT]):
+    """
+    Builds lists of a model holding only some of its fields, see :func:`projection`.
+
+    The items are instances of the model, the fields left out are neither validated nor stored
+    and accessing them raises :exc:`AttributeError`. Projections of a :class:`BaseUUIDModel` always
+    keep ``uuid``, which the items are compared and hashed by.
+    """
+
+    __slots__ = ('_plan', '_validator', 'fields', 'model')
+
+    def __init__(
+        self, model: type[ModelT], fields: tuple[str, ...], *, strict: bool = False, compact: bool = False
+    ) -> None:
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        self.model: type[ModelT] = model
+        self.fields: tuple[str, ...] = fields
+        schema = _project_schema(model.__pydantic_core_schema__, model, fields)
+        self._validator = _variant_validator(core_schema.list_schema(schema), strict=strict, compact=compact)
+        self._plan = _plan(model, {name: model.__pydantic_fields__[name] for name in fields})
+
+    def validate_python(self, data: Any, *, context: Mapping[str, Any] | None = None) -> list[ModelT]:
+        """Validate the decoded JSON like ``type_adapter(list[model])`` would."""
+        validated: list[ModelT] = self._validator.validate_python(data, context=context)
+        return validated
+
+    def construct_trusted(self, data: Any, context: Mapping[str, Any] | None = None) -> list[ModelT]:
+        """Build the decoded JSON like ``construct_trusted(list[model])`` would."""
+        context = context or {}
+        return [_construct(self.model, item, context, self._plan) for item in data]
+
+    def __repr__(self) -> str:
+        return f'<Projection model={self.model.__name__} fields={self.fields!r}>'
+
+
+_PROJECTIONS: dict[tuple[type[PydanticBaseModel], tuple[str, ...], bool, bool], Projection[Any]] = {}
+
+
+def projection(
+    model: type[ModelT], fields: Iterable[str], *, strict: bool = False, compact: bool = False
+) -> Projection[ModelT]:
+    """
+    Return the shared :class:`Projection` of a model on some of its fields, built on first use.
+
+    Parameters
+    ----------
+    model : type[ModelT]
+        The model to project.
+    fields : Iterable[str]
+        The names of the fields to keep, as attributes rather than JSON keys. ``uuid`` is added in front
+        for a :class:`BaseUUIDModel` if missing.
+    strict : bool
+        Reject the fields unknown to the nested models, like :func:`schema_validator`. Defaults to False.
+    compact : bool
+        Store the :data:`Compact` fields without their common prefix, like :func:`schema_validator`.
+        Defaults to False.
+
+    Returns:
+    -------
+    Projection[ModelT]
+        The projection, the same one for every call with the same fields in the same order and options.
+
+    Raises:
+    ------
+    ValueError
+        If the model has no field of one of the names.
+    """
+    fields = tuple(fields)
+    if issubclass(model, BaseUUIDModel) and 'uuid' not in fields:
+        # The items are compared and hashed by uuid.
+        fields = ('uuid', *fields)
+    try:
+        return _PROJECTIONS[model, fields, strict, compact]
+    except KeyError:
+        pass
+    unknown = [name for name in fields if name not in model.__pydantic_fields__]
+    if unknown:
+        raise ValueError(f'unknown fields of {model.__name__}: {", ".join(unknown)}')  # noqa: TRY003
+    built = _PROJECTIONS[model, fields, strict, compact] = Projection(model, fields, strict=strict, compact=compact)
+    return built
@@ -29,7 +29,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact, Lazy
 from .localization import LocalizedField
 
 __all__ = (
@@ -47,8 +47,8 @@ class Level(BaseUUIDModel):
     charm_level: int = Field(alias='charmLevel')
     hide_if_not_owned: bool = Field(alias='hideIfNotOwned')
     display_name: str | LocalizedField = Field(alias='displayName')
-    display_icon: str = Field(alias='displayIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
     def __repr__(self) -> str:
         return f'<Level display_name={self.display_name!r}>'
@@ -59,9 +59,9 @@ class Buddy(BaseUUIDModel):
     display_name: str | LocalizedField = Field(alias='displayName')
     is_hidden_if_not_owned: bool = Field(alias='isHiddenIfNotOwned')
     theme_uuid: UUID | None = Field(alias='themeUuid')
-    display_icon: str = Field(alias='displayIcon')
-    asset_path: str = Field(alias='assetPath')
-    levels: list[Level]
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
+    levels: Lazy[list[Level]]
 
     def __repr__(self) -> str:
         return f'<Buddy display_name={self.display_name!r}>'
@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = ('Bundle',)
@@ -38,8 +38,8 @@ class Bundle(BaseUUIDModel):
     extra_description: str | LocalizedField | None = Field(alias='extraDescription')
     promo_description: str | LocalizedField | None = Field(alias='promoDescription')
     use_additional_context: bool = Field(alias='useAdditionalContext')
-    display_icon: str = Field(alias='displayIcon')
-    display_icon2: str = Field(alias='displayIcon2')
-    logo_icon: str | None = Field(alias='logoIcon')
-    vertical_promo_image: str | None = Field(alias='verticalPromoImage')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    display_icon2: Compact[str] = Field(alias='displayIcon2')
+    logo_icon: Compact[str | None] = Field(alias='logoIcon')
+    vertical_promo_image: Compact[str | None] = Field(alias='verticalPromoImage')
+    asset_path: Compact[str] = Field(alias='assetPath')
@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = ('Ceremony',)
@@ -33,4 +33,4 @@ __all__ = ('Ceremony',)
 class Ceremony(BaseUUIDModel):
     # uuid: str
     display_name: str | LocalizedField = Field(alias='displayName')
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
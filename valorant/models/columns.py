@@ -0,0 +1,295 @@
+"""
+The MIT License (MIT).
+
+Copyright (c) 2023-present STACiA
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import types
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Final, Generic, NamedTuple, TypeVar, Union, get_args, get_origin
+from uuid import UUID
+
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic_extra_types.color import Color
+
+from .. import utils
+from .localization import LocalizedField
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from typing import TypeAlias
+
+    import numpy as np
+    import pandas as pd
+
+    Column: TypeAlias = 'np.ndarray | Categorical'
+else:
+    np = utils._lazy_import('numpy')
+    pd = utils._lazy_import('pandas')
+
+ModelT = TypeVar('ModelT', bound=PydanticBaseModel)
+
+__all__ = (
+    'Categorical',
+    'ModelList',
+    'to_columns',
+    'to_dataframe',
+)
+
+
+class Categorical(NamedTuple):
+    """A column of repeated values, stored as the index of each value in ``categories``, -1 for None."""
+
+    codes: np.ndarray
+    categories: np.ndarray
+
+
+# plans
+
+
+class _Null:
+    """Stands for a missing nested model, every field of which reads as None."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> None:
+        return None
+
+
+_NULL: Final[_Null] = _Null()
+
+
+class _Field(NamedTuple):
+    name: str
+    # Builds the column from the values of the field, or the plan of a nested model to flatten.
+    build: Callable[[list[Any]], Column] | _Plan
+
+
+class _Plan(NamedTuple):
+    fields: tuple[_Field, ...]
+    getter: Callable[[Any], tuple[Any, ...]]
+
+
+_PLANS: dict[tuple[type[PydanticBaseModel], tuple[str, ...], bool], _Plan] = {}
+
+
+def _plan(model: type[PydanticBaseModel], names: tuple[str, ...], nullable: bool) -> _Plan:
+    key = (model, names, nullable)
+    plan = _PLANS.get(key)
+    if plan is None:
+        fields = []
+        for name in names:
+            build = _builder(model.__pydantic_fields__[name].annotation, nullable=nullable)
+            if build is not None:
+                fields.append(_Field(name, build))
+        # Always a tuple, even for a single field.
+        getter = attrgetter(*(field.name for field in fields), *(() if len(fields) > 1 else ('__class__',)))
+        plan = _PLANS[key] = _Plan(tuple(fields), getter)
+    return plan
+
+
+def _builder(annotation: Any, *, nullable: bool) -> Callable[[list[Any]], Column] | _Plan | None:
+    # None for the fields left out: lists and values of unknown types.
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        options = [option for option in get_args(annotation) if option is not type(None)]
+        nullable = nullable or len(options) < len(get_args(annotation))
+        if LocalizedField in options:
+            # Alongside str, the text as returned by the API for a single language.
+            annotation = LocalizedField
+        elif len(options) == 1:
+            (annotation,) = options
+        else:
+            return None
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, PydanticBaseModel):
+        return _plan(annotation, tuple(annotation.__pydantic_fields__), nullable)
+    if issubclass(annotation, enum.Enum):
+        return _categorical
+    builders = _BUILDERS.get(annotation)
+    if builders is None:
+        return None
+    return builders[nullable]
+
+
+# columns
+
+
+def _ints(values: list[Any]) -> np.ndarray:
+    return np.array(values, dtype=np.int64)
+
+
+def _floats(values: list[Any]) -> np.ndarray:
+    # None reads as NaN.
+    return np.array(values, dtype=np.float64)
+
+
+def _bools(values: list[Any]) -> np.ndarray:
+    return np.array(values, dtype=np.bool_)
+
+
+def _object(values: list[Any]) -> np.ndarray:
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _text(values: list[Any]) -> np.ndarray:
+    # The en-US text of localized fields.
+    return _object([value if value is None or type(value) is str else str(value) for value in values])
+
+
+def _colors(values: list[Any]) -> np.ndarray:
+    return _object([None if value is None else value.as_hex(format='long') for value in values])
+
+
+def _datetimes(values: list[Any]) -> np.ndarray:
+    # In UTC, None reads as NaT.
+    return np.array(
+        [
+            value
+            if value is None or value.tzinfo is None
+            else value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            for value in values
+        ],
+        dtype='datetime64[us]',
+    )
+
+
+def _categorical(values: list[Any]) -> Categorical:
+    # Numbered in order of first appearance.
+    categories = [value for value in dict.fromkeys(values) if value is not None]
+    index: dict[Any, int] = {value: code for code, value in enumerate(categories)}
+    index[None] = -1
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.int32, count=len(values))
+    return Categorical(codes, _object(categories))
+
+
+# The column builders of a type, by whether its values may be None.
+_BUILDERS: Final[dict[type, tuple[Callable[[list[Any]], Column], Callable[[list[Any]], Column]]]] = {
+    bool: (_bools, _object),
+    int: (_ints, _floats),
+    float: (_floats, _floats),
+    str: (_object, _object),
+    datetime.datetime: (_datetimes, _datetimes),
+    UUID: (_categorical, _categorical),
+    LocalizedField: (_text, _text),
+    Color: (_colors, _colors),
+}
+
+
+def _flatten(models: Sequence[Any], plan: _Plan, prefix: str, columns: dict[str, Column]) -> None:
+    # Every field is read in a single pass over the models, then each column is built at once.
+    values: list[tuple[Any, ...]] = list(zip(*map(plan.getter, models), strict=True)) if models else []
+    values += [()] * (len(plan.fields) - len(values))
+    for field, column in zip(plan.fields, values, strict=False):
+        name = prefix + field.name
+        if isinstance(field.build, _Plan):
+            nested = [_NULL if value is None else value for value in column]
+            _flatten(nested, field.build, name + '.', columns)
+        else:
+            columns[name] = field.build(list(column))
+
+
+def to_columns(models: Sequence[ModelT], model: type[ModelT] | None = None) -> dict[str, Column]:
+    """
+    Turn models into columns of NumPy arrays, one per scalar field.
+
+    Nested models such as ``Weapon.weapon_stats`` are flattened into dotted columns, e.g.
+    ``'weapon_stats.fire_rate'``, and read as None when missing. Lists are left out.
+
+    - ints, floats and bools become arrays of their type, optional ints and floats are float arrays
+      where None reads as NaN.
+    - datetimes become ``datetime64[us]`` arrays in UTC, None reads as NaT.
+    - uuids and enums become :class:`Categorical` columns.
+    - strings, localized fields (their en-US text) and colors (their hex code) become object arrays.
+
+    Parameters
+    ----------
+    models : Sequence[ModelT]
+        The models, all of the same type. Projected models only give the columns of the fields they hold.
+    model : type[ModelT] | None
+        The type of the models, needed for an empty sequence. Defaults to the type of the first model.
+
+    Returns:
+    -------
+    dict[str, np.ndarray | Categorical]
+        The columns by field name, in the order of the fields.
+
+    Raises:
+    ------
+    ImportError
+        NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError('to_columns() requires numpy, install it with `pip install valorant.py[dataframe]`')  # noqa: TRY003
+    if model is None:
+        if not models:
+            return {}
+        model = type(models[0])
+    # The fields held by the first model, which are all of them unless it comes from a projection.
+    names = tuple(name for name in model.__pydantic_fields__ if not models or name in models[0].__dict__)
+    columns: dict[str, Column] = {}
+    _flatten(models, _plan(model, names, nullable=False), '', columns)
+    return columns
+
+
+def to_dataframe(models: Sequence[ModelT], model: type[ModelT] | None = None) -> pd.DataFrame:
+    """
+    Turn models into a :class:`pandas.DataFrame`, with the columns of :func:`to_columns`.
+
+    :class:`Categorical` columns become :class:`pandas.Categorical` ones.
+
+    Raises:
+    ------
+    ImportError
+        pandas is not installed.
+    """
+    if pd is None:
+        raise ImportError('to_dataframe() requires pandas, install it with `pip install valorant.py[dataframe]`')  # noqa: TRY003
+    columns = {
+        name: pd.Categorical.from_codes(column.codes, column.categories) if isinstance(column, Categorical) else column
+        for name, column in to_columns(models, model).items()
+    }
+    return pd.DataFrame(columns, copy=False)
+
+
+class ModelList(list[ModelT], Generic[ModelT]):
+    """The models returned by the list fetches of :class:`~valorant.Client`, exportable to columns."""
+
+    __slots__ = ('model',)
+
+    def __init__(self, model: type[ModelT], models: Iterable[ModelT] = ()) -> None:
+        super().__init__(models)
+        self.model = model
+
+    def to_columns(self) -> dict[str, Column]:
+        """See :func:`to_columns`."""
+        return to_columns(self, self.model)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """See :func:`to_dataframe`, requires pandas."""
+        return to_dataframe(self, self.model)
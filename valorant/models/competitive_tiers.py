@@ -26,7 +26,7 @@ from pydantic import Field
 from pydantic_extra_types.color import Color
 
 from ..enums import DivisionTier
-from .base import BaseModel, BaseUUIDModel
+from .base import BaseModel, BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = (
@@ -42,14 +42,14 @@ class Tier(BaseModel):
     division_name: str | LocalizedField = Field(alias='divisionName')
     color: Color
     background_color: Color = Field(alias='backgroundColor')
-    small_icon: str | None = Field(alias='smallIcon')
-    large_icon: str | None = Field(alias='largeIcon')
-    rank_triangle_down_icon: str | None = Field(alias='rankTriangleDownIcon')
-    rank_triangle_up_icon: str | None = Field(alias='rankTriangleUpIcon')
+    small_icon: Compact[str | None] = Field(alias='smallIcon')
+    large_icon: Compact[str | None] = Field(alias='largeIcon')
+    rank_triangle_down_icon: Compact[str | None] = Field(alias='rankTriangleDownIcon')
+    rank_triangle_up_icon: Compact[str | None] = Field(alias='rankTriangleUpIcon')
 
 
 class CompetitiveTier(BaseUUIDModel):
     # uuid: str
     asset_object_name: str = Field(alias='assetObjectName')
     tiers: list[Tier]
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
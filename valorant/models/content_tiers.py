@@ -25,7 +25,7 @@ DEALINGS IN THE SOFTWARE.
 from pydantic import Field
 from pydantic_extra_types.color import Color
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = ('ContentTier',)
@@ -39,5 +39,5 @@ class ContentTier(BaseUUIDModel):
     juice_value: int = Field(alias='juiceValue')
     juice_cost: int = Field(alias='juiceCost')
     highlight_color: Color = Field(alias='highlightColor')
-    display_icon: str = Field(alias='displayIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
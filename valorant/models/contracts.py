@@ -31,7 +31,7 @@ from uuid import UUID
 from pydantic import Field
 
 from ..enums import RelationType, RewardType
-from .base import BaseModel, BaseUUIDModel
+from .base import BaseModel, BaseUUIDModel, Compact, Lazy
 from .localization import LocalizedField
 
 __all__ = (
@@ -105,7 +105,7 @@ class Chapter(BaseModel):
 class Content(BaseModel):
     relation_type: RelationType | None = Field(alias='relationType')
     relation_uuid: UUID | None = Field(alias='relationUuid')
-    chapters: list[Chapter]
+    chapters: Lazy[list[Chapter]]
     premium_reward_schedule_uuid: str | None = Field(alias='premiumRewardScheduleUuid')
     premium_vp_cost: int = Field(alias='premiumVPCost')
 
@@ -128,10 +128,10 @@ class Content(BaseModel):
 class Contract(BaseUUIDModel):
     # uuid: str
     display_name: str | LocalizedField = Field(alias='displayName')
-    display_icon: str | None = Field(alias='displayIcon')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
     ship_it: bool = Field(alias='shipIt')
     use_level_vp_cost_override: bool = Field(alias='useLevelVPCostOverride')
     level_vp_cost_override: int = Field(alias='levelVPCostOverride')
     free_reward_schedule_uuid: str = Field(alias='freeRewardScheduleUuid')
     content: Content
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
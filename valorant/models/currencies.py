@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = ('Currency',)
@@ -34,7 +34,7 @@ class Currency(BaseUUIDModel):
     # uuid: str
     display_name: str | LocalizedField = Field(alias='displayName')
     display_name_singular: str | LocalizedField = Field(alias='displayNameSingular')
-    display_icon: str = Field(alias='displayIcon')
-    large_icon: str = Field(alias='largeIcon')
-    reward_preview_icon: str = Field(alias='rewardPreviewIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    large_icon: Compact[str] = Field(alias='largeIcon')
+    reward_preview_icon: Compact[str] = Field(alias='rewardPreviewIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
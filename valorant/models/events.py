@@ -26,7 +26,7 @@ from datetime import datetime
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = ('Event',)
@@ -38,4 +38,4 @@ class Event(BaseUUIDModel):
     short_display_name: str | LocalizedField | None = Field(alias='shortDisplayName')
     start_time: datetime = Field(alias='startTime')
     end_time: datetime = Field(alias='endTime')
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 
@@ -10,5 +10,5 @@ class Flex(BaseUUIDModel):
     # uuid: str
     display_name: str | LocalizedField = Field(alias='displayName')
     display_name_all_caps: str | LocalizedField = Field(alias='displayNameAllCaps')
-    display_icon: str = Field(alias='displayIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
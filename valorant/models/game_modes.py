@@ -27,7 +27,7 @@ from __future__ import annotations
 from pydantic import Field
 
 from ..enums import GameFeature, GameRule
-from .base import BaseModel, BaseUUIDModel
+from .base import BaseModel, BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = (
@@ -62,15 +62,15 @@ class GameMode(BaseUUIDModel):
     team_roles: list[str] | None = Field(alias='teamRoles')
     game_feature_overrides: list[GameFeatureOverride] | None = Field(alias='gameFeatureOverrides')
     game_rule_bool_overrides: list[GameRuleBoolOverride] | None = Field(alias='gameRuleBoolOverrides')
-    display_icon: str | None = Field(alias='displayIcon')
-    list_view_icon_tall: str | None = Field(alias='listViewIconTall')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    list_view_icon_tall: Compact[str | None] = Field(alias='listViewIconTall')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
 
 class Equippable(BaseUUIDModel):
     # uuid: str
     display_name: str | LocalizedField = Field(alias='displayName')
     category: str
-    display_icon: str = Field(alias='displayIcon')
-    kill_stream_icon: str = Field(alias='killStreamIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    kill_stream_icon: Compact[str] = Field(alias='killStreamIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
@@ -27,7 +27,7 @@ from typing import Any
 from pydantic import Field
 
 from ..enums import ShopCategory
-from .base import BaseModel, BaseUUIDModel
+from .base import BaseModel, BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = (
@@ -50,9 +50,9 @@ class ShopData(BaseModel):
     grid_position: Any = Field(alias='gridPosition')
     can_be_trashed: bool = Field(alias='canBeTrashed')
     image: Any
-    new_image: str = Field(alias='newImage')
+    new_image: Compact[str] = Field(alias='newImage')
     new_image2: Any = Field(alias='newImage2')
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
 
 class Gear(BaseUUIDModel):
@@ -61,6 +61,6 @@ class Gear(BaseUUIDModel):
     description: str | LocalizedField
     descriptions: list[str | LocalizedField]
     details: list[Detail]
-    display_icon: str = Field(alias='displayIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
     shop_data: ShopData = Field(alias='shopData')
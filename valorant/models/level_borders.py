@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = ('LevelBorder',)
@@ -36,6 +36,6 @@ class LevelBorder(BaseUUIDModel):
     starting_level: int = Field(alias='startingLevel')
     level_number_appearance: str = Field(alias='levelNumberAppearance')
     small_player_card_appearance: str = Field(alias='smallPlayerCardAppearance')
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
     # NOTE: added in patch 11.11
     level_number: int = Field(alias='levelNumber')
@@ -1,29 +1,70 @@
 from __future__ import annotations
 
-from pydantic import Field
-
-from .base import BaseModel
-
-
-class LocalizedField(BaseModel):
-    de_DE: str = Field(alias='de-DE')
-    es_ES: str = Field(alias='es-ES')
-    ar_AE: str = Field(alias='ar-AE')
-    id_ID: str = Field(alias='id-ID')
-    es_MX: str = Field(alias='es-MX')
-    fr_FR: str = Field(alias='fr-FR')
-    en_US: str = Field(alias='en-US')
-    it_IT: str = Field(alias='it-IT')
-    ja_JP: str = Field(alias='ja-JP')
-    ko_KR: str = Field(alias='ko-KR')
-    th_TH: str = Field(alias='th-TH')
-    pl_PL: str = Field(alias='pl-PL')
-    pt_BR: str = Field(alias='pt-BR')
-    ru_RU: str = Field(alias='ru-RU')
-    tr_TR: str = Field(alias='tr-TR')
-    vi_VN: str = Field(alias='vi-VN')
-    zh_TW: str = Field(alias='zh-TW')
-    zh_CN: str = Field(alias='zh-CN')
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Final
+
+from pydantic_core import PydanticCustomError, core_schema
+
+from ..enums import Language
+
+if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
+    from pydantic import GetCoreSchemaHandler
+    from typing_extensions import Self
+
+__all__ = ('LocalizedField',)
+
+# A LocalizedField holds every text at the ordinal of its language in Language.
+_LOCALES: Final[tuple[str, ...]] = tuple(language.value for language in Language)
+# Always kept by a locale projection, str() returns it.
+_FALLBACK: Final[str] = Language.american_english.value
+
+
+def _locale(language: Language) -> Any:
+    index = _LOCALES.index(language.value)
+
+    def get(field: LocalizedField) -> str:
+        text = field[index]
+        if text is None:
+            raise KeyError(f'the {language.value} text was dropped by a locale projection')  # noqa: TRY003
+        return text
+
+    return property(get, doc=f'The {language.value} text.')
+
+
+class LocalizedField(tuple[str | None, ...]):
+    """A text in every language, as returned by the API with ``language='all'``.
+
+    The texts are stored in a plain tuple ordered like :class:`~valorant.enums.Language`, so a field
+    costs a single small object however many of them a catalog holds. Dropped locales hold None.
+
+    When validated with ``context={'locales': {...}}`` (see the ``locales`` option of
+    :class:`~valorant.Client`), only the texts of those locales and of en-US are kept. Reading the
+    text of another locale raises :exc:`KeyError`. Unknown locales are rejected with
+    ``context={'strict': True}``.
+    """
+
+    __slots__ = ()
+
+    de_DE: str = _locale(Language.german)
+    es_ES: str = _locale(Language.spain_spanish)
+    ar_AE: str = _locale(Language.arabic)
+    id_ID: str = _locale(Language.indonesian)
+    es_MX: str = _locale(Language.spanish_mexican)
+    fr_FR: str = _locale(Language.french)
+    en_US: str = _locale(Language.american_english)
+    it_IT: str = _locale(Language.italian)
+    ja_JP: str = _locale(Language.japanese)
+    ko_KR: str = _locale(Language.korean)
+    th_TH: str = _locale(Language.thai)
+    pl_PL: str = _locale(Language.polish)
+    pt_BR: str = _locale(Language.brazil_portuguese)
+    ru_RU: str = _locale(Language.russian)
+    tr_TR: str = _locale(Language.turkish)
+    vi_VN: str = _locale(Language.vietnamese)
+    zh_TW: str = _locale(Language.taiwan_chinese)
+    zh_CN: str = _locale(Language.chinese)
 
     # aliases
 
@@ -46,6 +87,83 @@ class LocalizedField(BaseModel):
     chinese: str = zh_CN
     taiwan_chinese: str = zh_TW
 
+    def __new__(cls, **texts: str) -> Self:
+        return cls.from_mapping(texts)
+
+    @classmethod
+    def from_mapping(
+        cls,
+        texts: Mapping[str, str],
+        *,
+        locales: AbstractSet[str] | None = None,
+        strict: bool = False,
+    ) -> Self:
+        """
+        Create a field from texts keyed by locale (e.g. ``'ja-JP'``), as found in API responses.
+
+        Parameters
+        ----------
+        texts : Mapping[str, str]
+            The text of every locale.
+        locales : AbstractSet[str] | None
+            Only keep the texts of these locales and of en-US, reading the others raises :exc:`KeyError`.
+            Defaults to keeping every text.
+        strict : bool
+            Reject texts of locales missing from :class:`~valorant.enums.Language`. Defaults to False.
+
+        Returns:
+        -------
+        LocalizedField
+            The new field.
+        """
+        try:
+            if locales is None:
+                values: list[str | None] = [texts[locale] for locale in _LOCALES]
+            else:
+                values = [texts[locale] if locale in locales or locale == _FALLBACK else None for locale in _LOCALES]
+        except KeyError as exc:
+            raise ValueError(f'missing text for {exc.args[0]}') from None  # noqa: TRY003
+        if strict and len(texts) != len(_LOCALES):
+            unknown = ', '.join(sorted(set(texts).difference(_LOCALES)))
+            raise ValueError(f'unknown locales: {unknown}')  # noqa: TRY003
+        return tuple.__new__(cls, values)
+
+    def to_dict(self) -> dict[str, str]:
+        """Return the texts keyed by locale, the inverse of :meth:`from_mapping`. Dropped locales are left out."""
+        return {locale: text for locale, text in zip(_LOCALES, self, strict=True) if text is not None}
+
+    @classmethod
+    def _restore(cls, texts: Mapping[str, str]) -> Self:
+        return cls.from_mapping(texts, locales=texts.keys())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self._restore, (self.to_dict(),))
+
+    @classmethod
+    def _validate(cls, value: Any, info: core_schema.ValidationInfo) -> Self:
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, Mapping):
+            raise PydanticCustomError('localized_field_type', 'Input should be a mapping of locales to texts')
+
+        context = info.context or {}
+        field = cls.from_mapping(value, locales=context.get('locales'), strict=context.get('strict', False))
+        # Only the texts that are kept are checked, the others are never looked at.
+        if not all(type(text) is str for text in field if text is not None):
+            raise ValueError('texts must be strings')  # noqa: TRY003
+        return field
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.with_info_after_validator_function(
+                cls._validate,
+                core_schema.dict_schema(core_schema.str_schema(), core_schema.str_schema()),
+            ),
+            python_schema=core_schema.with_info_plain_validator_function(cls._validate),
+            serialization=core_schema.plain_serializer_function_ser_schema(cls.to_dict),
+        )
+
     def __str__(self) -> str:
         return self.en_US
 
@@ -26,7 +26,7 @@ from typing import Any
 
 from pydantic import Field
 
-from .base import BaseModel, BaseUUIDModel
+from .base import BaseModel, BaseUUIDModel, Compact, Lazy
 from .localization import LocalizedField
 
 __all__ = (
@@ -66,16 +66,16 @@ class Map(BaseUUIDModel):
     narrative_description: Any = Field(alias='narrativeDescription')
     tactical_description: str | LocalizedField | None = Field(alias='tacticalDescription')
     coordinates: str | LocalizedField | None
-    display_icon: str | None = Field(alias='displayIcon')
-    list_view_icon: str = Field(alias='listViewIcon')
-    list_view_icon_tall: str | None = Field(alias='listViewIconTall')
-    splash: str
-    stylized_background_image: str | None = Field(alias='stylizedBackgroundImage')
-    premier_background_image: str | None = Field(alias='premierBackgroundImage')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    list_view_icon: Compact[str] = Field(alias='listViewIcon')
+    list_view_icon_tall: Compact[str | None] = Field(alias='listViewIconTall')
+    splash: Compact[str]
+    stylized_background_image: Compact[str | None] = Field(alias='stylizedBackgroundImage')
+    premier_background_image: Compact[str | None] = Field(alias='premierBackgroundImage')
+    asset_path: Compact[str] = Field(alias='assetPath')
     map_url: str = Field(alias='mapUrl')
     x_multiplier: float = Field(alias='xMultiplier')
     y_multiplier: float = Field(alias='yMultiplier')
     x_scalar_to_add: float = Field(alias='xScalarToAdd')
     y_scalar_to_add: float = Field(alias='yScalarToAdd')
-    callouts: list[Callout] | None
+    callouts: Lazy[list[Callout] | None]
@@ -28,7 +28,7 @@ from uuid import UUID
 from pydantic import Field
 
 from ..enums import MissionTag, MissionType
-from .base import BaseModel, BaseUUIDModel
+from .base import BaseModel, BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = (
@@ -53,4 +53,4 @@ class Mission(BaseUUIDModel):
     expiration_date: datetime = Field(alias='expirationDate')
     tags: list[MissionTag] | None
     objectives: list[Objective] | None
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
@@ -29,7 +29,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = ('PlayerCard',)
@@ -44,11 +44,11 @@ class PlayerCard(BaseUUIDModel):
     display_name: str | LocalizedField = Field(alias='displayName')
     is_hidden_if_not_owned: bool = Field(alias='isHiddenIfNotOwned')
     theme_uuid: UUID | None = Field(alias='themeUuid')
-    display_icon: str = Field(alias='displayIcon')
-    small_art: str = Field(alias='smallArt')
-    wide_art: str = Field(alias='wideArt')
-    large_art: str | None = Field(alias='largeArt')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    small_art: Compact[str] = Field(alias='smallArt')
+    wide_art: Compact[str] = Field(alias='wideArt')
+    large_art: Compact[str | None] = Field(alias='largeArt')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
     # useful methods
 
@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = ('PlayerTitle',)
@@ -35,4 +35,4 @@ class PlayerTitle(BaseUUIDModel):
     display_name: str | LocalizedField | None = Field(alias='displayName')
     title_text: str | LocalizedField | None = Field(alias='titleText')
     is_hidden_if_not_owned: bool = Field(alias='isHiddenIfNotOwned')
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
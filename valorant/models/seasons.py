@@ -31,7 +31,7 @@ from uuid import UUID
 from pydantic import Field
 
 from ..enums import SeasonType
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = (
@@ -52,7 +52,7 @@ class Season(BaseUUIDModel):
     start_time: datetime = Field(alias='startTime')
     end_time: datetime = Field(alias='endTime')
     parent_uuid: UUID | None = Field(alias='parentUuid')
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
     # useful methods
 
@@ -66,9 +66,9 @@ class Border(BaseUUIDModel):
     # uuid: str
     level: int
     wins_required: int = Field(alias='winsRequired')
-    display_icon: str = Field(alias='displayIcon')
-    small_icon: str | None = Field(alias='smallIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    small_icon: Compact[str | None] = Field(alias='smallIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
 
 class Competitive(BaseUUIDModel):
@@ -78,7 +78,7 @@ class Competitive(BaseUUIDModel):
     season_uuid: UUID = Field(alias='seasonUuid')
     competitive_tiers_uuid: UUID = Field(alias='competitiveTiersUuid')
     borders: list[Border] | None
-    asset_path: str = Field(alias='assetPath')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
     async def fetch_season(self, *, client: Client) -> Season:
         return await client.fetch_season(str(self.season_uuid))
@@ -0,0 +1,286 @@
+"""
+The MIT License (MIT).
+
+Copyright (c) 2023-present STACiA
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import functools
+import pickle  # noqa: S403
+import types
+from typing import TYPE_CHECKING, Any, Final, Literal, TypeVar, Union, get_args, get_origin
+from uuid import UUID
+
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic_core import SchemaValidator, core_schema
+from pydantic_extra_types.color import Color
+
+from .. import utils
+from .base import _Deferred, _expand_on_access, _object_setattr, _schema_validator
+from .localization import LocalizedField
+
+if TYPE_CHECKING:
+    from pydantic_core import CoreSchema
+
+T = TypeVar('T')
+
+__all__ = (
+    'dumps',
+    'loads',
+)
+
+# The first byte of the payloads tells how the rest was encoded.
+_MSGPACK: Final[bytes] = b'\x01'
+_PICKLE: Final[bytes] = b'\x02'
+
+# packing
+#
+# Models are packed as the dict of their fields keyed by their position, along with their unknown fields,
+# or as [fields] when some of their fields are missing, like the projections of list fetches.
+# Uuids are packed as 16 bytes, enums as their value, localized fields as the list of their texts
+# and colors as the value they were parsed from.
+
+_KEYS: dict[type[PydanticBaseModel], dict[str, str]] = {}
+
+
+def _keys(model: type[PydanticBaseModel]) -> dict[str, str]:
+    try:
+        return _KEYS[model]
+    except KeyError:
+        keys = _KEYS[model] = {name: str(index) for index, name in enumerate(model.__pydantic_fields__)}
+        return keys
+
+
+def _pack_value(value: Any) -> Any:
+    # Called by msgspec for the values it cannot encode by itself.
+    if isinstance(value, PydanticBaseModel):
+        keys = _keys(type(value))
+        fields = {keys[name]: item for name, item in value.__dict__.items()}
+        if len(fields) < len(keys):
+            return [fields]
+        extra = value.__pydantic_extra__
+        return {**extra, **fields} if extra else fields
+    if type(value) is _Deferred:
+        return value.resolve()
+    if isinstance(value, Color):
+        return value.original()
+    if isinstance(value, UUID):
+        return value.bytes
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f'cannot serialize {type(value).__name__!r} objects')  # noqa: TRY003
+
+
+def _pack(value: Any) -> Any:
+    # What msgspec does with _pack_value, for pickle.
+    if value is None or type(value) in {str, int, float, bool, bytes, datetime.datetime}:
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_pack(item) for item in value]
+    if type(value) is dict:
+        return {key: _pack(item) for key, item in value.items()}
+    return _pack(_pack_value(value))
+
+
+@functools.cache
+def _encoder() -> Any:
+    # Built on first use, which imports msgspec.
+    return utils._msgspec.msgpack.Encoder(enc_hook=_pack_value, uuid_format='bytes')
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize models, or lists and dicts of them, into compact bytes, e.g. to hand them to other processes.
+
+    The payload is MessagePack when msgspec is installed, a pickle of the same plain values otherwise.
+    Lazy fields are resolved, compact fields stay compact.
+
+    Parameters
+    ----------
+    obj : Any
+        The models to serialize.
+
+    Returns:
+    -------
+    bytes
+        The payload, read back by :func:`loads`.
+    """
+    if utils._msgspec is None:
+        return _PICKLE + pickle.dumps(_pack(obj), protocol=pickle.HIGHEST_PROTOCOL)
+    payload: bytes = _encoder().encode(obj)
+    return _MSGPACK + payload
+
+
+# unpacking
+#
+# The packed values are turned back into models by pydantic-core, with a schema that only converts
+# what was packed: the fields are trusted and every other value is stored as it is.
+
+_ANY: Final[CoreSchema] = core_schema.any_schema()
+
+
+def _localized(value: Any) -> LocalizedField:
+    return tuple.__new__(LocalizedField, value)
+
+
+# The schemas of the types packed as plain values, which turn them back into their type.
+_SCALAR_SCHEMAS: Final[dict[Any, CoreSchema]] = {
+    LocalizedField: core_schema.no_info_plain_validator_function(_localized),
+    UUID: core_schema.uuid_schema(),
+    # msgspec packs naive datetimes as ISO 8601 strings.
+    datetime.datetime: core_schema.datetime_schema(),
+    Color: core_schema.no_info_plain_validator_function(Color),
+}
+
+_SCHEMAS: dict[Any, CoreSchema] = {}
+
+
+def _schema(annotation: Any) -> CoreSchema:
+    try:
+        return _SCHEMAS[annotation]
+    except KeyError:
+        schema = _SCHEMAS[annotation] = _build_schema(annotation)
+        return schema
+
+
+def _build_schema(annotation: Any) -> CoreSchema:
+    origin = get_origin(annotation)
+    if origin is list:
+        item = _schema(get_args(annotation)[0])
+        return _ANY if item is _ANY else core_schema.list_schema(item)
+    if origin is Union or origin is types.UnionType:
+        return _union_schema(get_args(annotation))
+    if not isinstance(annotation, type):
+        return _ANY
+    if issubclass(annotation, PydanticBaseModel):
+        return _model_schema(annotation)
+    if issubclass(annotation, enum.Enum):
+        sub_type: Literal['str', 'int'] | None = (
+            'str' if issubclass(annotation, str) else 'int' if issubclass(annotation, int) else None
+        )
+        return core_schema.enum_schema(annotation, list(annotation.__members__.values()), sub_type=sub_type)
+    return _SCALAR_SCHEMAS.get(annotation, _ANY)
+
+
+def _union_schema(options: tuple[Any, ...]) -> CoreSchema:
+    # The models only mix one type with None and with str, which are stored as they are.
+    schemas = [schema for option in options if (schema := _schema(option)) is not _ANY]
+    if not schemas:
+        return _ANY
+    if len(schemas) > 1:
+        raise TypeError(f'cannot unpack {" | ".join(map(repr, options))}')  # noqa: TRY003
+    (schema,) = schemas
+    if str in options:
+        schema = core_schema.union_schema([core_schema.str_schema(strict=True), schema], mode='left_to_right')
+    if type(None) in options:
+        schema = core_schema.nullable_schema(schema)
+    return schema
+
+
+def _model_schema(model: type[PydanticBaseModel]) -> CoreSchema:
+    # The payload may hold compact fields, stored as they were packed.
+    _expand_on_access(model)
+    keys = _keys(model)
+    fields = {name: _schema(field.annotation) for name, field in model.__pydantic_fields__.items()}
+    extra: Literal['allow', 'ignore'] = 'allow' if model.model_config.get('extra') == 'allow' else 'ignore'
+    schema = core_schema.model_schema(
+        model,
+        core_schema.model_fields_schema(
+            {name: core_schema.model_field(schema, validation_alias=keys[name]) for name, schema in fields.items()},
+            extra_behavior=extra,
+        ),
+        extra_behavior=extra,
+    )
+    # By key rather than by name.
+    fields = {keys[name]: schema for name, schema in fields.items()}
+    partial = functools.partial(_unpack_partial, model, fields)
+    # Both are packed as dicts, the partial models within a list.
+    return core_schema.union_schema(
+        [schema, core_schema.no_info_plain_validator_function(partial)],
+        mode='left_to_right',
+    )
+
+
+def _unpack_partial(model: type[PydanticBaseModel], fields: dict[str, CoreSchema], value: Any) -> Any:
+    (packed,) = value
+    names = dict(zip(_keys(model).values(), model.__pydantic_fields__, strict=True))
+    values = {
+        names[key]: item if fields[key] is _ANY else _validator(fields[key]).validate_python(item)
+        for key, item in packed.items()
+    }
+
+    instance = model.__new__(model)
+    _object_setattr(instance, '__dict__', values)
+    _object_setattr(instance, '__pydantic_fields_set__', set(values))
+    _object_setattr(instance, '__pydantic_extra__', None)
+    _object_setattr(instance, '__pydantic_private__', None)
+    return instance
+
+
+_VALIDATORS: dict[int, SchemaValidator] = {}
+
+
+def _validator(schema: CoreSchema) -> SchemaValidator:
+    # Keyed by the identity of the schema, which is cached by _schema.
+    try:
+        return _VALIDATORS[id(schema)]
+    except KeyError:
+        validator = _VALIDATORS[id(schema)] = _schema_validator(schema)
+        return validator
+
+
+def loads(tp: type[T], data: bytes) -> T:
+    """
+    Deserialize the payload of :func:`dumps` without validating it.
+
+    Parameters
+    ----------
+    tp : type[T]
+        The type that was serialized, a model or e.g. ``list[Agent]``.
+    data : bytes
+        The payload.
+
+    Returns:
+    -------
+    T
+        Models equal to the serialized ones.
+
+    Raises:
+    ------
+    ValueError
+        If the payload was not written by :func:`dumps`, or needs msgspec to be read.
+    """
+    codec, payload = data[:1], memoryview(data)[1:]
+    if codec == _MSGPACK:
+        if utils._msgspec is None:  # pragma: no cover
+            raise ValueError('reading this payload requires msgspec')  # noqa: TRY003
+        value = utils._msgspec.msgpack.decode(payload)
+    elif codec == _PICKLE:
+        value = pickle.loads(payload)  # noqa: S301
+    else:
+        raise ValueError('not a payload written by dumps()')  # noqa: TRY003
+
+    schema = _schema(tp)
+    unpacked: T = value if schema is _ANY else _validator(schema).validate_python(value)
+    return unpacked
@@ -29,7 +29,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact, Lazy
 from .localization import LocalizedField
 
 __all__ = (
@@ -46,8 +46,8 @@ class Level(BaseUUIDModel):
     # uuid: str
     spray_level: int = Field(alias='sprayLevel')
     display_name: str | LocalizedField = Field(alias='displayName')
-    display_icon: str | None = Field(alias='displayIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
 
 class Spray(BaseUUIDModel):
@@ -57,13 +57,13 @@ class Spray(BaseUUIDModel):
     theme_uuid: UUID | None = Field(alias='themeUuid')
     is_null_spray: bool = Field(alias='isNullSpray')
     hide_if_not_owned: bool = Field(alias='hideIfNotOwned')
-    display_icon: str | None = Field(alias='displayIcon')
-    full_icon: str | None = Field(alias='fullIcon')
-    full_transparent_icon: str | None = Field(alias='fullTransparentIcon')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    full_icon: Compact[str | None] = Field(alias='fullIcon')
+    full_transparent_icon: Compact[str | None] = Field(alias='fullTransparentIcon')
     animation_png: str | None = Field(alias='animationPng')
     animation_gif: str | None = Field(alias='animationGif')
-    asset_path: str = Field(alias='assetPath')
-    levels: list[Level]
+    asset_path: Compact[str] = Field(alias='assetPath')
+    levels: Lazy[list[Level]]
 
     # useful methods
 
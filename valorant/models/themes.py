@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from pydantic import Field
 
-from .base import BaseUUIDModel
+from .base import BaseUUIDModel, Compact
 from .localization import LocalizedField
 
 __all__ = ('Theme',)
@@ -33,6 +33,6 @@ __all__ = ('Theme',)
 class Theme(BaseUUIDModel):
     # uuid: str
     display_name: str | LocalizedField = Field(alias='displayName')
-    display_icon: str | None = Field(alias='displayIcon')
-    store_featured_image: str | None = Field(alias='storeFeaturedImage')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    store_featured_image: Compact[str | None] = Field(alias='storeFeaturedImage')
+    asset_path: Compact[str] = Field(alias='assetPath')
@@ -30,7 +30,7 @@ from uuid import UUID
 from pydantic import Field
 
 from ..enums import ShopCategory, WeaponCategory
-from .base import BaseModel, BaseUUIDModel
+from .base import BaseModel, BaseUUIDModel, Compact, Lazy
 from .localization import LocalizedField  # Changed from language to localization
 
 __all__ = (
@@ -106,29 +106,29 @@ class ShopData(BaseModel):
     category_text: str | LocalizedField = Field(alias='categoryText')
     grid_position: GridPosition | None = Field(alias='gridPosition')
     can_be_trashed: bool = Field(alias='canBeTrashed')
-    image: str | None
-    new_image: str = Field(alias='newImage')
-    new_image2: str | None = Field(alias='newImage2')
-    asset_path: str = Field(alias='assetPath')
+    image: Compact[str | None]
+    new_image: Compact[str] = Field(alias='newImage')
+    new_image2: Compact[str | None] = Field(alias='newImage2')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
 
 class Chroma(BaseUUIDModel):
     # uuid: str
     display_name: str | LocalizedField = Field(alias='displayName')
-    display_icon: str | None = Field(alias='displayIcon')
-    full_render: str = Field(alias='fullRender')
-    swatch: str | None
-    streamed_video: str | None = Field(alias='streamedVideo')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    full_render: Compact[str] = Field(alias='fullRender')
+    swatch: Compact[str | None]
+    streamed_video: Compact[str | None] = Field(alias='streamedVideo')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
 
 class Level(BaseUUIDModel):
     # uuid: str
     display_name: str | LocalizedField = Field(alias='displayName')
     level_item: str | None = Field(alias='levelItem')
-    display_icon: str | None = Field(alias='displayIcon')
-    streamed_video: str | None = Field(alias='streamedVideo')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    streamed_video: Compact[str | None] = Field(alias='streamedVideo')
+    asset_path: Compact[str] = Field(alias='assetPath')
 
 
 class Skin(BaseUUIDModel):
@@ -136,11 +136,11 @@ class Skin(BaseUUIDModel):
     display_name: str | LocalizedField = Field(alias='displayName')
     theme_uuid: UUID = Field(alias='themeUuid')
     content_tier_uuid: UUID | None = Field(alias='contentTierUuid')
-    display_icon: str | None = Field(alias='displayIcon')
-    wallpaper: str | None
-    asset_path: str = Field(alias='assetPath')
-    chromas: list[Chroma]
-    levels: list[Level]
+    display_icon: Compact[str | None] = Field(alias='displayIcon')
+    wallpaper: Compact[str | None]
+    asset_path: Compact[str] = Field(alias='assetPath')
+    chromas: Lazy[list[Chroma]]
+    levels: Lazy[list[Level]]
 
     # useful methods
 
@@ -158,9 +158,9 @@ class Weapon(BaseUUIDModel):
     display_name: str | LocalizedField = Field(alias='displayName')
     category: WeaponCategory
     default_skin_uuid: str = Field(alias='defaultSkinUuid')
-    display_icon: str = Field(alias='displayIcon')
-    kill_stream_icon: str = Field(alias='killStreamIcon')
-    asset_path: str = Field(alias='assetPath')
+    display_icon: Compact[str] = Field(alias='displayIcon')
+    kill_stream_icon: Compact[str] = Field(alias='killStreamIcon')
+    asset_path: Compact[str] = Field(alias='assetPath')
     weapon_stats: WeaponStats | None = Field(alias='weaponStats')
     shop_data: ShopData | None = Field(alias='shopData')
-    skins: list[Skin]
+    skins: Lazy[list[Skin]]
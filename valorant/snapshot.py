@@ -0,0 +1,375 @@
+"""
+The MIT License (MIT).
+
+Copyright (c) 2023-present STACiA
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import time
+import uuid as uuid_
+from itertools import starmap
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+from . import utils
+from .cache import DEFAULT_LANGUAGE, _compress, _decompress, _default_compression
+from .errors import NotFound, SnapshotError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from typing_extensions import Self
+
+    from .cache import Compression
+    from .http import Route
+
+__all__ = (
+    'Snapshot',
+    'SnapshotEntry',
+    'SnapshotIndex',
+)
+
+SNAPSHOT_MAGIC: Final[bytes] = b'VALOSNAP'
+# Bump this whenever the file layout changes. Files written by a version missing from
+# _READABLE_VERSIONS are rejected with SnapshotError.
+SNAPSHOT_VERSION: Final[int] = 2
+_READABLE_VERSIONS: Final[frozenset[int]] = frozenset({1, 2})
+
+# magic, format version, compression, header length
+_PREAMBLE: Final[struct.Struct] = struct.Struct('<8sHBxI')
+_CODECS: Final[tuple[Compression, ...]] = ('identity', 'zlib', 'zstd')
+# uuid bytes, record offset, record length
+_INDEX_ITEM: Final[struct.Struct] = struct.Struct('<16sQI')
+
+_LIST_PREFIX: Final[bytes] = b'{"status":200,"data":['
+_LIST_SUFFIX: Final[bytes] = b']}'
+
+
+class SnapshotEntry(NamedTuple):
+    """One stored response body. ``offset`` is relative to the start of the body section."""
+
+    endpoint: str
+    language: str
+    offset: int
+    length: int
+    size: int
+
+
+class SnapshotIndex(NamedTuple):
+    """The records of one list endpoint in an indexed snapshot.
+
+    The records are stored uncompressed in the original list order, separated by commas, so the
+    list body is the ``length`` bytes at ``offset`` wrapped in the response envelope. ``index_offset``
+    points at ``items`` fixed-width items sorted by uuid. All offsets are relative to the start of the
+    body section.
+    """
+
+    endpoint: str
+    language: str
+    offset: int
+    length: int
+    index_offset: int
+    items: int
+
+
+def _uuid_bytes(value: str) -> bytes | None:
+    try:
+        return uuid_.UUID(value).bytes
+    except ValueError:
+        return None
+
+
+def _encode_records(items: list[Any], offset: int) -> tuple[bytes, bytes, int]:
+    # Returns the comma separated records, the sorted uuid index and the number of indexed records.
+    records = [json.dumps(item, separators=(',', ':'), ensure_ascii=False).encode() for item in items]
+    keys: list[tuple[bytes, int, int]] = []
+    for item, record in zip(items, records, strict=True):
+        key = _uuid_bytes(item['uuid']) if isinstance(item, dict) and 'uuid' in item else None
+        if key is not None:
+            keys.append((key, offset, len(record)))
+        offset += len(record) + 1  # the separating comma
+    return b','.join(records), b''.join(starmap(_INDEX_ITEM.pack, sorted(keys))), len(keys)
+
+
+class Snapshot:
+    """A read-only catalog of raw list responses, tagged with the ``/version`` manifest.
+
+    The file is a fixed preamble, a JSON header listing the entries and the stored bodies, and is
+    memory-mapped rather than read. Single entity routes such as ``/weapons/skinlevels/{uuid}`` are
+    answered from the list of their parent route.
+
+    A snapshot written with ``indexed=True`` stores every list as uncompressed records plus a uuid
+    index sorted per endpoint. A single entity lookup is then a binary search over the mapped index and
+    decoding one record, and nothing is kept on the heap, so processes sharing the file share its pages.
+    Otherwise bodies are compressed and decoded (and kept) the first time they are requested.
+
+    Attributes:
+    ----------
+    manifest: :class:`str`
+        The manifest id of the game version the catalog was exported from.
+    created_at: :class:`float`
+        When the snapshot was written, as a Unix timestamp.
+    compression: :class:`str`
+        The compression of the stored bodies.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        data: bytes | mmap.mmap,
+        *,
+        manifest: str,
+        created_at: float,
+        compression: Compression,
+        entries: list[SnapshotEntry],
+        indexes: list[SnapshotIndex] | None = None,
+        offset: int = 0,
+    ) -> None:
+        self.manifest: str = manifest
+        self.created_at: float = created_at
+        self.compression: Compression = compression
+        self._data: bytes | mmap.mmap = data
+        self._offset: int = offset
+        # Keyed by the requested language, entries stored without one hold the default language.
+        self._entries: dict[tuple[str, str], SnapshotEntry] = {
+            (entry.endpoint, entry.language or DEFAULT_LANGUAGE): entry for entry in entries
+        }
+        self._record_indexes: dict[tuple[str, str], SnapshotIndex] = {
+            (index.endpoint, index.language or DEFAULT_LANGUAGE): index for index in indexes or ()
+        }
+        self._decoded: dict[tuple[str, str], Any] = {}
+        self._indexes: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f'<Snapshot manifest={self.manifest!r} entries={len(self)}>'
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._record_indexes)
+
+    @property
+    def entries(self) -> list[SnapshotEntry | SnapshotIndex]:
+        return [*self._entries.values(), *self._record_indexes.values()]
+
+    @property
+    def indexed(self) -> bool:
+        return bool(self._record_indexes)
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @classmethod
+    def load(cls, path: str | Path) -> Snapshot:
+        """
+        Map a snapshot file written by :meth:`write`.
+
+        Raises:
+        ------
+        SnapshotError
+            The file is not a snapshot or was written by an incompatible version.
+        """
+        with Path(path).open('rb') as file:
+            preamble = file.read(_PREAMBLE.size)
+            if len(preamble) < _PREAMBLE.size:
+                raise SnapshotError(f'{path} is not a valorant snapshot')  # noqa: TRY003
+
+            magic, version, codec, header_length = _PREAMBLE.unpack(preamble)
+            if magic != SNAPSHOT_MAGIC:
+                raise SnapshotError(f'{path} is not a valorant snapshot')  # noqa: TRY003
+            if version not in _READABLE_VERSIONS:
+                raise SnapshotError(f'{path} has snapshot format {version}, expected {SNAPSHOT_VERSION}')  # noqa: TRY003
+            if codec >= len(_CODECS):
+                raise SnapshotError(f'{path} uses an unknown compression ({codec})')  # noqa: TRY003
+
+            header = json.loads(file.read(header_length))
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls(
+            data,
+            manifest=header['manifest'],
+            created_at=header['created_at'],
+            compression=_CODECS[codec],
+            entries=list(starmap(SnapshotEntry, header['entries'])),
+            indexes=list(starmap(SnapshotIndex, header.get('indexes', []))),
+            offset=_PREAMBLE.size + header_length,
+        )
+
+    @staticmethod
+    def write(
+        path: str | Path,
+        payloads: Mapping[tuple[str, str], bytes],
+        *,
+        manifest: str,
+        compression: Compression | None = None,
+        indexed: bool = False,
+    ) -> int:
+        """
+        Write raw response bodies to a snapshot file.
+
+        The file is written next to ``path`` first and then renamed, so readers never see a partial snapshot.
+
+        Parameters
+        ----------
+        path : str | Path
+            Where to write the snapshot.
+        payloads : Mapping[tuple[str, str], bytes]
+            Raw response bodies keyed by ``(endpoint, language)``, ``''`` being the API default language.
+        manifest : str
+            The manifest id the bodies belong to.
+        compression : Compression | None
+            Compression used for the bodies. Defaults to ``zstd`` when available, otherwise ``zlib``.
+            Indexed snapshots are always uncompressed.
+        indexed : bool
+            Store lists as records with a per-endpoint uuid index for memory-mapped lookups.
+
+        Returns:
+        -------
+        int
+            The size of the written file in bytes.
+        """
+        compression = 'identity' if indexed else compression or _default_compression()
+        entries: list[SnapshotEntry] = []
+        indexes: list[SnapshotIndex] = []
+        chunks: list[bytes] = []
+        offset = 0
+
+        for (endpoint, language), body in sorted(payloads.items()):
+            data = utils._from_json(body) if indexed else None
+            if data is not None and isinstance(data.get('data'), list):
+                records, index, count = _encode_records(data['data'], offset)
+                indexes.append(SnapshotIndex(endpoint, language, offset, len(records), offset + len(records), count))
+                chunks += (records, index)
+                offset += len(records) + len(index)
+                continue
+
+            compressed = _compress(body, compression)
+            entries.append(SnapshotEntry(endpoint, language, offset, len(compressed), len(body)))
+            chunks.append(compressed)
+            offset += len(compressed)
+
+        header = json.dumps(
+            {'manifest': manifest, 'created_at': time.time(), 'entries': entries, 'indexes': indexes},
+            separators=(',', ':'),
+        ).encode()
+
+        path = Path(path)
+        temp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        with temp.open('wb') as file:
+            file.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _CODECS.index(compression), len(header)))
+            file.write(header)
+            file.writelines(chunks)
+        temp.replace(path)
+        return _PREAMBLE.size + len(header) + offset
+
+    def _slice(self, offset: int, length: int) -> bytes:
+        start = self._offset + offset
+        return self._data[start : start + length]
+
+    def read(self, endpoint: str, language: str = '') -> bytes | None:
+        """Return the raw response body of a list endpoint, ``None`` when it is not in the snapshot."""
+        language = language or DEFAULT_LANGUAGE
+        index = self._record_indexes.get((endpoint, language))
+        if index is not None:
+            return _LIST_PREFIX + self._slice(index.offset, index.length) + _LIST_SUFFIX
+
+        entry = self._entries.get((endpoint, language))
+        if entry is None:
+            return None
+        return _decompress(self._slice(entry.offset, entry.length), self.compression)
+
+    def _decode(self, endpoint: str, language: str) -> Any:
+        key = (endpoint, language)
+        data = self._decoded.get(key)
+        if data is None:
+            body = self.read(endpoint, language)
+            if body is None:
+                return None
+            data = self._decoded[key] = utils._from_json(body)
+        return data
+
+    def _find(self, index: SnapshotIndex, uuid: str) -> Any:
+        key = _uuid_bytes(uuid)
+        if key is None:
+            return None
+
+        base = self._offset + index.index_offset
+        low, high = 0, index.items
+        while low < high:
+            middle = (low + high) // 2
+            position = base + middle * _INDEX_ITEM.size
+            current = self._data[position : position + 16]
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                _, offset, length = _INDEX_ITEM.unpack_from(self._data, position)
+                return utils._from_json(self._slice(offset, length))
+        return None
+
+    def lookup(self, route: Route, language: str = '') -> Any:
+        """
+        Return the response for ``route`` the way the API would, ``None`` when the snapshot does not cover it.
+
+        Raises:
+        ------
+        NotFound
+            The route is a single entity route whose list is in the snapshot but not the uuid.
+        """
+        language = language or DEFAULT_LANGUAGE
+        record_index = self._record_indexes.get((route.path, language))
+        if record_index is not None:
+            # not kept, decoding the list again is the price of not holding it on the heap
+            return utils._from_json(_LIST_PREFIX + self._slice(record_index.offset, record_index.length) + _LIST_SUFFIX)
+
+        data = self._decode(route.path, language)
+        if data is not None or not route.path.endswith('/{uuid}'):
+            return data
+
+        parent = route.path.removesuffix('/{uuid}')
+        uuid = str(route.parameters['uuid']).lower()
+        key = (parent, language)
+
+        record_index = self._record_indexes.get(key)
+        if record_index is not None:
+            item = self._find(record_index, uuid)
+        else:
+            index = self._indexes.get(key)
+            if index is None:
+                items = self._decode(parent, language)
+                if items is None:
+                    return None
+                index = self._indexes[key] = {item['uuid'].lower(): item for item in items['data']}
+            item = index.get(uuid)
+
+        if item is None:
+            raise NotFound(None, {'status': 404, 'error': f'{uuid} is not in the snapshot'}, status=404)
+        return {'status': 200, 'data': item}
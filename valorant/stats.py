@@ -0,0 +1,348 @@
+"""
+The MIT License (MIT).
+
+Copyright (c) 2023-present STACiA
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING, Any, ClassVar, Final
+
+if TYPE_CHECKING:
+    from typing import Literal, TypeAlias
+
+    Outcome: TypeAlias = Literal['hit', 'miss', 'stale', 'coalesced', 'derived', 'rejected']
+
+__all__ = (
+    'CacheCounters',
+    'CacheStats',
+    'LatencyHistogram',
+    'WriteStats',
+)
+
+# Upper bounds, in seconds, of the latency buckets. Cache hits land in the first few buckets and
+# upstream requests in the later ones.
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+class LatencyHistogram:
+    """A fixed bucket latency histogram.
+
+    Attributes:
+    ----------
+    buckets: list[:class:`int`]
+        The number of observations per bucket of :data:`LATENCY_BUCKETS`, with one extra bucket
+        for everything slower than the last bound.
+    count: :class:`int`
+        The number of observations.
+    total: :class:`float`
+        The sum of all observations in seconds.
+    """
+
+    __slots__ = ('buckets', 'count', 'total')
+
+    bounds: ClassVar[tuple[float, ...]] = LATENCY_BUCKETS
+
+    def __init__(self) -> None:
+        self.buckets: list[int] = [0] * (len(self.bounds) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+
+    def __repr__(self) -> str:
+        return f'<LatencyHistogram count={self.count} mean={self.mean:.6f}>'
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for index, value in enumerate(other.buckets):
+            self.buckets[index] += value
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket holding the given percentile, ``inf`` past the last bound."""
+        if not self.count:
+            return 0.0
+
+        rank = self.count * percent / 100
+        seen = 0
+        for bound, value in zip(self.bounds, self.buckets, strict=False):
+            seen += value
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def to_dict(self) -> dict[str, Any]:
+        buckets = {f'le_{bound:g}': value for bound, value in zip(self.bounds, self.buckets, strict=False)}
+        buckets['le_inf'] = self.buckets[-1]
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'buckets': buckets,
+        }
+
+
+class CacheCounters:
+    """Cache counters for one route, one language or the whole cache.
+
+    Attributes:
+    ----------
+    hits: :class:`int`
+        Requests answered from a fresh cache entry.
+    misses: :class:`int`
+        Requests sent upstream.
+    stale: :class:`int`
+        Requests answered from an expired entry because the upstream request failed.
+    coalesced: :class:`int`
+        Requests that joined an identical request already in flight instead of sending their own.
+    derived: :class:`int`
+        Requests answered from a cached parent list that contains the entity, e.g. a skin level
+        found inside the cached ``/weapons`` list.
+    rejected: :class:`int`
+        Requests for unknown uuids answered with :exc:`~valorant.errors.NotFound` by the uuid filter
+        of a loaded list, without going upstream.
+    normalized: :class:`int`
+        Requests whose cache key was changed by normalization, i.e. that share an entry with an
+        equivalent request spelled differently.
+    entries: :class:`int`
+        The number of stored entries.
+    size: :class:`int`
+        The uncompressed size of the stored bodies in bytes.
+    stored_size: :class:`int`
+        The size of the stored bodies on disk in bytes.
+    hit_latency: :class:`LatencyHistogram`
+        Latencies of cache hits, coalesced, derived and rejected requests.
+    miss_latency: :class:`LatencyHistogram`
+        Latencies of misses and stale serves, including the upstream request.
+    """
+
+    __slots__ = (
+        'coalesced',
+        'derived',
+        'entries',
+        'hit_latency',
+        'hits',
+        'miss_latency',
+        'misses',
+        'normalized',
+        'rejected',
+        'size',
+        'stale',
+        'stored_size',
+    )
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stale: int = 0
+        self.coalesced: int = 0
+        self.derived: int = 0
+        self.rejected: int = 0
+        self.normalized: int = 0
+        self.entries: int = 0
+        self.size: int = 0
+        self.stored_size: int = 0
+        self.hit_latency: LatencyHistogram = LatencyHistogram()
+        self.miss_latency: LatencyHistogram = LatencyHistogram()
+
+    def __repr__(self) -> str:
+        return (
+            f'<CacheCounters hits={self.hits} misses={self.misses} stale={self.stale} '
+            f'entries={self.entries} stored_size={self.stored_size}>'
+        )
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses + self.stale + self.coalesced + self.derived + self.rejected
+
+    @property
+    def hit_ratio(self) -> float:
+        """The share of requests that did not go upstream."""
+        return (self.requests - self.misses) / self.requests if self.requests else 0.0
+
+    @property
+    def dedup_rate(self) -> float:
+        """The share of requests deduplicated by key normalization or by joining a request in flight."""
+        return (self.normalized + self.coalesced) / self.requests if self.requests else 0.0
+
+    def record(self, outcome: Outcome, seconds: float, *, normalized: bool = False) -> None:
+        if outcome == 'hit':
+            self.hits += 1
+        elif outcome == 'coalesced':
+            self.coalesced += 1
+        elif outcome == 'derived':
+            self.derived += 1
+        elif outcome == 'rejected':
+            self.rejected += 1
+        elif outcome == 'stale':
+            self.stale += 1
+        else:
+            self.misses += 1
+        self.normalized += normalized
+
+        latency = self.miss_latency if outcome in {'miss', 'stale'} else self.hit_latency
+        latency.observe(seconds)
+
+    def merge(self, other: CacheCounters) -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.stale += other.stale
+        self.coalesced += other.coalesced
+        self.derived += other.derived
+        self.rejected += other.rejected
+        self.normalized += other.normalized
+        self.entries += other.entries
+        self.size += other.size
+        self.stored_size += other.stored_size
+        self.hit_latency.merge(other.hit_latency)
+        self.miss_latency.merge(other.miss_latency)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'coalesced': self.coalesced,
+            'derived': self.derived,
+            'rejected': self.rejected,
+            'normalized': self.normalized,
+            'hit_ratio': self.hit_ratio,
+            'dedup_rate': self.dedup_rate,
+            'entries': self.entries,
+            'size': self.size,
+            'stored_size': self.stored_size,
+            'hit_latency': self.hit_latency.to_dict(),
+            'miss_latency': self.miss_latency.to_dict(),
+        }
+
+
+class WriteStats:
+    """Counters of the write-behind queue of a :class:`~valorant.cache.SQLiteCache`.
+
+    Attributes:
+    ----------
+    pending: :class:`int`
+        Entries waiting to be written.
+    max_pending: :class:`int`
+        The most entries that were ever waiting at once.
+    flushes: :class:`int`
+        The number of batched transactions written.
+    flushed: :class:`int`
+        The number of entries written by those transactions.
+    flush_latency: :class:`LatencyHistogram`
+        How long each flush took, including the compression of its entries.
+    """
+
+    __slots__ = ('flush_latency', 'flushed', 'flushes', 'max_pending', 'pending')
+
+    def __init__(self) -> None:
+        self.pending: int = 0
+        self.max_pending: int = 0
+        self.flushes: int = 0
+        self.flushed: int = 0
+        self.flush_latency: LatencyHistogram = LatencyHistogram()
+
+    def __repr__(self) -> str:
+        return f'<WriteStats pending={self.pending} flushes={self.flushes} flushed={self.flushed}>'
+
+    def merge(self, other: WriteStats) -> None:
+        self.pending += other.pending
+        self.max_pending = max(self.max_pending, other.max_pending)
+        self.flushes += other.flushes
+        self.flushed += other.flushed
+        self.flush_latency.merge(other.flush_latency)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'pending': self.pending,
+            'max_pending': self.max_pending,
+            'flushes': self.flushes,
+            'flushed': self.flushed,
+            'flush_latency': self.flush_latency.to_dict(),
+        }
+
+
+class CacheStats:
+    """A snapshot of the cache counters grouped by route and by language.
+
+    Routes are the route templates (e.g. ``/weapons/skinlevels/{uuid}``). Requests sent without
+    a language are grouped under the empty string.
+
+    Attributes:
+    ----------
+    routes: dict[:class:`str`, :class:`CacheCounters`]
+        Counters per route.
+    languages: dict[:class:`str`, :class:`CacheCounters`]
+        Counters per language.
+    total: :class:`CacheCounters`
+        Counters for the whole cache.
+    writes: :class:`WriteStats`
+        Counters of the write-behind queue, all zero unless it is enabled.
+    """
+
+    __slots__ = ('languages', 'routes', 'total', 'writes')
+
+    def __init__(self) -> None:
+        self.routes: dict[str, CacheCounters] = {}
+        self.languages: dict[str, CacheCounters] = {}
+        self.total: CacheCounters = CacheCounters()
+        self.writes: WriteStats = WriteStats()
+
+    def __repr__(self) -> str:
+        return f'<CacheStats routes={len(self.routes)} languages={len(self.languages)} total={self.total!r}>'
+
+    def add(self, route: str, language: str, counters: CacheCounters) -> None:
+        """Merge ``counters`` into the route, language and total groups."""
+        for group, name in ((self.routes, route), (self.languages, language)):
+            group.setdefault(name, CacheCounters()).merge(counters)
+        self.total.merge(counters)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'routes': {route: counters.to_dict() for route, counters in sorted(self.routes.items())},
+            'languages': {language: counters.to_dict() for language, counters in sorted(self.languages.items())},
+            'total': self.total.to_dict(),
+            'writes': self.writes.to_dict(),
+        }
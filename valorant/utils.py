@@ -1,14 +1,10 @@
+import importlib.util
 import json
 import os
 import shutil
+import sys
 from pathlib import Path
-from typing import Final
-
-try:
-    import msgspec
-except ImportError:  # pragma: no cover
-    msgspec = None
-
+from typing import Any, Final
 
 __all__ = (
     'create_cache_folder',
@@ -17,7 +13,95 @@ __all__ = (
     'remove_cache_folder',
 )
 
-_from_json = json.loads if msgspec is None else msgspec.json.decode
+# lazy imports
+
+
+class _LazyModule:
+    """Stands for a module until the first access to one of its attributes, which imports it.
+
+    Unlike :class:`importlib.util.LazyLoader`, nothing is added to :data:`sys.modules` before that
+    access, so tools walking the imported modules do not import it by accident.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        module = sys.modules.get(self._name) or importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        return f'<lazy module {self._name!r}>'
+
+
+def _lazy_import(name: str) -> Any:
+    """Return a stand-in importing the module on first use, or None if the module is not installed."""
+    if importlib.util.find_spec(name) is None:
+        return None
+    return _LazyModule(name)
+
+
+# json
+
+_msgspec = _lazy_import('msgspec')
+
+
+def _from_json(data: bytes | str) -> Any:
+    if _msgspec is None:  # pragma: no cover
+        return json.loads(data)
+    return _msgspec.json.decode(data)
+
+
+# Longer strings are mostly unique URLs and asset paths, not worth a slot in the intern table.
+_INTERN_MAX_LENGTH: Final[int] = 64
+
+
+def _intern_strings(data: Any) -> Any:
+    """Replace the short strings of decoded JSON with their interned copy, in place.
+
+    Repeated values such as categories, rarities and referenced uuids then share one object
+    across every payload instead of one per occurrence.
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        items = obj.items() if isinstance(obj, dict) else enumerate(obj)
+        for key, value in items:
+            if type(value) is str:
+                # The own uuid of an entity is unique, interning it would only grow the intern table.
+                if len(value) <= _INTERN_MAX_LENGTH and key != 'uuid':
+                    obj[key] = sys.intern(value)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return data
+
+
+def _copy_json(data: Any) -> Any:
+    """Return a deep copy of decoded JSON, faster than :func:`copy.deepcopy` as it only knows dicts and lists."""
+    if type(data) is dict:
+        return {key: _copy_json(value) for key, value in data.items()}
+    if type(data) is list:
+        return [_copy_json(value) for value in data]
+    return data
+
+
+def _sizeof(obj: Any) -> int:
+    """Approximate the memory held by decoded JSON, shared objects are counted once."""
+    seen: set[int] = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return size
 
 
 # pytest detection